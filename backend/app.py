@@ -1,7 +1,7 @@
 import os
 import logging
 import click
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, jsonify
 from flask_smorest import Api
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
@@ -21,8 +21,18 @@ from resources.schedule import blp as ScheduleBlueprint
 from resources.availability import blp as AvailabilityBlueprint 
 from resources.notification import blp as NotificationBlueprint
 from resources.payment import blp as PaymentBlueprint
-from utils.scheduler import init_scheduler
+from resources.media import blp as MediaUploadBlueprint
+from utils.scheduler import init_scheduler, run_worker
 from utils.initials import generate_unique_initials
+from utils.course_search import rebuild_course_search_index
+from utils.ratings import recompute_course_ratings
+from utils.notifications import rebuild_meeting_reminder_index, sync_meeting_reminders_for_user
+from utils.admin_roster import admin_roster_stats, invalidate_admin_roster
+from utils.response_cache import get_response_cache, init_response_cache
+from utils.metrics import gauge_snapshot, timing_snapshot
+from utils.media_serving import send_local_media
+from utils.media_objects import collect_unreferenced_media
+from utils.media_upload import MediaUploadService
 from utils.security import hash_password
 
 def _configure_logging(app):
@@ -48,6 +58,19 @@ def _configure_logging(app):
     app.logger.info("Logging configured", extra={"log_level": level_name})
 
 
+def _apply_deprecated_settings(app):
+    """Honour renamed settings that existing deployments may still set, with a warning."""
+    retry_interval = os.getenv("EMAIL_RETRY_INTERVAL_SECONDS")
+    if retry_interval is None:
+        return
+    if os.getenv("EMAIL_IDLE_POLL_SECONDS") is None:
+        app.config["EMAIL_IDLE_POLL_SECONDS"] = int(retry_interval)
+    app.logger.warning(
+        "EMAIL_RETRY_INTERVAL_SECONDS is deprecated; set EMAIL_IDLE_POLL_SECONDS instead",
+        extra={"email_idle_poll_seconds": app.config["EMAIL_IDLE_POLL_SECONDS"]},
+    )
+
+
 def create_app(db_url=None):
     app = Flask(__name__)
 
@@ -55,6 +78,7 @@ def create_app(db_url=None):
     config_class = ProductionConfig if env == "production" else DevelopmentConfig
     app.config.from_object(config_class)
     _configure_logging(app)
+    _apply_deprecated_settings(app)
 
     if db_url:
         app.config["SQLALCHEMY_DATABASE_URI"] = db_url
@@ -70,6 +94,7 @@ def create_app(db_url=None):
         methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     )
 
+    init_response_cache(app)
     init_scheduler(app)
 
     #JWTManager(app)
@@ -137,17 +162,24 @@ def create_app(db_url=None):
 
     @app.get("/media/<path:filename>")
     def serve_local_media(filename):
-        upload_dir = app.config.get("MEDIA_LOCAL_UPLOAD_DIR", "uploads")
-        if not os.path.isabs(upload_dir):
-            upload_dir = os.path.join(app.root_path, upload_dir)
-
-        return send_from_directory(upload_dir, filename)
+        return send_local_media(filename)
 
     @app.get("/health")
     def health_check():
         # Keep this endpoint lightweight and DB-independent for platform readiness probes.
         return jsonify({"status": "ok"}), 200
 
+    @app.get("/health/metrics")
+    def health_metrics():
+        # Process-local counters for monitoring; no database access.
+        response_cache = get_response_cache()
+        return jsonify({
+            "response_cache": response_cache.stats() if response_cache else None,
+            "media": timing_snapshot("media."),
+            "email_lanes": gauge_snapshot("email.lane."),
+            "admin_roster": admin_roster_stats(),
+            "scheduler": gauge_snapshot("scheduler."),
+        }), 200
 
     api.register_blueprint(UserBlueprint)
     api.register_blueprint(ReviewBlueprint)
@@ -157,6 +189,7 @@ def create_app(db_url=None):
     api.register_blueprint(AvailabilityBlueprint)
     api.register_blueprint(NotificationBlueprint)
     api.register_blueprint(PaymentBlueprint)
+    api.register_blueprint(MediaUploadBlueprint)
 
     @app.cli.command("seed-admin")
     @click.option(
@@ -238,7 +271,9 @@ def create_app(db_url=None):
                     existing_user.password = hash_password(password)
 
                 db.session.add(existing_user)
+                sync_meeting_reminders_for_user(existing_user)
                 db.session.commit()
+                invalidate_admin_roster()
 
                 click.echo("Admin user updated successfully.")
                 return
@@ -259,11 +294,89 @@ def create_app(db_url=None):
             admin_user.role = "admin"
 
             db.session.add(admin_user)
+            sync_meeting_reminders_for_user(admin_user)
             db.session.commit()
+            invalidate_admin_roster()
 
             click.echo("Admin user created successfully.")
         except SQLAlchemyError as exc:
             db.session.rollback()
             raise click.ClickException("Failed to seed admin user.") from exc
 
+    @app.cli.command("repair-course-ratings")
+    @click.option(
+        "--course-id",
+        "course_ids",
+        type=int,
+        multiple=True,
+        help="Only repair the given course id (repeatable). Defaults to all courses.",
+    )
+    def repair_course_ratings(course_ids):
+        """Backfill or repair denormalized course rating aggregates from reviews."""
+        try:
+            changed_count = recompute_course_ratings(course_ids or None)
+            db.session.commit()
+        except SQLAlchemyError as exc:
+            db.session.rollback()
+            raise click.ClickException("Failed to repair course ratings.") from exc
+
+        click.echo(f"Course rating aggregates repaired: {changed_count} course(s) updated.")
+
+    @app.cli.command("rebuild-course-search")
+    def rebuild_course_search():
+        """Create the course full-text search index if missing and repopulate it."""
+        try:
+            indexed_count = rebuild_course_search_index()
+            db.session.commit()
+        except (SQLAlchemyError, RuntimeError) as exc:
+            db.session.rollback()
+            raise click.ClickException(f"Failed to rebuild course search index: {exc}") from exc
+
+        click.echo(f"Course search index rebuilt: {indexed_count} course(s) indexed.")
+
+    @app.cli.command("rebuild-meeting-reminders")
+    def rebuild_meeting_reminders():
+        """Recompute the meeting reminder due index from upcoming schedules and settings."""
+        try:
+            changed_count = rebuild_meeting_reminder_index()
+            db.session.commit()
+        except SQLAlchemyError as exc:
+            db.session.rollback()
+            raise click.ClickException(f"Failed to rebuild meeting reminders: {exc}") from exc
+
+        click.echo(f"Meeting reminder index rebuilt: {changed_count} row(s) written or removed.")
+
+    @app.cli.command("worker")
+    def worker():
+        """Run the email, reminder and background jobs in this process until stopped."""
+        if not app.config.get("EMAIL_SCHEDULER_ENABLED", True):
+            raise click.ClickException("Background jobs are disabled (EMAIL_SCHEDULER_ENABLED=false).")
+        click.echo("Scheduler worker running. Press Ctrl+C to stop.")
+        run_worker(app)
+
+    @app.cli.command("gc-media")
+    @click.option(
+        "--grace-seconds",
+        type=int,
+        default=None,
+        help="Only delete objects unreferenced for at least this long. Defaults to MEDIA_GC_GRACE_SECONDS.",
+    )
+    @click.option("--dry-run", is_flag=True, help="List collectable objects without deleting them.")
+    def gc_media(grace_seconds, dry_run):
+        """Delete stored media that no course references any more."""
+        try:
+            collected = collect_unreferenced_media(
+                MediaUploadService.from_app(app),
+                grace_seconds=grace_seconds,
+                dry_run=dry_run,
+            )
+        except (SQLAlchemyError, RuntimeError) as exc:
+            db.session.rollback()
+            raise click.ClickException(f"Failed to collect unreferenced media: {exc}") from exc
+
+        for storage_key in collected:
+            click.echo(storage_key)
+        verb = "would be deleted" if dry_run else "deleted"
+        click.echo(f"Unreferenced media {verb}: {len(collected)} object(s).")
+
     return app
@@ -0,0 +1,105 @@
+"""Benchmark catalog search latency: ILIKE scan vs. the full-text index.
+
+Seeds a throwaway SQLite database with synthetic courses and times
+``GET /courses/?search=...`` through the Flask test client for each backend.
+
+Usage (from backend/):
+    python benchmarks/course_search_benchmark.py --sizes 10000 100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("EMAIL_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from db import db  # noqa: E402
+from models import Course  # noqa: E402
+from utils.course_search import rebuild_course_search_index, reset_course_search_backend  # noqa: E402
+
+WORDS = (
+    "python data design pottery watercolour finance leadership yoga guitar baking "
+    "statistics marketing writing photography negotiation chemistry history spanish"
+).split()
+SEARCH_TERMS = ("python", "pott", "leadership yoga", "chem")
+
+
+def _seed(course_count: int) -> None:
+    rng = random.Random(42)
+    rows = []
+    for index in range(course_count):
+        title_words = rng.sample(WORDS, 3)
+        description_words = [rng.choice(WORDS) for _ in range(60)]
+        rows.append(
+            {
+                "title": f"{' '.join(title_words).title()} {index}",
+                "description": " ".join(description_words),
+                "price": 10,
+                "rating_sum": 0,
+                "rating_count": 0,
+            }
+        )
+    db.session.execute(Course.__table__.insert(), rows)
+    db.session.commit()
+
+
+def _time_searches(client, repeats: int) -> dict[str, float]:
+    results = {}
+    for term in SEARCH_TERMS:
+        samples = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            response = client.get("/courses/", query_string={"search": term, "page_size": 10})
+            samples.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200
+        results[term] = statistics.median(samples)
+    return results
+
+
+def run(course_count: int, repeats: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = create_app(db_url=f"sqlite:///{Path(tmp_dir, 'bench.db').as_posix()}")
+        with app.app_context():
+            db.create_all()
+            _seed(course_count)
+            client = app.test_client()
+
+            app.config["COURSE_SEARCH_BACKEND"] = "like"
+            reset_course_search_backend()
+            like_results = _time_searches(client, repeats)
+
+            app.config["COURSE_SEARCH_BACKEND"] = "auto"
+            rebuild_course_search_index()
+            db.session.commit()
+            fts_results = _time_searches(client, repeats)
+            db.session.remove()
+
+    print(f"\n{course_count} courses (median of {repeats} requests, ms)")
+    print(f"{'term':<20}{'ilike':>12}{'fts5':>12}")
+    for term in SEARCH_TERMS:
+        print(f"{term:<20}{like_results[term]:>12.2f}{fts_results[term]:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark queued email throughput against a local fake SendGrid API.
+
+Starts an HTTP server that answers ``POST /v3/mail/send`` with ``202`` after a
+fixed latency, points ``SENDGRID_API_HOST`` at it, queues emails in a
+throwaway SQLite database, and drains them with ``process_pending_emails`` at
+each ``EMAIL_SEND_CONCURRENCY``. The real SendGrid client and request path are
+used end to end.
+
+Usage (from backend/):
+    python benchmarks/email_dispatch_benchmark.py --emails 200 --latency-ms 300 --concurrency 1 4 8 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("EMAIL_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from db import db  # noqa: E402
+from models.notification import EmailNotification  # noqa: E402
+from utils.email import process_pending_emails  # noqa: E402
+
+
+def _fake_sendgrid_server(latency_seconds: float) -> ThreadingHTTPServer:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(latency_seconds)
+            self.send_response(202)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _queue_emails(count: int) -> None:
+    db.session.execute(EmailNotification.__table__.delete())
+    db.session.execute(
+        EmailNotification.__table__.insert(),
+        [
+            {
+                "to_email": f"student{index}@example.com",
+                "subject": "Benchmark",
+                "body": "<p>Hello</p>",
+                "status": "pending",
+                "retry_count": 0,
+            }
+            for index in range(count)
+        ],
+    )
+    db.session.commit()
+
+
+def run(email_count: int, latency_ms: int, concurrency_levels: list[int], batch_size: int) -> None:
+    server = _fake_sendgrid_server(latency_ms / 1000)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = create_app(db_url=f"sqlite:///{Path(tmp_dir, 'bench.db').as_posix()}")
+        app.config.update(
+            SENDGRID_API_KEY="benchmark-key",
+            SENDGRID_API_HOST=f"http://127.0.0.1:{server.server_port}",
+            EMAIL_FROM="noreply@example.com",
+            EMAIL_BATCH_SIZE=batch_size,
+        )
+        with app.app_context():
+            db.create_all()
+            print(f"{'concurrency':>12}{'emails':>8}{'seconds':>10}{'emails/s':>10}")
+            for concurrency in concurrency_levels:
+                app.config["EMAIL_SEND_CONCURRENCY"] = concurrency
+                _queue_emails(email_count)
+
+                started = time.perf_counter()
+                while EmailNotification.query.filter_by(status="pending").count():
+                    process_pending_emails()
+                elapsed = time.perf_counter() - started
+
+                sent = EmailNotification.query.filter_by(status="sent").count()
+                print(f"{concurrency:>12}{sent:>8}{elapsed:>10.2f}{sent / elapsed:>10.1f}")
+    server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=100)
+    parser.add_argument("--latency-ms", type=int, default=300, help="fake provider latency per request")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+    run(args.emails, args.latency_ms, args.concurrency, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark storing rendered email HTML versus template key + context.
+
+Builds the same meeting-reminder notifications two ways for ``--emails``
+recipients in a throwaway SQLite database:
+- ``inline``: HTML rendered with f-strings on the request path and stored per
+  row (the previous approach)
+- ``template``: ``template_key`` + JSON ``context`` stored per row and
+  rendered from the compiled registry at dispatch time
+
+and reports enqueue time, bytes stored per row, database file growth and
+render throughput.
+
+Usage (from backend/):
+    python benchmarks/email_render_benchmark.py --emails 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("EMAIL_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from db import db  # noqa: E402
+from models.notification import EmailNotification  # noqa: E402
+from utils.email import queue_emails_bulk  # noqa: E402
+from utils.email_templates import render_email_body  # noqa: E402
+
+TEMPLATE_KEY = "meeting_reminder.admin"
+
+
+def _context(index: int) -> dict:
+    return {
+        "first_name": f"Admin{index}",
+        "course_title": "Foundations of Mindful Leadership",
+        "lead_minutes": 60,
+        "date": "2026-04-01",
+        "time": "09:30",
+        "student_name": f"Student {index} Example",
+    }
+
+
+def _inline_body(context: dict) -> str:
+    return (
+        f"<p>Hi {context['first_name']},</p>"
+        f"<p>Reminder: a session for <strong>{context['course_title']}</strong> "
+        f"starts in {context['lead_minutes']} minute(s).</p>"
+        f"<p><strong>Student:</strong> {context['student_name']}<br/>"
+        f"<strong>Date:</strong> {context['date']}<br/><strong>Time:</strong> {context['time']}</p>"
+    )
+
+
+def _emails(count: int, templated: bool):
+    for index in range(count):
+        context = _context(index)
+        email = {"to_email": f"admin{index}@example.com", "subject": "Meeting reminder: starts in 60 minute(s)"}
+        if templated:
+            email.update(template_key=TEMPLATE_KEY, context=context)
+        else:
+            email["body"] = _inline_body(context)
+        yield email
+
+
+def _stored_bytes_per_row() -> float:
+    rows = db.session.execute(
+        db.select(EmailNotification.body, EmailNotification.template_key, EmailNotification.context)
+    ).all()
+    total = sum(
+        len(body or "") + len(template_key or "") + (len(json.dumps(context)) if context else 0)
+        for body, template_key, context in rows
+    )
+    return total / max(1, len(rows))
+
+
+def _render_rate(count: int, render) -> float:
+    contexts = [_context(index) for index in range(count)]
+    started = time.perf_counter()
+    for context in contexts:
+        render(context)
+    return count / (time.perf_counter() - started)
+
+
+def run(email_count: int) -> None:
+    print(f"{'approach':>10}{'enqueue s':>11}{'bytes/row':>11}{'db MB':>8}{'renders/s':>12}")
+    for approach, templated, render in (
+        ("inline", False, _inline_body),
+        ("template", True, lambda context: render_email_body(TEMPLATE_KEY, context)),
+    ):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            database_path = Path(tmp_dir, "bench.db")
+            app = create_app(db_url=f"sqlite:///{database_path.as_posix()}")
+            with app.app_context():
+                db.create_all()
+                db.session.commit()
+                empty_size = database_path.stat().st_size
+
+                started = time.perf_counter()
+                queue_emails_bulk(_emails(email_count, templated))
+                enqueue_seconds = time.perf_counter() - started
+
+                bytes_per_row = _stored_bytes_per_row()
+                growth_mb = (database_path.stat().st_size - empty_size) / (1024 * 1024)
+                rate = _render_rate(email_count, render)
+                db.session.remove()
+                db.engine.dispose()
+        print(f"{approach:>10}{enqueue_seconds:>11.2f}{bytes_per_row:>11.0f}{growth_mb:>8.1f}{rate:>12.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=5000)
+    args = parser.parse_args()
+    run(args.emails)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark email queue throughput with several worker processes.
+
+Queues ``--emails`` emails in a throwaway SQLite database, then forks each
+``--workers`` count of processes that drain the queue concurrently with
+``process_pending_emails``. Each send is a fake that sleeps ``--send-ms``.
+Reports wall time, emails/s, speed-up over the first worker count, and how
+many workers sent at least one email. Every email must be sent exactly once.
+
+Usage (from backend/):
+    python benchmarks/email_workers_benchmark.py --emails 48 --send-ms 30 --workers 1 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("EMAIL_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app import create_app  # noqa: E402
+from db import db  # noqa: E402
+from models.notification import EmailNotification  # noqa: E402
+from utils import email as email_utils  # noqa: E402
+
+
+def _queue_emails(count: int) -> None:
+    db.session.execute(EmailNotification.__table__.delete())
+    db.session.execute(
+        EmailNotification.__table__.insert(),
+        [
+            {
+                "to_email": f"worker{index}@example.com",
+                "subject": "Parallel",
+                "body": "<p>Hello</p>",
+                "status": "pending",
+                "retry_count": 0,
+            }
+            for index in range(count)
+        ],
+    )
+    db.session.commit()
+
+
+def _drain(db_url, log_dir, send_seconds, batch_size, barrier, elapsed):
+    def _fake_send(to_email, _subject, _body):
+        time.sleep(send_seconds)
+        with open(os.path.join(log_dir, f"{os.getpid()}.log"), "a") as log:
+            log.write(f"{to_email}\n")
+
+    email_utils._send_via_sendgrid = _fake_send
+    worker_app = create_app(db_url=db_url)
+    worker_app.config.update(EMAIL_BATCH_SIZE=batch_size, EMAIL_SEND_CONCURRENCY=1)
+    with worker_app.app_context():
+        # Warm up the connection and statement caches before the clock starts.
+        EmailNotification.query.filter_by(status="pending").count()
+        barrier.wait()
+        started = time.perf_counter()
+        while EmailNotification.query.filter_by(status="pending").count():
+            email_utils.process_pending_emails()
+        elapsed.put(time.perf_counter() - started)
+
+
+def _run_workers(db_url, log_dir, worker_count, send_seconds, batch_size):
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(worker_count)
+    elapsed = context.Queue()
+    workers = [
+        context.Process(target=_drain, args=(db_url, str(log_dir), send_seconds, batch_size, barrier, elapsed))
+        for _ in range(worker_count)
+    ]
+    for worker in workers:
+        worker.start()
+    wall_seconds = max(elapsed.get(timeout=600) for _ in workers)
+    for worker in workers:
+        worker.join()
+
+    sends = []
+    for log_name in os.listdir(log_dir):
+        with open(log_dir / log_name) as log:
+            sends.extend(line.strip() for line in log)
+    return wall_seconds, sends, len(os.listdir(log_dir))
+
+
+def run(email_count: int, send_ms: int, worker_counts: list[int], batch_size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_url = f"sqlite:///{Path(tmp_dir, 'bench.db').as_posix()}"
+        app = create_app(db_url=db_url)
+        with app.app_context():
+            db.create_all()
+
+        print(f"{'workers':>8}{'emails':>8}{'seconds':>10}{'emails/s':>10}{'speed-up':>10}{'active':>8}")
+        baseline = None
+        for worker_count in worker_counts:
+            with app.app_context():
+                _queue_emails(email_count)
+                db.session.remove()
+            log_dir = Path(tmp_dir, f"sends-{worker_count}")
+            log_dir.mkdir()
+            wall_seconds, sends, active = _run_workers(db_url, log_dir, worker_count, send_ms / 1000, batch_size)
+            if len(sends) != email_count or len(set(sends)) != email_count:
+                raise SystemExit(f"{worker_count} worker(s) sent {len(sends)} emails, {len(set(sends))} unique")
+            baseline = baseline or wall_seconds
+            print(
+                f"{worker_count:>8}{email_count:>8}{wall_seconds:>10.2f}{email_count / wall_seconds:>10.1f}"
+                f"{baseline / wall_seconds:>10.2f}{active:>8}"
+            )
+
+
+def main() -> None:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise SystemExit("This benchmark needs the fork start method.")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=48)
+    parser.add_argument("--send-ms", type=int, default=30, help="fake provider latency per email")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--batch-size", type=int, default=4)
+    args = parser.parse_args()
+    run(args.emails, args.send_ms, args.workers, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark app threads held by concurrent video viewers.
+
+Serves a synthetic video from a real threaded WSGI server and lets N viewers
+stream it with an open-ended Range request, reading at a fixed bitrate through
+a small receive buffer like a real player on a slow link. A
+middleware tracks how many app request threads are busy (from the WSGI call
+until the response iterable is closed) for each ``MEDIA_SERVE_OFFLOAD`` mode:
+- ``app``: the app thread streams every byte to the viewer
+- ``x-accel-redirect``: the app only returns headers; nginx would stream
+
+Usage (from backend/):
+    python benchmarks/media_serving_benchmark.py --viewers 4 16 --video-mb 8 --bitrate-mbps 16
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("EMAIL_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from werkzeug.serving import WSGIRequestHandler, make_server  # noqa: E402
+
+from app import create_app  # noqa: E402
+
+VIDEO_KEY = "courses/videos/0123456789abcdef0123456789abcdef.mp4"
+CHUNK_BYTES = 64 * 1024
+
+
+class ThreadGauge:
+    """WSGI middleware recording busy request threads over time."""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+        self.lock = threading.Lock()
+        self.busy = 0
+        self.peak = 0
+        self.busy_seconds = 0.0
+
+    def _enter(self):
+        with self.lock:
+            self.busy += 1
+            self.peak = max(self.peak, self.busy)
+        return time.perf_counter()
+
+    def _exit(self, started):
+        with self.lock:
+            self.busy -= 1
+            self.busy_seconds += time.perf_counter() - started
+
+    def __call__(self, environ, start_response):
+        started = self._enter()
+        try:
+            body = self.wsgi_app(environ, start_response)
+        except BaseException:
+            self._exit(started)
+            raise
+        gauge = self
+
+        class _Tracked:
+            def __iter__(self):
+                return iter(body)
+
+            def close(self):
+                try:
+                    if hasattr(body, "close"):
+                        body.close()
+                finally:
+                    gauge._exit(started)
+
+        return _Tracked()
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def _watch(port: int, bitrate_mbps: float) -> None:
+    """Stream the video from byte 0, reading no faster than ``bitrate_mbps``."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.sock = socket.create_connection(("127.0.0.1", port))
+    # Keep kernel buffering small so the server feels the viewer's pace.
+    connection.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CHUNK_BYTES)
+    try:
+        connection.request("GET", f"/media/{VIDEO_KEY}", headers={"Range": "bytes=0-"})
+        response = connection.getresponse()
+        if response.getheader("X-Accel-Redirect"):
+            # The front proxy would stream from here on; the app thread is already free.
+            response.read()
+            return
+        seconds_per_chunk = CHUNK_BYTES * 8 / (bitrate_mbps * 1_000_000)
+        while response.read(CHUNK_BYTES):
+            time.sleep(seconds_per_chunk)
+    finally:
+        connection.close()
+
+
+def run(viewer_counts: list[int], video_mb: int, bitrate_mbps: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        upload_dir = Path(tmp_dir, "uploads")
+        video_path = upload_dir.joinpath(*VIDEO_KEY.split("/"))
+        video_path.parent.mkdir(parents=True)
+        video_path.write_bytes(os.urandom(video_mb * 1024 * 1024))
+
+        app = create_app(db_url=f"sqlite:///{Path(tmp_dir, 'bench.db').as_posix()}")
+        app.config["MEDIA_LOCAL_UPLOAD_DIR"] = str(upload_dir)
+
+        print(f"{'mode':<18}{'viewers':>8}{'peak threads':>14}{'thread-seconds':>16}{'wall s':>9}")
+        for mode in ("", "x-accel-redirect"):
+            app.config["MEDIA_SERVE_OFFLOAD"] = mode
+            for viewers in viewer_counts:
+                gauge = ThreadGauge(app.wsgi_app)
+                server = make_server("127.0.0.1", 0, gauge, threaded=True, request_handler=_QuietHandler)
+                server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+                server_thread.start()
+
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=viewers) as pool:
+                    list(pool.map(lambda _: _watch(server.server_port, bitrate_mbps), range(viewers)))
+                wall_seconds = time.perf_counter() - started
+
+                server.shutdown()
+                print(
+                    f"{mode or 'app':<18}{viewers:>8}{gauge.peak:>14}"
+                    f"{gauge.busy_seconds:>16.2f}{wall_seconds:>9.2f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--viewers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--video-mb", type=int, default=4)
+    parser.add_argument("--bitrate-mbps", type=float, default=16.0, help="viewer read rate in megabits/s")
+    args = parser.parse_args()
+    run(args.viewers, args.video_mb, args.bitrate_mbps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Benchmark the meeting reminder tick: schedule rescan versus the due index.
+
+Seeds a throwaway SQLite database with ``--sessions`` upcoming sessions spread
+over the next two weeks, books ``--due`` sessions whose reminders are due now,
+and times one reminder tick two ways:
+- ``rescan``: load every scheduled session on the two candidate dates, lazy-load
+  its enrollment, student, admins and settings, and keep the ones inside the
+  window (the previous approach, reimplemented here)
+- ``index``: ``process_meeting_reminders()`` reading due rows of
+  ``meeting_reminder_due``; timed once with reminders to queue and once idle
+
+and reports time per tick, SQL statements per tick and reminders found. The
+one-off cost of building the index with ``rebuild_meeting_reminder_index()``
+is printed first.
+
+Usage (from backend/):
+    python benchmarks/meeting_reminder_benchmark.py --sessions 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("EMAIL_SCHEDULER_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy import event  # noqa: E402
+
+from app import create_app  # noqa: E402
+from db import db  # noqa: E402
+from models import Course, Enrollment, Schedule, User  # noqa: E402
+from utils.notifications import (  # noqa: E402
+    _meeting_reminder_bounds,
+    _meeting_reminder_lead_minutes,
+    process_meeting_reminders,
+    rebuild_meeting_reminder_index,
+    sync_meeting_reminders,
+)
+
+ADMIN_COUNT = 3
+SESSIONS_PER_ENROLLMENT = 10
+COURSE_COUNT = 10
+LEAD_MINUTES = 60
+WINDOW_SECONDS = 90
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _seed(session_count: int, due_count: int) -> None:
+    rng = random.Random(42)
+    now = _utcnow_naive().replace(second=0, microsecond=0)
+    student_count = (session_count + due_count) // SESSIONS_PER_ENROLLMENT + 2
+
+    db.session.execute(
+        Course.__table__.insert(),
+        [
+            {"title": f"Course {index}", "description": "Benchmark course", "price": 10, "rating_sum": 0,
+             "rating_count": 0}
+            for index in range(COURSE_COUNT)
+        ],
+    )
+    users = [
+        {"email": f"admin{index}@example.com", "password": "x", "first_name": "Admin", "last_name": str(index),
+         "initials": f"A{index}", "role": "admin"}
+        for index in range(ADMIN_COUNT)
+    ]
+    users += [
+        {"email": f"student{index}@example.com", "password": "x", "first_name": "Student", "last_name": str(index),
+         "initials": f"S{index}", "role": "student"}
+        for index in range(student_count)
+    ]
+    db.session.execute(User.__table__.insert(), users)
+    student_ids = db.session.scalars(db.select(User.id).where(User.role == "student").order_by(User.id)).all()
+    db.session.execute(
+        Enrollment.__table__.insert(),
+        [
+            {"student_id": student_id, "course_id": index % COURSE_COUNT + 1, "status": "active"}
+            for index, student_id in enumerate(student_ids)
+        ],
+    )
+    enrollment_ids = db.session.scalars(db.select(Enrollment.id).order_by(Enrollment.id)).all()
+
+    # Upcoming sessions are at least three hours out, so none is due during the run.
+    starts = [now + timedelta(minutes=rng.randint(180, 14 * 24 * 60)) for _ in range(session_count)]
+    rows = [
+        {
+            "enrollment_id": enrollment_ids[index // SESSIONS_PER_ENROLLMENT],
+            "date": start_at.date(),
+            "start_time": start_at.time(),
+            "end_time": (start_at + timedelta(hours=1)).time(),
+            "status": "scheduled",
+            "zoom_link": "https://zoom.example/meeting",
+        }
+        for index, start_at in enumerate(starts)
+    ]
+    for start in range(0, len(rows), 5000):
+        db.session.execute(Schedule.__table__.insert(), rows[start:start + 5000])
+    db.session.commit()
+
+
+def _book_due_sessions(due_count: int) -> None:
+    """Book sessions starting one lead time from now through the normal write path."""
+    start_at = _utcnow_naive() + timedelta(minutes=LEAD_MINUTES)
+    enrollment_ids = db.session.scalars(
+        db.select(Enrollment.id).order_by(Enrollment.id.desc()).limit(due_count // SESSIONS_PER_ENROLLMENT + 1)
+    ).all()
+    schedules = []
+    for index in range(due_count):
+        schedule = Schedule()
+        schedule.enrollment_id = enrollment_ids[index // SESSIONS_PER_ENROLLMENT]
+        schedule.date = start_at.date()
+        schedule.start_time = start_at.time()
+        schedule.end_time = (start_at + timedelta(hours=1)).time()
+        schedule.status = "scheduled"
+        db.session.add(schedule)
+        schedules.append(schedule)
+    sync_meeting_reminders(schedules)
+    db.session.commit()
+
+
+def _rescan_tick() -> int:
+    """The previous reminder tick: scan candidate dates and do the window math in Python."""
+    _, _, max_lead_minutes = _meeting_reminder_bounds()
+    now = _utcnow_naive()
+    latest_start = now + timedelta(minutes=max_lead_minutes, seconds=WINDOW_SECONDS)
+    candidates = Schedule.query.filter(
+        Schedule.status == "scheduled",
+        Schedule.date.in_({now.date(), latest_start.date()}),
+    ).all()
+
+    found = 0
+    for schedule in candidates:
+        enrollment = schedule.enrollment
+        if not enrollment or not enrollment.student or enrollment.status == "completed":
+            continue
+        start_at = datetime.combine(schedule.date, schedule.start_time)
+        if start_at <= now:
+            continue
+        recipients = {enrollment.student.id: enrollment.student}
+        recipients.update({admin.id: admin for admin in User.query.filter(User.role == "admin").all()})
+        for recipient in recipients.values():
+            target = start_at - timedelta(minutes=_meeting_reminder_lead_minutes(recipient))
+            if abs((now - target).total_seconds()) <= WINDOW_SECONDS:
+                found += 1
+    db.session.rollback()
+    return found
+
+
+@contextmanager
+def _count_statements():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+def _timed_tick(tick) -> tuple[float, int, int]:
+    db.session.expire_all()
+    with _count_statements() as statements:
+        started = time.perf_counter()
+        found = tick()
+        elapsed = time.perf_counter() - started
+    return elapsed, len(statements), found
+
+
+def run(session_count: int, due_count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_path = Path(tmp_dir, "bench.db")
+        app = create_app(db_url=f"sqlite:///{database_path.as_posix()}")
+        app.config.update(
+            MEETING_REMINDER_DEFAULT_LEAD_MINUTES=LEAD_MINUTES,
+            MEETING_REMINDER_WINDOW_SECONDS=WINDOW_SECONDS,
+        )
+        with app.app_context():
+            db.create_all()
+            _seed(session_count, due_count)
+
+            started = time.perf_counter()
+            index_rows = rebuild_meeting_reminder_index()
+            db.session.commit()
+            print(f"index build: {index_rows} rows in {time.perf_counter() - started:.2f}s")
+            _book_due_sessions(due_count)
+
+            print(f"{'approach':>12}{'tick ms':>10}{'queries':>9}{'reminders':>11}")
+            for approach, tick in (
+                ("index", process_meeting_reminders),
+                ("index idle", process_meeting_reminders),
+                ("rescan", _rescan_tick),
+            ):
+                elapsed, statement_count, found = _timed_tick(tick)
+                print(f"{approach:>12}{elapsed * 1000:>10.1f}{statement_count:>9}{found:>11}")
+            db.session.remove()
+            db.engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--due", type=int, default=50)
+    args = parser.parse_args()
+    run(args.sessions, args.due)
+
+
+if __name__ == "__main__":
+    main()
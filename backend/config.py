@@ -47,6 +47,38 @@ class BaseConfig:
     DEFAULT_COURSE_IMAGE_URL = os.getenv("DEFAULT_COURSE_IMAGE_URL", "")
 
     MAX_MEDIA_UPLOAD_MB = int(os.getenv("MAX_MEDIA_UPLOAD_MB", "50"))
+    # Direct-to-storage uploads: ticket lifetime and signing secret (falls back to JWT_SECRET_KEY).
+    MEDIA_DIRECT_UPLOAD_TTL_SECONDS = int(os.getenv("MEDIA_DIRECT_UPLOAD_TTL_SECONDS", "900"))
+    MEDIA_UPLOAD_TOKEN_SECRET = os.getenv("MEDIA_UPLOAD_TOKEN_SECRET", "")
+    # Unreferenced media older than this is removed by `flask gc-media`.
+    MEDIA_GC_GRACE_SECONDS = int(os.getenv("MEDIA_GC_GRACE_SECONDS", "86400"))
+
+    # Local media serving: unique upload keys are cached as immutable; other files revalidate.
+    MEDIA_IMMUTABLE_MAX_AGE_SECONDS = int(os.getenv("MEDIA_IMMUTABLE_MAX_AGE_SECONDS", "31536000"))
+    MEDIA_MUTABLE_MAX_AGE_SECONDS = int(os.getenv("MEDIA_MUTABLE_MAX_AGE_SECONDS", "300"))
+    # "" (serve from the app), "x-accel-redirect" (nginx) or "x-sendfile" (Apache/lighttpd).
+    MEDIA_SERVE_OFFLOAD = os.getenv("MEDIA_SERVE_OFFLOAD", "")
+    MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media")
+
+    # Derivatives generated in the background after an upload is stored.
+    MEDIA_IMAGE_VARIANT_WIDTHS = [
+        int(part.strip())
+        for part in os.getenv("MEDIA_IMAGE_VARIANT_WIDTHS", "320,640,1280").split(",")
+        if part.strip()
+    ]
+    MEDIA_IMAGE_VARIANT_QUALITY = int(os.getenv("MEDIA_IMAGE_VARIANT_QUALITY", "80"))
+    MEDIA_FFMPEG_BINARY = os.getenv("MEDIA_FFMPEG_BINARY", "ffmpeg")
+    MEDIA_FFMPEG_TIMEOUT_SECONDS = int(os.getenv("MEDIA_FFMPEG_TIMEOUT_SECONDS", "120"))
+    MEDIA_VIDEO_POSTER_WIDTH = int(os.getenv("MEDIA_VIDEO_POSTER_WIDTH", "1280"))
+
+    # "auto" uses the Postgres tsvector / SQLite FTS5 index when present; "like" forces ILIKE scans.
+    COURSE_SEARCH_BACKEND = os.getenv("COURSE_SEARCH_BACKEND", "auto")
+
+    # ===== RESPONSE CACHE SETTINGS =====
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")  # memory, redis, none
+    RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+    RESPONSE_CACHE_REDIS_URL = os.getenv("RESPONSE_CACHE_REDIS_URL", "")
 
     ALLOWED_IMAGE_EXTENSIONS = set(
         part.strip().lower()
@@ -64,6 +96,11 @@ class BaseConfig:
     MEDIA_S3_ENDPOINT_URL = os.getenv("MEDIA_S3_ENDPOINT_URL", "")
     MEDIA_S3_ACCESS_KEY = os.getenv("MEDIA_S3_ACCESS_KEY", "")
     MEDIA_S3_SECRET_KEY = os.getenv("MEDIA_S3_SECRET_KEY", "")
+    # Multipart transfer tuning; one cached client per process shares its connection pool.
+    MEDIA_S3_MULTIPART_THRESHOLD_MB = int(os.getenv("MEDIA_S3_MULTIPART_THRESHOLD_MB", "8"))
+    MEDIA_S3_MULTIPART_CHUNKSIZE_MB = int(os.getenv("MEDIA_S3_MULTIPART_CHUNKSIZE_MB", "8"))
+    MEDIA_S3_MAX_CONCURRENCY = int(os.getenv("MEDIA_S3_MAX_CONCURRENCY", "4"))
+    MEDIA_S3_MAX_POOL_CONNECTIONS = int(os.getenv("MEDIA_S3_MAX_POOL_CONNECTIONS", "16"))
 
     STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY", "")
     STRIPE_PUBLISHABLE_KEY = os.getenv("STRIPE_PUBLISHABLE_KEY", "")
@@ -93,18 +130,52 @@ class BaseConfig:
     # ===== EMAIL SETTINGS =====
     SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
     EMAIL_FROM = os.getenv("EMAIL_FROM")  # e.g. noreply@yourdomain.com
+    SENDGRID_API_HOST = os.getenv("SENDGRID_API_HOST", "https://api.sendgrid.com")
 
     # ===== EMAIL RETRY SETTINGS =====
     EMAIL_SCHEDULER_ENABLED = _env_bool("EMAIL_SCHEDULER_ENABLED", True)
     EMAIL_MAX_RETRIES = int(os.getenv("EMAIL_MAX_RETRIES", 3))
-    EMAIL_RETRY_INTERVAL_SECONDS = int(os.getenv("EMAIL_RETRY_INTERVAL_SECONDS", 30))
+    # Queued emails wake the dispatcher at once; this is only the fallback poll while idle.
+    EMAIL_IDLE_POLL_SECONDS = int(os.getenv("EMAIL_IDLE_POLL_SECONDS", 60))
+    # Failed sends wait base * 2^(attempt - 1) seconds (jittered, capped) unless the provider sends Retry-After.
+    EMAIL_RETRY_BACKOFF_BASE_SECONDS = int(os.getenv("EMAIL_RETRY_BACKOFF_BASE_SECONDS", 30))
+    EMAIL_RETRY_BACKOFF_MAX_SECONDS = int(os.getenv("EMAIL_RETRY_BACKOFF_MAX_SECONDS", 3600))
+    EMAIL_CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("EMAIL_CIRCUIT_BREAKER_THRESHOLD", 5))
+    EMAIL_CIRCUIT_BREAKER_COOLDOWN_SECONDS = int(os.getenv("EMAIL_CIRCUIT_BREAKER_COOLDOWN_SECONDS", 60))
     EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", 50))
+    # Share of EMAIL_BATCH_SIZE per lane when several lanes have due emails.
+    EMAIL_LANE_WEIGHTS = os.getenv("EMAIL_LANE_WEIGHTS", "reminder:8,payment:4,schedule:2,marketing:1")
     EMAIL_PROCESSING_CLAIM_TTL_SECONDS = int(os.getenv("EMAIL_PROCESSING_CLAIM_TTL_SECONDS", 300))
+    # Parallel SendGrid calls per batch; each sender thread keeps one keep-alive session.
+    EMAIL_SEND_CONCURRENCY = int(os.getenv("EMAIL_SEND_CONCURRENCY", 8))
+    EMAIL_SEND_TIMEOUT_SECONDS = int(os.getenv("EMAIL_SEND_TIMEOUT_SECONDS", 10))
+    # Broadcast recipients per SendGrid request (max 1000) and per scheduler run.
+    EMAIL_BROADCAST_BATCH_SIZE = int(os.getenv("EMAIL_BROADCAST_BATCH_SIZE", 1000))
+    EMAIL_BROADCAST_CLAIM_SIZE = int(os.getenv("EMAIL_BROADCAST_CLAIM_SIZE", 5000))
+    # Students streamed and inserted per chunk when announcing a new course.
+    EMAIL_BROADCAST_FANOUT_CHUNK_SIZE = int(os.getenv("EMAIL_BROADCAST_FANOUT_CHUNK_SIZE", 1000))
     MEETING_REMINDER_CHECK_INTERVAL_SECONDS = int(os.getenv("MEETING_REMINDER_CHECK_INTERVAL_SECONDS", 30))
     MEETING_REMINDER_WINDOW_SECONDS = int(os.getenv("MEETING_REMINDER_WINDOW_SECONDS", 90))
     MEETING_REMINDER_DEFAULT_LEAD_MINUTES = int(os.getenv("MEETING_REMINDER_DEFAULT_LEAD_MINUTES", 60))
     MEETING_REMINDER_MIN_LEAD_MINUTES = int(os.getenv("MEETING_REMINDER_MIN_LEAD_MINUTES", 30))
     MEETING_REMINDER_MAX_LEAD_MINUTES = int(os.getenv("MEETING_REMINDER_MAX_LEAD_MINUTES", 1440))
+    # How long a process may reuse its cached admin roster before reloading it.
+    ADMIN_ROSTER_CACHE_TTL_SECONDS = int(os.getenv("ADMIN_ROSTER_CACHE_TTL_SECONDS", 300))
+    # Due reminders loaded and queued per transaction by the reminder job.
+    MEETING_REMINDER_BATCH_SIZE = int(os.getenv("MEETING_REMINDER_BATCH_SIZE", 500))
+
+    # ===== BACKGROUND JOB SETTINGS =====
+    BACKGROUND_JOB_INTERVAL_SECONDS = int(os.getenv("BACKGROUND_JOB_INTERVAL_SECONDS", 10))
+    BACKGROUND_JOB_BATCH_SIZE = int(os.getenv("BACKGROUND_JOB_BATCH_SIZE", 10))
+    BACKGROUND_JOB_MAX_ATTEMPTS = int(os.getenv("BACKGROUND_JOB_MAX_ATTEMPTS", 3))
+    BACKGROUND_JOB_RETRY_DELAY_SECONDS = int(os.getenv("BACKGROUND_JOB_RETRY_DELAY_SECONDS", 60))
+    BACKGROUND_JOB_CLAIM_TTL_SECONDS = int(os.getenv("BACKGROUND_JOB_CLAIM_TTL_SECONDS", 900))
+
+    # ===== SCHEDULER PROCESS SETTINGS =====
+    # Set to false on web instances and run the jobs with `flask worker` instead.
+    SCHEDULER_IN_WEB_PROCESS = _env_bool("SCHEDULER_IN_WEB_PROCESS", True)
+    # Only the holder of this database lease runs the reminder tick; it renews every third of the lease.
+    SCHEDULER_LEADER_LEASE_SECONDS = int(os.getenv("SCHEDULER_LEADER_LEASE_SECONDS", 30))
 
     
 class DevelopmentConfig(BaseConfig):
@@ -0,0 +1,29 @@
+"""add saved_courses updated_at
+
+Revision ID: 0b7d5e9a4c21
+Revises: f08c3b6d2e17
+Create Date: 2026-03-11 16:40:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0b7d5e9a4c21"
+down_revision = "f08c3b6d2e17"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("saved_courses", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE saved_courses SET updated_at = CURRENT_TIMESTAMP")
+
+
+def downgrade():
+    with op.batch_alter_table("saved_courses", schema=None) as batch_op:
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,61 @@
+"""add background jobs and course media derivatives
+
+Revision ID: 1c4f8a2d6b90
+Revises: 0b7d5e9a4c21
+Create Date: 2026-03-13 10:10:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "1c4f8a2d6b90"
+down_revision = "0b7d5e9a4c21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=80), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("processing_claim_token", sa.String(length=64), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("background_jobs", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_background_jobs_kind"), ["kind"], unique=False)
+        batch_op.create_index(
+            batch_op.f("ix_background_jobs_processing_claim_token"),
+            ["processing_claim_token"],
+            unique=False,
+        )
+        batch_op.create_index("ix_background_jobs_status_run_after", ["status", "run_after"], unique=False)
+
+    with op.batch_alter_table("courses", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("image_variants", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("preview_poster_url", sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("courses", schema=None) as batch_op:
+        batch_op.drop_column("preview_poster_url")
+        batch_op.drop_column("image_variants")
+
+    with op.batch_alter_table("background_jobs", schema=None) as batch_op:
+        batch_op.drop_index("ix_background_jobs_status_run_after")
+        batch_op.drop_index(batch_op.f("ix_background_jobs_processing_claim_token"))
+        batch_op.drop_index(batch_op.f("ix_background_jobs_kind"))
+
+    op.drop_table("background_jobs")
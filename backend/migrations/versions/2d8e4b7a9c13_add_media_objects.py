@@ -0,0 +1,49 @@
+"""add media objects for content-addressed uploads
+
+Revision ID: 2d8e4b7a9c13
+Revises: 1c4f8a2d6b90
+Create Date: 2026-03-14 09:30:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2d8e4b7a9c13"
+down_revision = "1c4f8a2d6b90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing uploads are not backfilled: untracked objects are never garbage-collected.
+    op.create_table(
+        "media_objects",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("storage_key", sa.String(length=255), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=True),
+        sa.Column("media_type", sa.String(length=20), nullable=False),
+        sa.Column("content_type", sa.String(length=120), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("storage_key"),
+    )
+    with op.batch_alter_table("media_objects", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_media_objects_sha256"), ["sha256"], unique=False)
+        batch_op.create_index(batch_op.f("ix_media_objects_url"), ["url"], unique=False)
+        batch_op.create_index("ix_media_objects_ref_count_updated_at", ["ref_count", "updated_at"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("media_objects", schema=None) as batch_op:
+        batch_op.drop_index("ix_media_objects_ref_count_updated_at")
+        batch_op.drop_index(batch_op.f("ix_media_objects_url"))
+        batch_op.drop_index(batch_op.f("ix_media_objects_sha256"))
+
+    op.drop_table("media_objects")
@@ -0,0 +1,50 @@
+"""add email broadcasts with per-recipient substitutions
+
+Revision ID: 3e9a5c1f7d24
+Revises: 2d8e4b7a9c13
+Create Date: 2026-03-15 11:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3e9a5c1f7d24"
+down_revision = "2d8e4b7a9c13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "email_broadcasts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("recipient_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("broadcast_id", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("substitutions", sa.JSON(), nullable=True))
+        batch_op.create_index(batch_op.f("ix_email_notifications_broadcast_id"), ["broadcast_id"], unique=False)
+        batch_op.create_foreign_key(
+            "fk_email_notifications_broadcast_id",
+            "email_broadcasts",
+            ["broadcast_id"],
+            ["id"],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.drop_constraint("fk_email_notifications_broadcast_id", type_="foreignkey")
+        batch_op.drop_index(batch_op.f("ix_email_notifications_broadcast_id"))
+        batch_op.drop_column("substitutions")
+        batch_op.drop_column("broadcast_id")
+
+    op.drop_table("email_broadcasts")
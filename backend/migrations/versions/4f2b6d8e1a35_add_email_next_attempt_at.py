@@ -0,0 +1,41 @@
+"""add next_attempt_at to email notifications for scheduled retries
+
+Revision ID: 4f2b6d8e1a35
+Revises: 3e9a5c1f7d24
+Create Date: 2026-03-16 08:45:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4f2b6d8e1a35"
+down_revision = "3e9a5c1f7d24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("next_attempt_at", sa.DateTime(), nullable=True))
+
+    # Queued rows are due immediately, as they were before scheduled retries.
+    op.execute(
+        "UPDATE email_notifications SET next_attempt_at = COALESCE(created_at, CURRENT_TIMESTAMP)"
+    )
+
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.alter_column("next_attempt_at", existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index(
+            "ix_email_notifications_status_next_attempt_at",
+            ["status", "next_attempt_at"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.drop_index("ix_email_notifications_status_next_attempt_at")
+        batch_op.drop_column("next_attempt_at")
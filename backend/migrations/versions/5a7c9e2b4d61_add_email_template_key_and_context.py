@@ -0,0 +1,29 @@
+"""add template key and context to email notifications
+
+Revision ID: 5a7c9e2b4d61
+Revises: 4f2b6d8e1a35
+Create Date: 2026-03-17 10:20:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5a7c9e2b4d61"
+down_revision = "4f2b6d8e1a35"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("template_key", sa.String(length=80), nullable=True))
+        batch_op.add_column(sa.Column("context", sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.drop_column("context")
+        batch_op.drop_column("template_key")
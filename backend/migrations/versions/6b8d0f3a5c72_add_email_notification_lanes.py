@@ -0,0 +1,40 @@
+"""add priority lanes to email notifications
+
+Revision ID: 6b8d0f3a5c72
+Revises: 5a7c9e2b4d61
+Create Date: 2026-03-18 09:30:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6b8d0f3a5c72"
+down_revision = "5a7c9e2b4d61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("lane", sa.String(length=20), nullable=False, server_default="schedule")
+        )
+        batch_op.create_index(
+            "ix_email_notifications_status_lane_next_attempt_at",
+            ["status", "lane", "next_attempt_at"],
+            unique=False,
+        )
+
+    # Existing rows get the lane their dispatcher would assign now.
+    op.execute("UPDATE email_notifications SET lane = 'reminder' WHERE reference_key LIKE 'meeting-reminder:%'")
+    op.execute("UPDATE email_notifications SET lane = 'payment' WHERE reference_key LIKE 'payment-confirmed:%'")
+    op.execute("UPDATE email_notifications SET lane = 'marketing' WHERE broadcast_id IS NOT NULL")
+
+
+def downgrade():
+    with op.batch_alter_table("email_notifications", schema=None) as batch_op:
+        batch_op.drop_index("ix_email_notifications_status_lane_next_attempt_at")
+        batch_op.drop_column("lane")
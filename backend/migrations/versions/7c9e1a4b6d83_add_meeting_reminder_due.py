@@ -0,0 +1,52 @@
+"""add meeting reminder due index table
+
+Revision ID: 7c9e1a4b6d83
+Revises: 6b8d0f3a5c72
+Create Date: 2026-03-19 14:10:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7c9e1a4b6d83"
+down_revision = "6b8d0f3a5c72"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Populated by `flask rebuild-meeting-reminders`; lead times depend on app config.
+    op.create_table(
+        "meeting_reminder_due",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("schedule_id", sa.Integer(), nullable=False),
+        sa.Column("recipient_id", sa.Integer(), nullable=False),
+        sa.Column("lead_minutes", sa.Integer(), nullable=False),
+        sa.Column("due_at", sa.DateTime(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["recipient_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["schedule_id"], ["schedules.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("schedule_id", "recipient_id", name="uq_meeting_reminder_due_schedule_recipient"),
+    )
+    with op.batch_alter_table("meeting_reminder_due", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_meeting_reminder_due_processed_at_due_at",
+            ["processed_at", "due_at"],
+            unique=False,
+        )
+        batch_op.create_index(batch_op.f("ix_meeting_reminder_due_recipient_id"), ["recipient_id"], unique=False)
+        batch_op.create_index(batch_op.f("ix_meeting_reminder_due_schedule_id"), ["schedule_id"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("meeting_reminder_due", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_meeting_reminder_due_schedule_id"))
+        batch_op.drop_index(batch_op.f("ix_meeting_reminder_due_recipient_id"))
+        batch_op.drop_index("ix_meeting_reminder_due_processed_at_due_at")
+
+    op.drop_table("meeting_reminder_due")
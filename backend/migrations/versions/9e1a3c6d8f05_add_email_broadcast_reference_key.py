@@ -0,0 +1,29 @@
+"""add email broadcast reference key
+
+Revision ID: 9e1a3c6d8f05
+Revises: 8d0f2b5c7e94
+Create Date: 2026-03-26 10:15:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9e1a3c6d8f05"
+down_revision = "8d0f2b5c7e94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("email_broadcasts", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("reference_key", sa.String(length=120), nullable=True))
+        batch_op.create_index(batch_op.f("ix_email_broadcasts_reference_key"), ["reference_key"], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table("email_broadcasts", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_email_broadcasts_reference_key"))
+        batch_op.drop_column("reference_key")
@@ -0,0 +1,37 @@
+"""add course rating aggregates
+
+Revision ID: c4e81f27d9a3
+Revises: b2d7a4a91c13
+Create Date: 2026-03-02 09:30:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c4e81f27d9a3"
+down_revision = "b2d7a4a91c13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("courses", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("rating_sum", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("rating_count", sa.Integer(), nullable=False, server_default="0"))
+
+    op.execute(
+        """
+        UPDATE courses
+        SET rating_sum = COALESCE((SELECT SUM(reviews.rating) FROM reviews WHERE reviews.course_id = courses.id), 0),
+            rating_count = (SELECT COUNT(reviews.id) FROM reviews WHERE reviews.course_id = courses.id)
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("courses", schema=None) as batch_op:
+        batch_op.drop_column("rating_count")
+        batch_op.drop_column("rating_sum")
@@ -0,0 +1,55 @@
+"""add course full-text search index
+
+Revision ID: d71b3a6e0c52
+Revises: c4e81f27d9a3
+Create Date: 2026-03-04 11:15:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "d71b3a6e0c52"
+down_revision = "c4e81f27d9a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        op.add_column("courses", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+        op.execute(
+            """
+            UPDATE courses
+            SET search_vector = setweight(to_tsvector('english', coalesce(title, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            """
+        )
+        op.create_index(
+            "ix_courses_search_vector",
+            "courses",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+    elif bind.dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts "
+            "USING fts5(title, description, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        op.execute("INSERT INTO courses_fts (rowid, title, description) SELECT id, title, description FROM courses")
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        op.drop_index("ix_courses_search_vector", table_name="courses")
+        op.drop_column("courses", "search_vector")
+    elif bind.dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS courses_fts")
@@ -0,0 +1,47 @@
+"""add updated_at columns
+
+Revision ID: e5a92d4f1b38
+Revises: d71b3a6e0c52
+Create Date: 2026-03-06 10:05:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5a92d4f1b38"
+down_revision = "d71b3a6e0c52"
+branch_labels = None
+depends_on = None
+
+
+# Tables receiving an ``updated_at`` column, mapped to the column used to
+# backfill existing rows (None falls back to the migration time).
+UPDATED_AT_TABLES = {
+    "users": "created_at",
+    "courses": "created_at",
+    "reviews": "created_at",
+    "enrollments": "start_date",
+    "schedules": None,
+    "availability": None,
+    "availability_time_slots": None,
+    "availability_unavailable_dates": None,
+    "email_notification_settings": None,
+}
+
+
+def upgrade():
+    for table_name, source_column in UPDATED_AT_TABLES.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+        backfill = f"COALESCE({source_column}, CURRENT_TIMESTAMP)" if source_column else "CURRENT_TIMESTAMP"
+        op.execute(f"UPDATE {table_name} SET updated_at = {backfill}")
+
+
+def downgrade():
+    for table_name in reversed(list(UPDATED_AT_TABLES)):
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_column("updated_at")
@@ -0,0 +1,26 @@
+"""add reviews (course_id, created_at) index
+
+Revision ID: f08c3b6d2e17
+Revises: e5a92d4f1b38
+Create Date: 2026-03-09 14:20:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f08c3b6d2e17"
+down_revision = "e5a92d4f1b38"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("reviews", schema=None) as batch_op:
+        batch_op.create_index("ix_reviews_course_id_created_at", ["course_id", "created_at"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("reviews", schema=None) as batch_op:
+        batch_op.drop_index("ix_reviews_course_id_created_at")
@@ -4,8 +4,10 @@ from models.enrollment import Enrollment
 from models.review import Review
 from models.schedule import Schedule
 from models.availability import Availability, AvailabilityTimeSlot, AvailabilityUnavailableDate
-from models.notification import EmailNotificationSettings, EmailNotification
+from models.notification import EmailNotificationSettings, EmailNotification, EmailBroadcast, MeetingReminderDue
 from models.token_blocklist import TokenBlocklist
+from models.job import BackgroundJob, SchedulerLease
+from models.media import MediaObject
 
 
 
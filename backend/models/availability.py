@@ -2,6 +2,10 @@ from db import db
 from datetime import datetime, timezone
 
 
+def _utcnow_naive() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Availability(db.Model):
     __tablename__ = "availability"
 
@@ -26,6 +30,7 @@ class Availability(db.Model):
         nullable=False,
         default=lambda: datetime.now(timezone.utc).month,
     )
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     user = db.relationship("User", back_populates="availability")
     time_slots = db.relationship(
@@ -48,6 +53,7 @@ class AvailabilityTimeSlot(db.Model):
 
     start_time = db.Column(db.Time, nullable=False)
     end_time = db.Column(db.Time, nullable=False)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     availability = db.relationship("Availability", back_populates="time_slots")
 
@@ -62,5 +68,6 @@ class AvailabilityUnavailableDate(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
     unavailable_date = db.Column(db.Date, nullable=False)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     user = db.relationship("User", back_populates="unavailable_dates")
\ No newline at end of file
@@ -1,9 +1,8 @@
 from datetime import UTC, datetime
-from typing import Any, cast
 
 from db import db
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy import func, select
+from sqlalchemy import case, literal
 
 
 def _utcnow_naive() -> datetime:
@@ -17,31 +16,40 @@ class Course(db.Model):
     description = db.Column(db.Text, nullable=False)
     image_url = db.Column(db.Text)
     preview_video_url = db.Column(db.Text)
+    # Derivatives produced by the background media pipeline (utils/media_derivatives.py).
+    image_variants = db.Column(db.JSON(none_as_null=True))
+    preview_poster_url = db.Column(db.Text)
     price = db.Column(db.Numeric(10,2), nullable=False)
 
+    # Denormalized review aggregates, maintained alongside review writes so
+    # catalog serialization never has to load the review collection.
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
     created_at = db.Column(
         db.DateTime,
         default=_utcnow_naive,
     )
+    updated_at = db.Column(
+        db.DateTime,
+        default=_utcnow_naive,
+        onupdate=_utcnow_naive,
+    )
 
     reviews = db.relationship("Review", back_populates="course", cascade="all, delete-orphan")
     enrollments = db.relationship("Enrollment", back_populates="course", cascade="all, delete-orphan")
 
     @hybrid_property
     def average_rating(self):
-        reviews = cast(list[Any], self.reviews)
-        if not reviews:
+        if not self.rating_count:
             return 0.0
-        return sum(r.rating for r in reviews) / len(reviews)
+        return (self.rating_sum or 0) / self.rating_count
 
     @average_rating.expression
     def average_rating_expression(cls):
-        from .review import Review
-
-        return (
-            select(func.coalesce(func.avg(Review.rating), 0.0))
-            .where(Review.course_id == cls.id)
-            .scalar_subquery()
+        return case(
+            (cls.rating_count > 0, cls.rating_sum * 1.0 / cls.rating_count),
+            else_=literal(0.0),
         )
 
 class SavedCourse(db.Model):
@@ -50,6 +58,7 @@ class SavedCourse(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     course_id = db.Column(db.Integer, db.ForeignKey("courses.id"), nullable=False)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     __table_args__ = (
         db.UniqueConstraint("user_id", "course_id", name="unique_saved_course"),
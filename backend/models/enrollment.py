@@ -23,6 +23,7 @@ class Enrollment(db.Model):
         default=_utcnow_naive,
     )
     end_date = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     student = db.relationship("User", back_populates="enrollments")
     course = db.relationship("Course", back_populates="enrollments")
@@ -0,0 +1,42 @@
+from datetime import UTC, datetime
+
+from db import db
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class BackgroundJob(db.Model):
+    __tablename__ = "background_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(80), nullable=False, index=True)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+
+    status = db.Column(db.String(50), nullable=False, default="pending")  # pending, processing, succeeded, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    last_error = db.Column(db.Text)
+    run_after = db.Column(db.DateTime, nullable=False, default=_utcnow_naive)
+    processing_claim_token = db.Column(db.String(64), index=True)
+    claimed_at = db.Column(db.DateTime)
+
+    created_at = db.Column(db.DateTime, default=_utcnow_naive)
+    finished_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index("ix_background_jobs_status_run_after", "status", "run_after"),
+    )
+
+
+class SchedulerLease(db.Model):
+    """Time-limited lease naming the one process allowed to run periodic jobs."""
+
+    __tablename__ = "scheduler_leases"
+
+    name = db.Column(db.String(80), primary_key=True)
+    holder = db.Column(db.String(120), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    acquired_at = db.Column(db.DateTime, nullable=False, default=_utcnow_naive)
+    renewed_at = db.Column(db.DateTime, nullable=False, default=_utcnow_naive)
@@ -0,0 +1,28 @@
+from datetime import UTC, datetime
+
+from db import db
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+class MediaObject(db.Model):
+    """A stored media object and how many course fields currently reference it."""
+
+    __tablename__ = "media_objects"
+
+    id = db.Column(db.Integer, primary_key=True)
+    storage_key = db.Column(db.String(255), nullable=False, unique=True)
+    url = db.Column(db.Text, nullable=False, index=True)
+    sha256 = db.Column(db.String(64), index=True)  # null for objects uploaded directly to storage
+    media_type = db.Column(db.String(20), nullable=False)
+    content_type = db.Column(db.String(120))
+    size_bytes = db.Column(db.BigInteger)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+
+    created_at = db.Column(db.DateTime, default=_utcnow_naive)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
+
+    __table_args__ = (
+        db.Index("ix_media_objects_ref_count_updated_at", "ref_count", "updated_at"),
+    )
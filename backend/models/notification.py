@@ -15,24 +15,88 @@ class EmailNotificationSettings(db.Model):
     notify_on_new_course = db.Column(db.Boolean, default=True)
     notify_on_meeting_reminder = db.Column(db.Boolean, default=True)
     meeting_reminder_lead_minutes = db.Column(db.Integer, default=60)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     user = db.relationship("User", back_populates="notification_settings")
 
 
+class EmailBroadcast(db.Model):
+    """One message template sent to many recipients.
+
+    ``subject`` and ``body`` contain substitution tags such as ``-first_name-``;
+    each recipient is an ``EmailNotification`` row carrying its own values in
+    ``substitutions`` and its own delivery status. ``reference_key`` names the
+    event a broadcast announces (e.g. ``course-published:<course_id>``), so a
+    retried job cannot queue the same announcement twice.
+    """
+
+    __tablename__ = "email_broadcasts"
+
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    reference_key = db.Column(db.String(120), unique=True, index=True)
+    recipient_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=_utcnow_naive)
+
+    recipients = db.relationship("EmailNotification", back_populates="broadcast", lazy="dynamic")
+
+
 class EmailNotification(db.Model):
     __tablename__ = "email_notifications"
 
     id = db.Column(db.Integer, primary_key=True)
     to_email = db.Column(db.String(255), nullable=False)
     subject = db.Column(db.String(255), nullable=False)
-    body = db.Column(db.Text, nullable=False)
+    body = db.Column(db.Text, nullable=False)  # empty when rendered from template_key at dispatch
+    template_key = db.Column(db.String(80))
+    context = db.Column(db.JSON)
     reference_key = db.Column(db.String(120), unique=True, index=True)
+    broadcast_id = db.Column(db.Integer, db.ForeignKey("email_broadcasts.id"), index=True)
+    substitutions = db.Column(db.JSON)
+    lane = db.Column(db.String(20), nullable=False, default="schedule", server_default="schedule")  # see utils.email
 
     status = db.Column(db.String(50), default="pending")  # pending, processing, sent, failed
     retry_count = db.Column(db.Integer, default=0)
     last_error = db.Column(db.Text)
     processing_claim_token = db.Column(db.String(64), index=True)
     claimed_at = db.Column(db.DateTime)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=_utcnow_naive)
 
     created_at = db.Column(db.DateTime, default=_utcnow_naive)
     sent_at = db.Column(db.DateTime)
+
+    broadcast = db.relationship("EmailBroadcast", back_populates="recipients")
+
+    __table_args__ = (
+        db.Index("ix_email_notifications_status_next_attempt_at", "status", "next_attempt_at"),
+        db.Index("ix_email_notifications_status_lane_next_attempt_at", "status", "lane", "next_attempt_at"),
+    )
+
+
+class MeetingReminderDue(db.Model):
+    """When one recipient's reminder for one session falls due.
+
+    Maintained by ``utils.notifications`` whenever schedules, enrollments,
+    reminder settings or admin accounts change, so the reminder job only
+    range-scans ``due_at`` instead of re-deriving reminders from schedules.
+    ``processed_at`` is set once the reminder was queued (or had expired).
+    """
+
+    __tablename__ = "meeting_reminder_due"
+
+    id = db.Column(db.Integer, primary_key=True)
+    schedule_id = db.Column(db.Integer, db.ForeignKey("schedules.id"), nullable=False, index=True)
+    recipient_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    lead_minutes = db.Column(db.Integer, nullable=False)
+    due_at = db.Column(db.DateTime, nullable=False)
+    processed_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=_utcnow_naive)
+
+    schedule = db.relationship("Schedule", back_populates="meeting_reminders")
+    recipient = db.relationship("User", back_populates="meeting_reminders")
+
+    __table_args__ = (
+        db.UniqueConstraint("schedule_id", "recipient_id", name="uq_meeting_reminder_due_schedule_recipient"),
+        db.Index("ix_meeting_reminder_due_processed_at_due_at", "processed_at", "due_at"),
+    )
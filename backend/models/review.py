@@ -20,10 +20,16 @@ class Review(db.Model):
         db.DateTime,
         default=_utcnow_naive,
     )
+    updated_at = db.Column(
+        db.DateTime,
+        default=_utcnow_naive,
+        onupdate=_utcnow_naive,
+    )
 
     user = db.relationship("User", back_populates="reviews")
     course = db.relationship("Course", back_populates="reviews")
 
     __table_args__ = (
         db.UniqueConstraint("user_id", "course_id", name="uq_user_course_review"),
+        db.Index("ix_reviews_course_id_created_at", "course_id", "created_at"),
     )
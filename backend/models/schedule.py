@@ -1,5 +1,12 @@
+from datetime import UTC, datetime
+
 from db import db
 
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class Schedule(db.Model):
     __tablename__ = "schedules"
 
@@ -13,5 +20,7 @@ class Schedule(db.Model):
     zoom_link = db.Column(db.Text)
     status = db.Column(db.Enum("scheduled", "reschedule_requested", name="schedule_status"), default="scheduled")
     reminder_sent_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=_utcnow_naive, onupdate=_utcnow_naive)
 
     enrollment = db.relationship("Enrollment", back_populates="schedules")
+    meeting_reminders = db.relationship("MeetingReminderDue", back_populates="schedule", cascade="all, delete-orphan")
@@ -26,9 +26,15 @@ class User(db.Model):
         db.DateTime,
         default=_utcnow_naive,
     )
+    updated_at = db.Column(
+        db.DateTime,
+        default=_utcnow_naive,
+        onupdate=_utcnow_naive,
+    )
 
     enrollments = db.relationship("Enrollment", back_populates="student", cascade="all, delete")
     reviews = db.relationship("Review", back_populates="user", cascade="all, delete")
     notification_settings = db.relationship("EmailNotificationSettings", uselist=False, back_populates="user")
     availability = db.relationship("Availability", back_populates="user", cascade="all, delete")
     unavailable_dates = db.relationship("AvailabilityUnavailableDate", back_populates="user", cascade="all, delete")
+    meeting_reminders = db.relationship("MeetingReminderDue", back_populates="recipient", cascade="all, delete")
@@ -9,6 +9,7 @@ from schemas import AvailabilitySchema, AvailabilityUpsertSchema, PublicAvailabi
 from models import Availability, AvailabilityTimeSlot, AvailabilityUnavailableDate, User
 from models import Schedule
 from db import db
+from utils.conditional import conditional_response, fetch_resource_version, row_version
 from utils.decorators import admin_required
 
 blp = Blueprint("Availability", "availability", url_prefix="/availability")
@@ -192,11 +193,29 @@ class AvailabilityList(MethodView):
         }
 
 
+def _public_availability_version():
+    admin_user_id = db.session.execute(
+        db.select(User.id).filter_by(role="admin").order_by(User.id.asc()).limit(1)
+    ).scalar()
+    if admin_user_id is None:
+        return None
+
+    admin_day_ids = db.select(Availability.id).where(Availability.user_id == admin_user_id)
+    return fetch_resource_version(
+        *row_version(Availability, Availability.user_id == admin_user_id),
+        *row_version(AvailabilityTimeSlot, AvailabilityTimeSlot.availability_id.in_(admin_day_ids)),
+        *row_version(AvailabilityUnavailableDate, AvailabilityUnavailableDate.user_id == admin_user_id),
+        *row_version(Schedule),
+        key=(admin_user_id,),
+    )
+
+
 @blp.route("/public")
 class PublicAvailabilityList(MethodView):
     """Read-only availability feed for learners booking onboarding sessions."""
 
     @jwt_required()
+    @conditional_response(_public_availability_version)
     @blp.response(200, PublicAvailabilitySchema)
     def get(self):
         """Return admin availability, unavailable dates, and already booked slots."""
@@ -8,12 +8,22 @@ import logging
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+from sqlalchemy import and_
+from sqlalchemy.orm import contains_eager
 from models import Course, SavedCourse, Enrollment, Schedule, User
 from db import db
-from schemas import CourseSchema, CourseDetailSchema, CourseListResponseSchema, ScheduleSchema
+from schemas import CourseSchema, CourseDetailSchema, CourseListResponseSchema, MediaUploadConfirmSchema, ScheduleSchema
 from utils.decorators import admin_required, student_required
+from utils.conditional import conditional_response, fetch_resource_version, row_version
+from utils.course_search import get_course_search
+from utils.media_derivatives import enqueue_course_media_derivatives
+from utils.media_objects import attach_course_media, claim_media_object, release_course_media
 from utils.media_upload import MediaUploadService
-from utils.notifications import notify_new_course_published
+from utils.pagination import paginate_request
+from utils.response_cache import cached_response, invalidate_response_cache
+from utils.notifications import enqueue_new_course_announcement
 
 blp = Blueprint("Courses", "courses", url_prefix="/courses")
 
@@ -21,7 +31,6 @@ blp = Blueprint("Courses", "courses", url_prefix="/courses")
 from models import Review
 
 from flask import request, current_app
-from sqlalchemy import func, or_
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +66,86 @@ def _get_user_or_404(user_id):
         abort(404, message="User not found.")
     return user
 
+
+def _optional_user_id():
+    """Return the caller's user id, or None for anonymous callers.
+
+    An expired, revoked or malformed token is treated as anonymous, so the
+    public catalog keeps working for browsers that hold a stale token.
+    """
+    try:
+        verify_jwt_in_request(optional=True)
+    except (JWTExtendedException, PyJWTError):
+        return None
+    return get_jwt_identity()
+
+
+def _catalog_version():
+    # Enrollment-type filters depend on the caller and are not revalidated.
+    if request.args.get("type"):
+        return None
+
+    user_id = _optional_user_id()
+    if user_id is None:
+        return fetch_resource_version(*row_version(Course))
+
+    # Authenticated pages carry is_saved/is_enrolled annotations.
+    return fetch_resource_version(
+        *row_version(Course),
+        *row_version(SavedCourse, SavedCourse.user_id == user_id),
+        *row_version(Enrollment, Enrollment.student_id == user_id),
+        key=(str(user_id),),
+    )
+
+
+def _annotate_courses_for_user(courses, user_id):
+    """Set is_saved/is_enrolled/enrollment_status on a page of courses in one query."""
+    course_ids = [course.id for course in courses]
+    if not course_ids:
+        return
+
+    rows = db.session.execute(
+        db.select(Course.id, SavedCourse.id, Enrollment.status)
+        .outerjoin(SavedCourse, and_(SavedCourse.course_id == Course.id, SavedCourse.user_id == user_id))
+        .outerjoin(Enrollment, and_(Enrollment.course_id == Course.id, Enrollment.student_id == user_id))
+        .where(Course.id.in_(course_ids))
+    ).all()
+    annotations = {course_id: (saved_id, status) for course_id, saved_id, status in rows}
+
+    for course in courses:
+        saved_id, status = annotations.get(course.id, (None, None))
+        course.is_saved = saved_id is not None
+        course.is_enrolled = status in ("active", "completed")
+        course.enrollment_status = status
+
+
+def _course_detail_version(course_id):
+    course_count, course_updated_at = row_version(Course, Course.id == course_id)
+    review_author_ids = db.select(Review.user_id).where(Review.course_id == course_id)
+    version = fetch_resource_version(
+        course_count,
+        course_updated_at,
+        *row_version(Review, Review.course_id == course_id),
+        *row_version(User, User.id.in_(review_author_ids)),
+    )
+    if not version.parts[0]:
+        return None
+    return version
+
+
 @blp.route("/")
 class CourseList(MethodView):
     """Collection operations for courses."""
 
+    @conditional_response(_catalog_version)
+    @cached_response("catalog")
     @blp.response(200, CourseListResponseSchema)
     def get(self):
-        """List courses with optional search and enrollment-status filters."""
+        """List courses with optional search and enrollment-status filters.
+
+        Supports offset pagination (``page``) or keyset pagination (``cursor``).
+        Authenticated callers also get ``is_saved``/``is_enrolled`` per course.
+        """
         page = request.args.get("page", 1, type=int)
         page_size = request.args.get("page_size", 10, type=int)
 
@@ -91,29 +173,20 @@ class CourseList(MethodView):
             )
 
         if search:
-            term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Course.title.ilike(term),
-                    Course.description.ilike(term)
-                )
-            )
+            query = get_course_search().apply(query, search)
 
-        query = query.order_by(Course.created_at.desc())
-        pagination = query.paginate(
-            page=page,
-            per_page=page_size,
-            error_out=False
+        courses, pagination = paginate_request(
+            query,
+            sort_keys=[(Course.created_at, True), (Course.id, True)],
         )
 
+        current_user_id = _optional_user_id()
+        if current_user_id is not None:
+            _annotate_courses_for_user(courses, current_user_id)
+
         return {
-            "data": pagination.items,
-            "pagination": {
-                "page": pagination.page,
-                "page_size": pagination.per_page,
-                "total": pagination.total,
-                "total_pages": pagination.pages
-            }
+            "data": courses,
+            "pagination": pagination,
         }
 
     @jwt_required()
@@ -139,19 +212,15 @@ class CourseList(MethodView):
         if price in (None, ""):
             abort(400, message="price is required.")
 
-        image_url = _default_course_image_url()
-        preview_video_url = None
         media_service = MediaUploadService.from_app(current_app)
 
         media_file = request.files.get("media")
+        stored_media = None
 
         try:
             if media_file:
-                uploaded_url = media_service.save_course_media(media_file)
-                if media_file.mimetype and media_file.mimetype.startswith("image/"):
-                    image_url = uploaded_url
-                elif media_file.mimetype and media_file.mimetype.startswith("video/"):
-                    preview_video_url = uploaded_url
+                # Only the original is stored here; derivatives are built by a background job.
+                stored_media = media_service.store_course_media(media_file, claim_existing=claim_media_object)
         except ValueError as exc:
             abort(400, message=str(exc))
         except RuntimeError as exc:
@@ -161,41 +230,73 @@ class CourseList(MethodView):
         course.title = title
         course.description = description
         course.price = price
-        course.image_url = image_url
-        course.preview_video_url = preview_video_url
+        course.image_url = _default_course_image_url()
+        course.preview_video_url = None
 
         db.session.add(course)
+        db.session.flush()
+        get_course_search().index_course(course)
+        if stored_media is not None and attach_course_media(course, stored_media):
+            enqueue_course_media_derivatives(course, stored_media)
+        # Fanned out to students by the background job worker, not in this request.
+        enqueue_new_course_announcement(course)
         db.session.commit()
-        notify_new_course_published(course.title)
+        invalidate_response_cache("catalog")
         logger.info("Course created", extra={"course_id": course.id})
         return course
 
 
+def _load_course_with_latest_reviews(course_id, review_limit=3):
+    """Load a course, its latest reviews, and their authors in one statement.
+
+    The course is outer-joined to its newest ``review_limit`` reviews and their
+    authors, so a course without reviews still yields a single row. The rating
+    comes from the denormalized aggregate columns on the course row.
+    """
+    latest_review_ids = (
+        db.select(Review.id)
+        .where(Review.course_id == course_id)
+        .order_by(Review.created_at.desc(), Review.id.desc())
+        .limit(review_limit)
+    )
+    rows = db.session.execute(
+        db.select(Course, Review)
+        .outerjoin(Review, and_(Review.course_id == Course.id, Review.id.in_(latest_review_ids)))
+        .outerjoin(Review.user)
+        .options(contains_eager(Review.user))
+        .where(Course.id == course_id)
+        .order_by(Review.created_at.desc(), Review.id.desc())
+    ).all()
+
+    if not rows:
+        abort(404, message="Course not found.")
+
+    course = rows[0][0]
+    latest_reviews = [review for _, review in rows if review is not None]
+    return course, latest_reviews
+
+
 @blp.route("/<int:course_id>")
 class CourseDetail(MethodView):
     """Read operations for a single course."""
 
+    @conditional_response(_course_detail_version)
+    @cached_response("catalog")
     @blp.response(200, CourseDetailSchema)
     def get(self, course_id):
         """Retrieve a course with latest reviews attached."""
         logger.info("Course detail requested", extra={"course_id": course_id})
 
-        course = _get_course_or_404(course_id)
-
-        latest_reviews = (
-            Review.query
-            .filter_by(course_id=course_id)
-            .order_by(Review.created_at.desc())
-            .limit(3)
-            .all()
-        )
+        course, latest_reviews = _load_course_with_latest_reviews(course_id)
 
         return {
             "id": course.id,
             "title": course.title,
             "description": course.description,
             "image_url": course.image_url,
+            "image_variants": course.image_variants,
             "preview_video_url": course.preview_video_url,
+            "preview_poster_url": course.preview_poster_url,
             "price": course.price,
             "created_at": course.created_at,
             "average_rating": course.average_rating,
@@ -257,22 +358,27 @@ class CourseAdminEdit(MethodView):
         media_file = request.files.get("media")
         media_service = MediaUploadService.from_app(current_app)
 
+        stored_media = None
+
         try:
             if media_file:
-                uploaded_url = media_service.save_course_media(media_file)
-                if media_file.mimetype and media_file.mimetype.startswith("image/"):
-                    course.image_url = uploaded_url
-                elif media_file.mimetype and media_file.mimetype.startswith("video/"):
-                    course.preview_video_url = uploaded_url
+                stored_media = media_service.store_course_media(media_file, claim_existing=claim_media_object)
         except ValueError as exc:
             abort(400, message=str(exc))
         except RuntimeError as exc:
             abort(500, message=str(exc))
 
+        if stored_media is not None and attach_course_media(course, stored_media):
+            enqueue_course_media_derivatives(course, stored_media)
+
         if not course.image_url:
             course.image_url = _default_course_image_url()
 
+        if "title" in data or "description" in data:
+            get_course_search().index_course(course)
+
         db.session.commit()
+        invalidate_response_cache("catalog")
         logger.info("Course updated", extra={"course_id": course_id})
         return course
 
@@ -284,13 +390,49 @@ class CourseAdminEdit(MethodView):
         logger.info("Course delete requested", extra={"course_id": course_id})
         course = _get_course_or_404(course_id)
 
+        release_course_media(course)
         db.session.delete(course)
+        get_course_search().remove_course(course_id)
         db.session.commit()
+        invalidate_response_cache("catalog")
         logger.info("Course deleted", extra={"course_id": course_id})
 
         return {"message": "Course deleted successfully."}, 200
     
     
+@blp.route("/<int:course_id>/media")
+class CourseMediaConfirm(MethodView):
+    """Attach media uploaded directly to storage to a course."""
+
+    @jwt_required(fresh=True)
+    @admin_required
+    @blp.arguments(MediaUploadConfirmSchema)
+    @blp.response(200, CourseSchema)
+    def post(self, confirm_data, course_id):
+        """Verify a completed direct upload and make it the course image or preview video."""
+        logger.info("Course media confirm requested", extra={"course_id": course_id})
+        course = _get_course_or_404(course_id)
+        media_service = MediaUploadService.from_app(current_app)
+
+        try:
+            claims = media_service.load_direct_upload(confirm_data["upload_token"])
+            stored_media = media_service.verify_direct_upload(claims)
+        except LookupError as exc:
+            abort(409, message=str(exc))
+        except ValueError as exc:
+            abort(400, message=str(exc))
+        except RuntimeError as exc:
+            abort(500, message=str(exc))
+
+        if attach_course_media(course, stored_media):
+            enqueue_course_media_derivatives(course, stored_media)
+
+        db.session.commit()
+        invalidate_response_cache("catalog")
+        logger.info("Course media attached", extra={"course_id": course_id, "storage_key": stored_media.storage_key})
+        return course
+
+
 @blp.route("/<int:course_id>/save")
 class SaveCourse(MethodView):
     """Endpoint for students to save a course."""
@@ -365,23 +507,16 @@ class SavedCoursesList(MethodView):
             Course.query
             .join(SavedCourse, Course.id == SavedCourse.course_id)
             .filter(SavedCourse.user_id == user_id)
-            .order_by(Course.created_at.desc())
         )
 
-        pagination = query.paginate(
-            page=page,
-            per_page=page_size,
-            error_out=False
+        courses, pagination = paginate_request(
+            query,
+            sort_keys=[(Course.created_at, True), (Course.id, True)],
         )
 
         return {
-            "data": pagination.items,
-            "pagination": {
-                "page": pagination.page,
-                "page_size": pagination.per_page,
-                "total": pagination.total,
-                "total_pages": pagination.pages
-            }
+            "data": courses,
+            "pagination": pagination,
         }
 
 
@@ -13,6 +13,9 @@ from datetime import datetime, timezone
 from collections import defaultdict
 from sqlalchemy import or_, case
 from flask import request
+from utils.conditional import conditional_response, fetch_resource_version, row_version
+from utils.notifications import sync_meeting_reminders
+from utils.pagination import paginate_request
 from utils.zoom import create_zoom_meeting_link, invalidate_zoom_meeting_link
 from typing import Any, cast
 
@@ -231,27 +234,21 @@ class EnrollmentList(MethodView):
             )
             query = query.order_by(relevance.desc())
         
-        pagination = query.paginate(
-            page=page,
-            per_page=page_size,
-            error_out=False
+        enrollments, pagination = paginate_request(
+            query,
+            sort_keys=[(Enrollment.id, False)],
         )
 
         sync_changed = False
-        for enrollment in pagination.items:
+        for enrollment in enrollments:
             if _sync_enrollment_schedule_window(enrollment):
                 sync_changed = True
         if sync_changed:
             db.session.commit()
 
         return {
-            "data": pagination.items,
-            "pagination": {
-                "page": pagination.page,
-                "page_size": pagination.per_page,
-                "total": pagination.total,
-                "total_pages": pagination.pages
-            }
+            "data": enrollments,
+            "pagination": pagination,
         }
 
     @jwt_required()
@@ -361,6 +358,7 @@ class EnrollmentDetail(MethodView):
         setattr(enrollment, "links_refreshed_count", links_refreshed_count)
         setattr(enrollment, "blocked_reminders_count", blocked_reminders_count)
 
+        sync_meeting_reminders(cast(list[Any], enrollment.schedules))
         db.session.commit()
         return enrollment
     
@@ -376,11 +374,37 @@ class EnrollmentDetail(MethodView):
         logger.info("Enrollment deleted", extra={"enrollment_id": enrollment_id})
         return {"message": "Enrollment deleted successfully."}, 200
     
+def _grouped_schedules_version():
+    user_id = get_jwt_identity()
+    user = db.session.get(User, user_id)
+    if not user:
+        return None
+
+    if user.role == "admin":
+        return fetch_resource_version(
+            *row_version(Enrollment),
+            *row_version(Schedule),
+            *row_version(Course),
+            *row_version(User, User.role == "student"),
+            key=(user.id, user.role),
+        )
+
+    own_enrollments = db.select(Enrollment.id).where(Enrollment.student_id == user.id)
+    own_course_ids = db.select(Enrollment.course_id).where(Enrollment.student_id == user.id)
+    return fetch_resource_version(
+        *row_version(Enrollment, Enrollment.student_id == user.id),
+        *row_version(Schedule, Schedule.enrollment_id.in_(own_enrollments)),
+        *row_version(Course, Course.id.in_(own_course_ids)),
+        key=(user.id, user.role),
+    )
+
+
 @blp.route("/schedules")
 class EnrollmentSchedules(MethodView):
     """Read schedules grouped by date across enrollments."""
 
     @jwt_required()
+    @conditional_response(_grouped_schedules_version)
     @blp.response(200, GroupedScheduleSchema(many=True))
     def get(self):
         """Return schedule items grouped by date for the caller or all users (admin)."""
@@ -0,0 +1,88 @@
+"""Direct media upload endpoints.
+
+Admins request an upload ticket here and send the file straight to storage,
+so large videos do not occupy an app server thread. The local driver gets a
+signed PUT endpoint on this app with the same contract. Uploaded objects are
+attached to a course through ``POST /courses/<course_id>/media``.
+"""
+
+import logging
+from flask import current_app, request, url_for
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required
+
+from db import db
+from schemas import MediaUploadRequestSchema, MediaUploadTicketSchema
+from utils.decorators import admin_required
+from utils.media_objects import track_media_object
+from utils.media_upload import MediaUploadService
+
+blp = Blueprint(
+    "MediaUploads",
+    __name__,
+    url_prefix="/media-uploads",
+    description="Direct-to-storage media uploads"
+)
+logger = logging.getLogger(__name__)
+
+
+@blp.route("/")
+class MediaUploadTicket(MethodView):
+    """Issue signed upload tickets for course media."""
+
+    @jwt_required(fresh=True)
+    @admin_required
+    @blp.arguments(MediaUploadRequestSchema)
+    @blp.response(201, MediaUploadTicketSchema)
+    def post(self, upload_data):
+        """Validate the declared file and return where and how to upload it."""
+        logger.info("Media upload ticket requested", extra={"size_bytes": upload_data["size_bytes"]})
+        media_service = MediaUploadService.from_app(current_app)
+        try:
+            ticket = media_service.create_direct_upload(
+                upload_data["file_name"],
+                upload_data["content_type"],
+                upload_data["size_bytes"],
+                local_upload_url=lambda token: url_for("MediaUploads.LocalMediaUpload", token=token),
+            )
+        except ValueError as exc:
+            abort(400, message=str(exc))
+        except RuntimeError as exc:
+            abort(500, message=str(exc))
+
+        # Tracked unreferenced from the start so abandoned uploads are garbage-collected.
+        track_media_object(
+            ticket["storage_key"],
+            media_service.public_url(ticket["storage_key"]),
+            ticket["media_type"],
+            content_type=upload_data["content_type"],
+        )
+        db.session.commit()
+        return ticket
+
+
+@blp.route("/<string:token>")
+class LocalMediaUpload(MethodView):
+    """Signed upload target for the local storage driver."""
+
+    def put(self, token):
+        """Store the raw request body under the key reserved by ``token``."""
+        media_service = MediaUploadService.from_app(current_app)
+        if media_service.driver != "local":
+            abort(404, message="Direct uploads go to the storage bucket for this driver.")
+
+        try:
+            claims = media_service.load_direct_upload(token, for_upload=True)
+            media_service.receive_local_upload(
+                claims,
+                request.stream,
+                request.mimetype,
+                request.content_length,
+            )
+        except FileExistsError as exc:
+            abort(409, message=str(exc))
+        except ValueError as exc:
+            abort(400, message=str(exc))
+
+        return {"storage_key": claims["storage_key"]}, 200
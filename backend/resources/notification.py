@@ -9,9 +9,13 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy.exc import SQLAlchemyError
 
 from db import db
-from models import EmailNotificationSettings, EmailNotification
+from models import EmailNotificationSettings, EmailNotification, User
 from schemas import NotificationSchema, PaymentNotificationOutcomeListResponseSchema
+from utils.conditional import conditional_response, fetch_resource_version, row_version
+from utils.admin_roster import invalidate_admin_roster
 from utils.decorators import admin_required
+from utils.notifications import sync_meeting_reminders_for_user
+from utils.pagination import paginate_request
 
 blp = Blueprint(
     "NotificationSettings",
@@ -54,7 +58,12 @@ class EmailNotificationSettingsUpsert(MethodView):
                     setattr(settings, field, value)
                 db.session.add(settings)
 
+            user = db.session.get(User, user_id)
+            if user and {"notify_on_meeting_reminder", "meeting_reminder_lead_minutes"} & settings_data.keys():
+                sync_meeting_reminders_for_user(user)
             db.session.commit()
+            if user and user.role == "admin":
+                invalidate_admin_roster()
             logger.info("Notification settings saved", extra={"user_id": user_id})
 
         except SQLAlchemyError:
@@ -64,11 +73,21 @@ class EmailNotificationSettingsUpsert(MethodView):
 
         return settings
 
+def _own_settings_version():
+    user_id = get_jwt_identity()
+    default_lead_minutes = int(current_app.config.get("MEETING_REMINDER_DEFAULT_LEAD_MINUTES", 60))
+    return fetch_resource_version(
+        *row_version(EmailNotificationSettings, EmailNotificationSettings.user_id == user_id),
+        key=(user_id, default_lead_minutes),
+    )
+
+
 @blp.route("/me")
 class EmailNotificationSettingsGet(MethodView):
     """Read notification settings for the current user."""
 
     @jwt_required()
+    @conditional_response(_own_settings_version)
     @blp.response(200, NotificationSchema)
     def get(self):
         """Return persisted settings or model defaults when not configured yet."""
@@ -102,27 +121,20 @@ class PaymentNotificationOutcomes(MethodView):
     @admin_required
     @blp.response(200, PaymentNotificationOutcomeListResponseSchema)
     def get(self):
-        page = request.args.get("page", 1, type=int)
-        page_size = request.args.get("page_size", 20, type=int)
-        page_size = max(1, min(page_size, 100))
         status = request.args.get("status", "", type=str).strip().lower()
 
         query = EmailNotification.query.filter(EmailNotification.subject.in_(PAYMENT_NOTIFICATION_SUBJECTS))
         if status:
             query = query.filter(EmailNotification.status == status)
 
-        pagination = query.order_by(EmailNotification.created_at.desc()).paginate(
-            page=page,
-            per_page=page_size,
-            error_out=False,
+        outcomes, pagination = paginate_request(
+            query,
+            sort_keys=[(EmailNotification.created_at, True), (EmailNotification.id, True)],
+            default_page_size=20,
+            max_page_size=100,
         )
 
         return {
-            "data": pagination.items,
-            "pagination": {
-                "page": pagination.page,
-                "page_size": pagination.per_page,
-                "total": pagination.total,
-                "total_pages": pagination.pages,
-            },
+            "data": outcomes,
+            "pagination": pagination,
         }
@@ -20,7 +20,7 @@ from sqlalchemy.exc import IntegrityError
 from db import db
 from models import Course, Enrollment, User, Schedule
 from utils.decorators import student_required
-from utils.notifications import notify_payment_confirmed
+from utils.notifications import notify_payment_confirmed, sync_meeting_reminders
 from schemas import (
 	StripeCheckoutSessionRequestSchema,
 	StripeCheckoutSessionResponseSchema,
@@ -144,12 +144,14 @@ def _finalize_paid_checkout_session(session, expected_user_id=None):
 		enrollment.start_date = _utcnow_naive()
 		db.session.add(enrollment)
 		try:
+			sync_meeting_reminders(enrollment.schedules)
 			db.session.commit()
 		except IntegrityError:
 			db.session.rollback()
 			enrollment = Enrollment.query.filter_by(student_id=session_user_id, course_id=course.id).first()
 	elif enrollment.status == "cancelled":
 		enrollment.status = "active"
+		sync_meeting_reminders(enrollment.schedules)
 		db.session.commit()
 
 	if not enrollment:
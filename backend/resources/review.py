@@ -7,7 +7,12 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from utils.decorators import admin_required, role_required
 from models import Review, Course, Enrollment, User
 from db import db
-from schemas import ReviewSchema, ReviewCreateSchema, TutorReplySchema
+from schemas import ReviewSchema, ReviewListResponseSchema, MyReviewResponseSchema, ReviewCreateSchema, TutorReplySchema
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+from utils.pagination import paginate_request
+from utils.ratings import apply_review_rating
+from utils.response_cache import invalidate_response_cache
 
 blp = Blueprint(
     "Reviews",
@@ -33,6 +38,17 @@ def _get_review_or_404(review_id):
         abort(404, message="Review not found.")
     return review
 
+def _rating_histogram(course_id):
+    counts = dict(
+        db.session.execute(
+            db.select(Review.rating, func.count(Review.id))
+            .where(Review.course_id == course_id)
+            .group_by(Review.rating)
+        ).all()
+    )
+    return {str(star): int(counts.get(star, 0)) for star in range(1, 6)}
+
+
 @blp.route("/")
 class ReviewList(MethodView):
     """Collection operations for course reviews."""
@@ -73,16 +89,54 @@ class ReviewList(MethodView):
         review.course_id = course_id
 
         db.session.add(review)
+        apply_review_rating(course_id, review.rating)
         db.session.commit()
+        invalidate_response_cache("catalog")
         logger.info("Review created", extra={"course_id": course_id, "review_id": review.id, "student_id": student_id})
 
         return review
     
-    @blp.response(200, ReviewSchema(many=True))
+    @blp.response(200, ReviewListResponseSchema)
     def get(self, course_id):
-        """Return all reviews for the specified course."""
+        """Return a page of reviews, newest first, with the course rating histogram.
+
+        Supports offset pagination (``page``) or keyset pagination (``cursor``).
+        """
         logger.info("Review list requested", extra={"course_id": course_id})
-        return Review.query.filter_by(course_id=course_id).all()
+
+        query = Review.query.options(selectinload(Review.user)).filter_by(course_id=course_id)
+        reviews, pagination = paginate_request(
+            query,
+            sort_keys=[(Review.created_at, True), (Review.id, True)],
+            default_page_size=20,
+            max_page_size=100,
+        )
+
+        return {
+            "data": reviews,
+            "pagination": pagination,
+            "rating_histogram": _rating_histogram(course_id),
+        }
+
+
+@blp.route("/mine")
+class MyReview(MethodView):
+    """The authenticated user's own review of a course."""
+
+    @jwt_required()
+    @blp.response(200, MyReviewResponseSchema)
+    def get(self, course_id):
+        """Return the caller's review of the course, or null when they have not reviewed it."""
+        user_id = get_jwt_identity()
+        logger.info("Own review requested", extra={"course_id": course_id, "user_id": user_id})
+
+        _get_course_or_404(course_id)
+        review = Review.query.options(selectinload(Review.user)).filter_by(
+            user_id=user_id,
+            course_id=course_id,
+        ).first()
+
+        return {"review": review}
 
 
 @blp.route("/<int:review_id>/reply")
@@ -105,6 +159,7 @@ class TutorReplyResource(MethodView):
 
         review.tutor_reply = reply_data["tutor_reply"]
         db.session.commit()
+        invalidate_response_cache("catalog")
         logger.info("Tutor reply saved", extra={"course_id": course_id, "review_id": review_id})
 
         return review
@@ -10,7 +10,7 @@ from models import Schedule, User, Enrollment
 from schemas import ScheduleSchema, ScheduleChangeRequestSchema, ScheduleChangeRequestResponseSchema
 from db import db
 from utils.decorators import admin_required, student_required
-from utils.notifications import notify_schedule_change_requested, notify_schedule_created
+from utils.notifications import notify_schedule_change_requested, notify_schedule_created, sync_meeting_reminders
 from utils.zoom import create_zoom_meeting_link
 
 blp = Blueprint("Schedules", "schedules", url_prefix="/schedules")
@@ -150,7 +150,13 @@ class ScheduleList(MethodView):
             db.session.add(schedule)
             schedules.append(schedule)
         
+        previous_status = enrollment.status
         _sync_enrollment_schedule_window(enrollment)
+        reminder_schedules = list(schedules)
+        if enrollment.status != previous_status:
+            # The status change re-arms or clears reminders for the enrollment's earlier sessions too.
+            reminder_schedules += [item for item in cast(list[Any], enrollment.schedules) if item not in schedules]
+        sync_meeting_reminders(reminder_schedules)
         db.session.commit()
 
         queued_count = 0
@@ -232,6 +238,7 @@ class ScheduleChangeRequest(MethodView):
             abort(404, message="Schedule not found or access denied.")
 
         schedule.status = "reschedule_requested"
+        sync_meeting_reminders([schedule])
         db.session.commit()
 
         queued_count = notify_schedule_change_requested(
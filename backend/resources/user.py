@@ -22,6 +22,10 @@ from schemas import UserSchema, UserRegisterSchema, UserUpdateSchema, UserLoginS
 from blocklist import BLOCKLIST
 from utils.decorators import admin_required
 from utils.initials import generate_unique_initials
+from utils.pagination import paginate_request
+from utils.ratings import recompute_course_ratings
+from utils.admin_roster import invalidate_admin_roster
+from utils.response_cache import invalidate_response_cache
 from utils.security import hash_password, verify_password
 
 blp = Blueprint("Users", __name__, description="Operations on users")
@@ -188,6 +192,11 @@ class UserSelf(MethodView):
             )
 
         db.session.commit()
+        if "first_name" in user_data or "last_name" in user_data:
+            # Cached course details show review authors' names and initials.
+            invalidate_response_cache("catalog")
+        if user.role == "admin":
+            invalidate_admin_roster()
         logger.info("Profile update completed", extra={"user_id": user_id})
         return user
    
@@ -202,9 +211,17 @@ class UserAdmin(MethodView):
         """Delete a user as an admin."""
         logger.info("Admin delete user requested", extra={"target_user_id": user_id})
         user = _get_user_or_404(user_id)
+        reviewed_course_ids = {review.course_id for review in user.reviews}
+        was_admin = user.role == "admin"
 
         db.session.delete(user)
+        db.session.flush()
+        recompute_course_ratings(reviewed_course_ids)
         db.session.commit()
+        if reviewed_course_ids:
+            invalidate_response_cache("catalog")
+        if was_admin:
+            invalidate_admin_roster()
         logger.info("Admin deleted user", extra={"target_user_id": user_id})
 
         return {"message": "User deleted."}, 200    
@@ -243,26 +260,18 @@ class UserList(MethodView):
                 )
             )
 
-        query = query.order_by(
-            UserModel.first_name.asc(),
-            UserModel.last_name.asc()
-        )
-
-        # 🔹 Apply pagination manually
-        pagination = query.paginate(
-            page=page,
-            per_page=page_size,
-            error_out=False
+        users, pagination = paginate_request(
+            query,
+            sort_keys=[
+                (UserModel.first_name, False),
+                (UserModel.last_name, False),
+                (UserModel.id, False),
+            ],
         )
 
         return {
-            "data": pagination.items,
-            "pagination": {
-                "page": pagination.page,
-                "page_size": pagination.per_page,
-                "total": pagination.total,
-                "total_pages": pagination.pages
-            }
+            "data": users,
+            "pagination": pagination,
         }
 
     
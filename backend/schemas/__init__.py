@@ -7,6 +7,7 @@ from schemas.availability import (
 	PublicAvailabilitySchema,
 )
 from schemas.course import CourseSchema, CourseDetailSchema, CourseListResponseSchema
+from schemas.media import MediaUploadRequestSchema, MediaUploadTicketSchema, MediaUploadConfirmSchema
 from schemas.enrollment import (
 	EnrollmentSchema,
 	ScheduleItemSchema,
@@ -20,7 +21,14 @@ from schemas.notification import (
 	PaymentNotificationOutcomePaginationSchema,
 	PaymentNotificationOutcomeListResponseSchema,
 )
-from schemas.review import ReviewSchema, ReviewCreateSchema, TutorReplySchema
+from schemas.review import (
+	ReviewSchema,
+	ReviewPaginationSchema,
+	ReviewListResponseSchema,
+	MyReviewResponseSchema,
+	ReviewCreateSchema,
+	TutorReplySchema,
+)
 from schemas.schedule import ScheduleSchema, ScheduleChangeRequestSchema, ScheduleChangeRequestResponseSchema
 from schemas.payment import (
 	StripeCheckoutSessionRequestSchema,
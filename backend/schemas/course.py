@@ -17,17 +17,30 @@ class CourseReviewSummarySchema(Schema):
     author = fields.Nested(CourseReviewAuthorSummarySchema, dump_only=True)
 
 
+class CourseImageVariantSchema(Schema):
+    width = fields.Int(dump_only=True)
+    height = fields.Int(dump_only=True)
+    url = fields.Str(dump_only=True)
+
+
 class CourseSchema(Schema):
     id = fields.Int(dump_only=True)
     title = fields.Str(required=True)
     description = fields.Str(required=True)
     image_url = fields.Str()
     preview_video_url = fields.Str()
+    image_variants = fields.List(fields.Nested(CourseImageVariantSchema), dump_only=True, allow_none=True)
+    preview_poster_url = fields.Str(dump_only=True, allow_none=True)
     price = fields.Decimal(required=True)
     created_at = fields.DateTime(dump_only=True)
 
     average_rating = fields.Float(dump_only=True)
 
+    # Caller-specific annotations, present only on authenticated catalog pages.
+    is_saved = fields.Boolean(dump_only=True)
+    is_enrolled = fields.Boolean(dump_only=True)
+    enrollment_status = fields.Str(dump_only=True, allow_none=True)
+
 
 
 class CourseDetailSchema(CourseSchema):
@@ -47,8 +60,10 @@ class CourseSingleResponseSchema(CourseDetailSchema):
 class CoursePaginationSchema(Schema):
     page = fields.Int()
     page_size = fields.Int()
-    total = fields.Int()
-    total_pages = fields.Int()
+    total = fields.Int(allow_none=True)
+    total_pages = fields.Int(allow_none=True)
+    next_cursor = fields.Str(allow_none=True)
+    prev_cursor = fields.Str(allow_none=True)
 
 
 class CourseListResponseSchema(Schema):
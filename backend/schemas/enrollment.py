@@ -55,8 +55,10 @@ class GroupedScheduleSchema(Schema):
 class EnrollmentPaginationSchema(Schema):
     page = fields.Int()
     page_size = fields.Int()
-    total = fields.Int()
-    total_pages = fields.Int()
+    total = fields.Int(allow_none=True)
+    total_pages = fields.Int(allow_none=True)
+    next_cursor = fields.Str(allow_none=True)
+    prev_cursor = fields.Str(allow_none=True)
 
 
 class EnrollmentListResponseSchema(Schema):
@@ -0,0 +1,23 @@
+from marshmallow import Schema, fields, validate
+
+
+class MediaUploadRequestSchema(Schema):
+    file_name = fields.Str(required=True)
+    content_type = fields.Str(required=True)
+    size_bytes = fields.Int(required=True, validate=validate.Range(min=1))
+
+
+class MediaUploadTicketSchema(Schema):
+    upload_token = fields.Str(required=True)
+    storage_key = fields.Str(required=True)
+    media_type = fields.Str(required=True)
+    method = fields.Str(required=True)
+    url = fields.Str(required=True)
+    # Form fields a presigned POST must send before the file part.
+    form_fields = fields.Dict(keys=fields.Str(), values=fields.Str(), data_key="fields")
+    headers = fields.Dict(keys=fields.Str(), values=fields.Str())
+    expires_in = fields.Int(required=True)
+
+
+class MediaUploadConfirmSchema(Schema):
+    upload_token = fields.Str(required=True)
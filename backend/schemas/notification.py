@@ -29,8 +29,10 @@ class PaymentNotificationOutcomeSchema(Schema):
 class PaymentNotificationOutcomePaginationSchema(Schema):
     page = fields.Int(dump_only=True)
     page_size = fields.Int(dump_only=True)
-    total = fields.Int(dump_only=True)
-    total_pages = fields.Int(dump_only=True)
+    total = fields.Int(allow_none=True, dump_only=True)
+    total_pages = fields.Int(allow_none=True, dump_only=True)
+    next_cursor = fields.Str(allow_none=True, dump_only=True)
+    prev_cursor = fields.Str(allow_none=True, dump_only=True)
 
 
 class PaymentNotificationOutcomeListResponseSchema(Schema):
@@ -18,6 +18,24 @@ class ReviewSchema(Schema):
 
     author = fields.Nested(ReviewAuthorSchema, dump_only=True, attribute="user")
 
+class ReviewPaginationSchema(Schema):
+    page = fields.Int()
+    page_size = fields.Int()
+    total = fields.Int(allow_none=True)
+    total_pages = fields.Int(allow_none=True)
+    next_cursor = fields.Str(allow_none=True)
+    prev_cursor = fields.Str(allow_none=True)
+
+class ReviewListResponseSchema(Schema):
+    data = fields.List(fields.Nested(ReviewSchema))
+    pagination = fields.Nested(ReviewPaginationSchema)
+    # Review counts keyed by star value ("1".."5") across the whole course.
+    rating_histogram = fields.Dict(keys=fields.Str(), values=fields.Int())
+
+class MyReviewResponseSchema(Schema):
+    # The caller's review of the course, or null when they have not reviewed it.
+    review = fields.Nested(ReviewSchema, allow_none=True)
+
 class ReviewCreateSchema(Schema):
     rating = fields.Integer(required=True, validate=validate.Range(min=1, max=5))
     comment = fields.String(required=True)
@@ -101,8 +101,10 @@ class ChangePasswordSchema(Schema):
 class PaginationSchema(Schema):
     page = fields.Int()
     page_size = fields.Int()
-    total = fields.Int()
-    total_pages = fields.Int()
+    total = fields.Int(allow_none=True)
+    total_pages = fields.Int(allow_none=True)
+    next_cursor = fields.Str(allow_none=True)
+    prev_cursor = fields.Str(allow_none=True)
 
 
 class UserListResponseSchema(Schema):
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from datetime import UTC, date, datetime, time, timedelta
 from itertools import count
 from pathlib import Path
@@ -5,6 +6,7 @@ import sys
 
 import pytest
 from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy import event
 
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
@@ -22,6 +24,9 @@ from app import create_app
 from blocklist import BLOCKLIST
 from db import db
 from models import Course, Enrollment, Schedule, User
+from utils.admin_roster import reset_admin_roster
+from utils.email import reset_circuit_breaker
+from utils.notifications import sync_meeting_reminders
 from utils.security import hash_password
 
 
@@ -31,6 +36,8 @@ def app(tmp_path):
     media_dir = tmp_path / "uploads"
 
     BLOCKLIST.clear()
+    reset_circuit_breaker()
+    reset_admin_roster()
 
     flask_app = create_app(db_url=f"sqlite:///{database_path.as_posix()}")
     flask_app.config.update(
@@ -54,6 +61,51 @@ def client(app):
     return app.test_client()
 
 
+@pytest.fixture()
+def count_queries(app):
+    """Return a context manager that records SQL statements executed inside it."""
+
+    @contextmanager
+    def _count_queries():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _count_queries
+
+
+@pytest.fixture()
+def queued_emails(monkeypatch):
+    """Capture notification emails as ``(to_email, subject, body, reference_key)`` instead of queuing them."""
+    import utils.notifications as notifications_module
+    from utils.email_templates import render_email_body
+
+    queued = []
+
+    def _body(email):
+        if email.get("template_key"):
+            return render_email_body(email["template_key"], email.get("context"))
+        return email["body"]
+
+    def _queue_emails_bulk(emails, commit=True):
+        emails = list(emails)
+        queued.extend(
+            (email["to_email"], email["subject"], _body(email), email.get("reference_key")) for email in emails
+        )
+        return len(emails)
+
+    monkeypatch.setattr(notifications_module, "queue_emails_bulk", _queue_emails_bulk)
+    return queued
+
+
 @pytest.fixture()
 def create_user(app):
     sequence = count(1)
@@ -145,6 +197,7 @@ def create_schedule():
             setattr(schedule, field_name, field_value)
 
         db.session.add(schedule)
+        sync_meeting_reminders([schedule])
         db.session.commit()
         return schedule
 
@@ -0,0 +1,118 @@
+from datetime import UTC, datetime, timedelta
+
+from utils.admin_roster import get_admin_roster
+from utils.notifications import notify_payment_confirmed, notify_schedule_change_requested, process_meeting_reminders
+
+
+def _admin_queries(statements):
+    return [statement for statement in statements if "users.role = " in statement]
+
+
+def test_reminder_job_runs_no_admin_query_and_index_sync_reads_admins_fresh(
+    app,
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    create_schedule,
+    count_queries,
+):
+    app.config.update(
+        MEETING_REMINDER_DEFAULT_LEAD_MINUTES=60,
+        MEETING_REMINDER_MIN_LEAD_MINUTES=30,
+        MEETING_REMINDER_MAX_LEAD_MINUTES=1440,
+        MEETING_REMINDER_WINDOW_SECONDS=300,
+    )
+    for index in range(3):
+        create_user(role="admin", email=f"roster-admin{index}@example.com")
+    start_at = (datetime.now(UTC).replace(tzinfo=None) + timedelta(minutes=60)).replace(second=0, microsecond=0)
+
+    with count_queries() as statements:
+        for index in range(8):
+            student = create_user(email=f"roster-student{index}@example.com")
+            enrollment = create_enrollment(student.id, create_course(title=f"Roster Course {index}").id)
+            create_schedule(
+                enrollment.id,
+                date=start_at.date(),
+                start_time=start_at.time(),
+                end_time=(start_at + timedelta(hours=1)).time(),
+            )
+    # Each index write reads admins in its own transaction, never from the roster.
+    assert len(_admin_queries(statements)) == 8
+
+    with count_queries() as statements:
+        assert process_meeting_reminders() == 8 * 4
+    assert _admin_queries(statements) == []
+
+    roster = client.get("/health/metrics").get_json()["admin_roster"]
+    assert (roster["misses"], roster["hits"]) == (0, 0)
+
+
+def test_reminder_index_ignores_a_stale_roster_from_another_process(
+    app,
+    create_user,
+    create_course,
+    create_enrollment,
+    create_schedule,
+):
+    from db import db
+    from models import EmailNotificationSettings, MeetingReminderDue
+
+    app.config.update(
+        MEETING_REMINDER_DEFAULT_LEAD_MINUTES=60,
+        MEETING_REMINDER_MIN_LEAD_MINUTES=30,
+        MEETING_REMINDER_MAX_LEAD_MINUTES=1440,
+    )
+    opted_out = create_user(role="admin", email="roster-opted-out@example.com")
+    assert [admin.id for admin in get_admin_roster()] == [opted_out.id]
+
+    # Changes committed by another process do not invalidate this process's roster.
+    settings = EmailNotificationSettings()
+    settings.user_id = opted_out.id
+    settings.notify_on_meeting_reminder = False
+    db.session.add(settings)
+    new_admin = create_user(role="admin", email="roster-new-admin@example.com")
+    db.session.commit()
+    assert [admin.id for admin in get_admin_roster()] == [opted_out.id]
+
+    student = create_user(email="roster-stale-student@example.com")
+    schedule = create_schedule(create_enrollment(student.id, create_course().id).id)
+
+    db.session.expire_all()
+    recipients = {row.recipient_id for row in MeetingReminderDue.query.filter_by(schedule_id=schedule.id)}
+    assert recipients == {student.id, new_admin.id}
+
+
+def test_roster_is_invalidated_by_settings_and_profile_updates(
+    app,
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    create_schedule,
+    auth_headers,
+    queued_emails,
+):
+    admin = create_user(role="admin", email="roster-admin@example.com")
+    student = create_user(email="roster-student@example.com")
+    schedule = create_schedule(create_enrollment(student.id, create_course().id).id)
+
+    notify_payment_confirmed(student, "Roster Course")
+    assert {email[0] for email in queued_emails} == {student.email, admin.email}
+
+    response = client.put("/me", json={"email": "renamed-admin@example.com"}, headers=auth_headers(admin))
+    assert response.status_code == 200
+    queued_emails.clear()
+    notify_payment_confirmed(student, "Roster Course")
+    assert {email[0] for email in queued_emails} == {student.email, "renamed-admin@example.com"}
+
+    response = client.post(
+        "/notification-settings/",
+        json={"user_id": admin.id, "notify_on_schedule_change": False},
+        headers=auth_headers(admin),
+    )
+    assert response.status_code == 200
+    assert notify_schedule_change_requested(student, schedule, "Move", "") == 0
+
+    roster = client.get("/health/metrics").get_json()["admin_roster"]
+    assert roster["invalidations"] == 2
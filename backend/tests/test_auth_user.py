@@ -428,3 +428,24 @@ def test_seed_admin_rotates_password_when_requested(app, create_user):
         admin_user = User.query.filter_by(email="rotate-admin@example.com").first()
         assert admin_user is not None
         assert pbkdf2_sha256.verify("NewPassword123!", admin_user.password)
+
+
+def test_admin_user_list_supports_cursor_pagination_by_name(client, create_user, auth_headers):
+    admin = create_user(role="admin")
+    create_user(first_name="Cara", last_name="Zed")
+    create_user(first_name="Ada", last_name="Young")
+    create_user(first_name="Ada", last_name="Bloom")
+
+    first_page = client.get("/users?cursor=&page_size=2", headers=auth_headers(admin)).get_json()
+    assert [(item["first_name"], item["last_name"]) for item in first_page["data"]] == [
+        ("Ada", "Bloom"),
+        ("Ada", "Young"),
+    ]
+
+    second_page = client.get(
+        "/users",
+        query_string={"cursor": first_page["pagination"]["next_cursor"], "page_size": 2},
+        headers=auth_headers(admin),
+    ).get_json()
+    assert [item["first_name"] for item in second_page["data"]] == ["Cara"]
+    assert second_page["pagination"]["next_cursor"] is None
@@ -159,8 +159,8 @@ def test_review_list_includes_author_profile_fields(
     assert list_response.status_code == 200
 
     payload = list_response.get_json()
-    assert len(payload) == 1
-    review = payload[0]
+    assert len(payload["data"]) == 1
+    review = payload["data"][0]
 
     assert review["author"]["id"] == student.id
     assert review["author"]["initials"] == student.initials
@@ -189,7 +189,95 @@ def test_review_list_is_public(client, create_course):
     course = create_course()
     response = client.get(f"/courses/{course.id}/reviews/")
     assert response.status_code == 200
-    assert response.get_json() == []
+    payload = response.get_json()
+    assert payload["data"] == []
+    assert payload["rating_histogram"] == {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
+
+
+def test_review_list_is_cursor_paginated_with_histogram(
+    client,
+    create_user,
+    create_course,
+    count_queries,
+):
+    from datetime import datetime, timedelta
+
+    from db import db
+    from models import Review
+
+    course_id = create_course().id
+    author_ids = [create_user(role="student").id for _ in range(3)]
+    base_time = datetime(2026, 1, 1, 9, 0, 0)
+    for index, rating in enumerate([5, 5, 4, 1, 5]):
+        review = Review()
+        review.course_id = course_id
+        review.user_id = author_ids[index] if index < len(author_ids) else None
+        review.rating = rating
+        review.comment = f"Review {index}"
+        review.created_at = base_time + timedelta(minutes=index)
+        db.session.add(review)
+    db.session.commit()
+    db.session.expunge_all()
+
+    with count_queries() as statements:
+        first_page = client.get(f"/courses/{course_id}/reviews/?cursor=&page_size=2").get_json()
+    # Count, page, one batched author load, and the histogram.
+    assert len(statements) == 4
+
+    assert [item["comment"] for item in first_page["data"]] == ["Review 4", "Review 3"]
+    assert first_page["pagination"]["total"] == 5
+    assert first_page["rating_histogram"] == {"1": 1, "2": 0, "3": 0, "4": 1, "5": 3}
+
+    second_page = client.get(
+        f"/courses/{course_id}/reviews/",
+        query_string={"cursor": first_page["pagination"]["next_cursor"], "page_size": 2},
+    ).get_json()
+    assert [item["comment"] for item in second_page["data"]] == ["Review 2", "Review 1"]
+    assert second_page["data"][0]["author"]["id"] == author_ids[2]
+    assert second_page["pagination"]["prev_cursor"] is not None
+
+
+def test_own_review_lookup_finds_a_review_beyond_the_first_page(
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    auth_headers,
+):
+    from db import db
+    from models import Review
+
+    author = create_user(role="student")
+    newcomer = create_user(role="student")
+    course = create_course()
+    create_enrollment(author.id, course.id)
+    create_enrollment(newcomer.id, course.id)
+
+    response = client.post(
+        f"/courses/{course.id}/reviews/",
+        json={"rating": 4, "comment": "Early review"},
+        headers=auth_headers(author),
+    )
+    assert response.status_code == 201
+    review_id = response.get_json()["id"]
+    for _ in range(25):
+        other = create_user(role="student")
+        db.session.add(Review(user_id=other.id, course_id=course.id, rating=5, comment="Later"))
+    db.session.commit()
+
+    first_page = client.get(f"/courses/{course.id}/reviews/").get_json()["data"]
+    assert review_id not in {review["id"] for review in first_page}
+
+    response = client.get(f"/courses/{course.id}/reviews/mine", headers=auth_headers(author))
+    assert response.status_code == 200
+    assert response.get_json()["review"]["id"] == review_id
+    assert response.get_json()["review"]["comment"] == "Early review"
+
+    response = client.get(f"/courses/{course.id}/reviews/mine", headers=auth_headers(newcomer))
+    assert response.status_code == 200
+    assert response.get_json() == {"review": None}
+
+    assert client.get(f"/courses/{course.id}/reviews/mine").status_code == 401
 
 
 def test_admin_can_reply_to_review_as_tutor(
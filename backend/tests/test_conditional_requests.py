@@ -0,0 +1,179 @@
+from datetime import date, timedelta
+
+
+def test_catalog_revalidation_returns_304_until_course_changes(
+    client, create_user, create_course, auth_headers, count_queries
+):
+    admin = create_user(role="admin")
+    course = create_course(title="Versioned Course")
+
+    first = client.get("/courses/?page_size=5")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert "Last-Modified" not in first.headers
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    with count_queries() as statements:
+        not_modified = client.get("/courses/?page_size=5", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    assert not_modified.headers["ETag"] == etag
+    assert len(statements) == 1
+
+    # A date cannot reflect deleted rows, so If-Modified-Since alone never gets a 304.
+    by_date = client.get(
+        "/courses/?page_size=5",
+        headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+    )
+    assert by_date.status_code == 200
+
+    # Different query strings carry different validators.
+    assert client.get("/courses/?page_size=6").headers["ETag"] != etag
+
+    update_response = client.put(
+        f"/courses/{course.id}",
+        data={"title": "Renamed Versioned Course"},
+        headers=auth_headers(admin, fresh=True),
+        content_type="multipart/form-data",
+    )
+    assert update_response.status_code == 200
+
+    refreshed = client.get("/courses/?page_size=5", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+    assert refreshed.get_json()["data"][0]["title"] == "Renamed Versioned Course"
+
+
+def test_deleting_an_older_course_invalidates_catalog_validators(client, create_user, create_course, auth_headers):
+    admin = create_user(role="admin")
+    older = create_course(title="Older Course")
+    create_course(title="Newer Course")
+
+    first = client.get("/courses/")
+    assert first.get_json()["pagination"]["total"] == 2
+
+    response = client.delete(f"/courses/{older.id}", headers=auth_headers(admin, fresh=True))
+    assert response.status_code == 200
+
+    # max(updated_at) is unchanged, but the ETag also carries the row count.
+    refreshed = client.get("/courses/", headers={"If-None-Match": first.headers["ETag"]})
+    assert refreshed.status_code == 200
+    assert [course["title"] for course in refreshed.get_json()["data"]] == ["Newer Course"]
+
+
+def test_course_detail_etag_tracks_reviews_and_missing_courses_still_404(
+    client, create_user, create_course, create_enrollment, auth_headers
+):
+    student = create_user(role="student")
+    admin = create_user(role="admin")
+    course = create_course()
+    create_enrollment(student.id, course.id)
+
+    etag = client.get(f"/courses/{course.id}").headers["ETag"]
+    assert client.get(f"/courses/{course.id}", headers={"If-None-Match": etag}).status_code == 304
+
+    review_response = client.post(
+        f"/courses/{course.id}/reviews/",
+        json={"rating": 4, "comment": "Good"},
+        headers=auth_headers(student),
+    )
+    review_id = review_response.get_json()["id"]
+    after_review = client.get(f"/courses/{course.id}", headers={"If-None-Match": etag})
+    assert after_review.status_code == 200
+    assert after_review.get_json()["average_rating"] == 4.0
+
+    client.put(
+        f"/courses/{course.id}/reviews/{review_id}/reply",
+        json={"tutor_reply": "Thanks"},
+        headers=auth_headers(admin),
+    )
+    after_reply = client.get(
+        f"/courses/{course.id}",
+        headers={"If-None-Match": after_review.headers["ETag"]},
+    )
+    assert after_reply.status_code == 200
+    assert after_reply.get_json()["reviews"][0]["tutor_reply"] == "Thanks"
+
+    missing = client.get("/courses/9999", headers={"If-None-Match": "*"})
+    assert missing.status_code == 404
+
+
+def test_public_availability_etag_changes_when_slots_are_replaced(client, create_user, auth_headers):
+    admin = create_user(role="admin")
+    student = create_user(role="student")
+
+    def _upsert(start_time, end_time):
+        response = client.post(
+            "/availability/",
+            json={
+                "month_start": 2,
+                "month_end": 3,
+                "availability": [
+                    {"day_of_week": 1, "time_slots": [{"start_time": start_time, "end_time": end_time}]},
+                ],
+                "unavailable_dates": [date(2026, 2, 18).isoformat()],
+            },
+            headers=auth_headers(admin),
+        )
+        assert response.status_code == 201
+
+    _upsert("09:00:00", "10:00:00")
+    first = client.get("/availability/public", headers=auth_headers(student))
+    etag = first.headers["ETag"]
+    assert "private" in first.headers["Cache-Control"]
+
+    revalidated = client.get("/availability/public", headers={**auth_headers(student), "If-None-Match": etag})
+    assert revalidated.status_code == 304
+
+    _upsert("11:00:00", "12:00:00")
+    changed = client.get("/availability/public", headers={**auth_headers(student), "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.get_json()["availability"][0]["time_slots"][0]["start_time"] == "11:00:00"
+
+
+def test_private_validators_are_scoped_to_the_caller(
+    client, create_user, create_course, create_enrollment, create_schedule, auth_headers
+):
+    student = create_user(role="student")
+    other_student = create_user(role="student")
+    course = create_course()
+    enrollment = create_enrollment(student.id, course.id)
+    other_enrollment = create_enrollment(other_student.id, course.id)
+    create_schedule(enrollment.id)
+
+    settings_etag = client.get("/notification-settings/me", headers=auth_headers(student)).headers["ETag"]
+    other_settings = client.get(
+        "/notification-settings/me",
+        headers={**auth_headers(other_student), "If-None-Match": settings_etag},
+    )
+    assert other_settings.status_code == 200
+
+    upsert_response = client.post(
+        "/notification-settings/",
+        json={"user_id": student.id, "notify_on_new_course": False},
+        headers=auth_headers(student),
+    )
+    assert upsert_response.status_code == 200
+    updated_settings = client.get(
+        "/notification-settings/me",
+        headers={**auth_headers(student), "If-None-Match": settings_etag},
+    )
+    assert updated_settings.status_code == 200
+    assert updated_settings.get_json()["notify_on_new_course"] is False
+
+    schedules_etag = client.get("/enrollments/schedules", headers=auth_headers(student)).headers["ETag"]
+    create_schedule(other_enrollment.id)
+    unaffected = client.get(
+        "/enrollments/schedules",
+        headers={**auth_headers(student), "If-None-Match": schedules_etag},
+    )
+    assert unaffected.status_code == 304
+
+    create_schedule(enrollment.id, date=date.today() + timedelta(days=30))
+    affected = client.get(
+        "/enrollments/schedules",
+        headers={**auth_headers(student), "If-None-Match": schedules_etag},
+    )
+    assert affected.status_code == 200
+    assert len(affected.get_json()) == 2
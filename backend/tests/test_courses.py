@@ -1,6 +1,7 @@
 from datetime import date, time
 
 from db import db
+from models import SavedCourse
 from models.notification import EmailNotificationSettings
 
 
@@ -15,6 +16,24 @@ def test_list_courses_is_public(client, create_course):
     assert len(payload["data"]) == 2
 
 
+def test_list_courses_treats_expired_or_invalid_token_as_anonymous(app, client, create_user, create_course):
+    from datetime import timedelta
+
+    from flask_jwt_extended import create_access_token
+
+    create_course(title="Course A")
+    student = create_user()
+    with app.app_context():
+        expired = create_access_token(identity=student.id, expires_delta=timedelta(seconds=-60))
+
+    for token in (expired, "not-a-jwt"):
+        response = client.get("/courses/", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        payload = response.get_json()
+        assert payload["pagination"]["total"] == 1
+        assert not payload["data"][0].get("is_saved")
+
+
 def test_admin_can_create_course_with_multipart(client, create_user, auth_headers):
     admin = create_user(role="admin")
 
@@ -202,12 +221,9 @@ def test_new_course_notification_respects_student_settings(
     app,
     create_user,
     auth_headers,
-    monkeypatch,
 ):
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(notifications_module, "queue_email", lambda to_email, subject, body: queued.append((to_email, subject, body)))
+    from models import EmailBroadcast, EmailNotification
+    from utils.jobs import process_pending_jobs
 
     admin = create_user(role="admin", email="admin-course-notify@example.com")
     student_opt_in = create_user(role="student", email="student-opt-in@example.com")
@@ -232,6 +248,377 @@ def test_new_course_notification_respects_student_settings(
     )
 
     assert response.status_code == 201
-    queued_emails = [entry[0] for entry in queued]
+    # The fan-out runs in the background job, not in the request.
+    assert EmailBroadcast.query.count() == 0
+    assert process_pending_jobs() == 1
+
+    broadcast = EmailBroadcast.query.one()
+    assert "InsideOut Fresh Course" in broadcast.body
+    queued = EmailNotification.query.filter_by(broadcast_id=broadcast.id).all()
+    queued_emails = [email.to_email for email in queued]
     assert student_opt_in.email in queued_emails
     assert student_opt_out.email not in queued_emails
+    assert admin.email not in queued_emails
+    assert queued[0].substitutions == {"-first_name-": student_opt_in.first_name}
+
+
+def test_new_course_fan_out_streams_students_in_chunks(app, create_user, create_course, count_queries):
+    from models import EmailBroadcast, EmailNotification
+    from utils.notifications import enqueue_new_course_announcement
+    from utils.jobs import process_pending_jobs
+
+    app.config["EMAIL_BROADCAST_FANOUT_CHUNK_SIZE"] = 4
+    students = [create_user(role="student", email=f"fan-out-{index}@example.com") for index in range(10)]
+    opted_out = students[3]
+    settings = EmailNotificationSettings()
+    settings.user_id = opted_out.id
+    settings.notify_on_new_course = False
+    db.session.add(settings)
+    course = create_course(title="Streamed Course")
+    enqueue_new_course_announcement(course)
+    db.session.commit()
+
+    with count_queries() as statements:
+        assert process_pending_jobs() == 1
+
+    recipient_inserts = [
+        statement for statement in statements
+        if statement.lstrip().upper().startswith("INSERT INTO EMAIL_NOTIFICATIONS")
+    ]
+    # 9 opted-in students in chunks of 4; settings are joined, not lazy-loaded per student.
+    assert len(recipient_inserts) == 3
+    assert not [statement for statement in statements if "FROM email_notification_settings" in statement]
+
+    broadcast = EmailBroadcast.query.one()
+    assert broadcast.recipient_count == 9
+    recipients = {email.to_email for email in EmailNotification.query.filter_by(broadcast_id=broadcast.id)}
+    assert opted_out.email not in recipients
+    assert len(recipients) == 9
+
+
+def test_new_course_announcement_retry_does_not_queue_a_second_broadcast(app, create_user, create_course):
+    from models import EmailBroadcast, EmailNotification
+    from utils.jobs import process_pending_jobs
+    from utils.notifications import _announce_new_course, enqueue_new_course_announcement
+
+    for index in range(3):
+        create_user(role="student", email=f"announce-once-{index}@example.com")
+    course = create_course(title="Announced Once")
+    enqueue_new_course_announcement(course)
+    db.session.commit()
+    assert process_pending_jobs() == 1
+
+    # A retry after the broadcast committed, e.g. the job-status commit failed
+    # or the claim expired mid-run, finds the course's broadcast and stops.
+    _announce_new_course({"course_id": course.id})
+
+    broadcast = EmailBroadcast.query.one()
+    assert broadcast.reference_key == f"course-published:{course.id}"
+    assert EmailNotification.query.filter_by(broadcast_id=broadcast.id).count() == 3
+
+
+def test_new_course_broadcast_escapes_title_and_substitution_values(app, create_user, create_course):
+    from models import EmailBroadcast, EmailNotification
+    from utils.notifications import notify_new_course_published
+
+    create_user(role="student", email="fan-out-escape@example.com", first_name="<b>Eve</b>")
+    course = create_course(title="<script>alert(1)</script> Python")
+
+    assert notify_new_course_published(course.title) == 1
+
+    broadcast = EmailBroadcast.query.one()
+    assert "<script>" not in broadcast.body
+    assert "&lt;script&gt;alert(1)&lt;/script&gt; Python" in broadcast.body
+    assert "-first_name-" in broadcast.body
+    recipient = EmailNotification.query.filter_by(broadcast_id=broadcast.id).one()
+    assert recipient.substitutions == {"-first_name-": "&lt;b&gt;Eve&lt;/b&gt;"}
+
+
+def _add_anonymous_reviews(course, ratings):
+    from models import Review
+
+    for rating in ratings:
+        review = Review()
+        review.course_id = course.id
+        review.rating = rating
+        review.comment = "Anonymous review"
+        db.session.add(review)
+    db.session.commit()
+
+
+def test_course_list_query_count_is_constant_regardless_of_review_volume(
+    client,
+    app,
+    create_course,
+    count_queries,
+):
+    from utils.ratings import recompute_course_ratings
+    from utils.response_cache import invalidate_response_cache
+
+    sparse_courses = [create_course(title=f"Sparse {index}") for index in range(3)]
+    for course in sparse_courses:
+        _add_anonymous_reviews(course, [5])
+    recompute_course_ratings()
+    db.session.commit()
+
+    with count_queries() as sparse_statements:
+        sparse_response = client.get("/courses/?page_size=10")
+    assert sparse_response.status_code == 200
+
+    dense_courses = [create_course(title=f"Dense {index}") for index in range(3)]
+    for course in dense_courses:
+        _add_anonymous_reviews(course, [1, 2, 3, 4, 5] * 10)
+    recompute_course_ratings()
+    db.session.commit()
+    invalidate_response_cache("catalog")
+
+    with count_queries() as dense_statements:
+        dense_response = client.get("/courses/?page_size=10")
+    assert dense_response.status_code == 200
+
+    assert len(dense_response.get_json()["data"]) == 6
+    assert len(dense_statements) == len(sparse_statements)
+    assert not any("FROM reviews" in statement for statement in dense_statements)
+
+
+def test_course_detail_loads_in_fixed_statement_count(client, create_user, create_course, count_queries):
+    from datetime import datetime, timedelta
+
+    from models import Review
+
+    course = create_course(title="Detail Course")
+    empty_course = create_course(title="Empty Detail Course")
+    course_id, empty_course_id = course.id, empty_course.id
+    _add_anonymous_reviews(course, [1] * 20)
+
+    authors = [create_user(first_name=f"Author{index}") for index in range(4)]
+    newer_than_anonymous = datetime.now() + timedelta(days=1)
+    for index, author in enumerate(authors):
+        review = Review()
+        review.course_id = course_id
+        review.user_id = author.id
+        review.rating = index + 2
+        review.comment = f"Review {index}"
+        review.created_at = newer_than_anonymous + timedelta(hours=index)
+        db.session.add(review)
+    db.session.commit()
+    db.session.expunge_all()
+
+    with count_queries() as statements:
+        response = client.get(f"/courses/{course_id}")
+    assert response.status_code == 200
+
+    # One conditional-GET version probe plus one detail loader statement.
+    assert len(statements) == 2
+    assert not any(statement.lstrip().startswith("SELECT reviews.") for statement in statements)
+    assert not any(statement.lstrip().startswith("SELECT users.") for statement in statements)
+
+    payload = response.get_json()
+    assert payload["title"] == "Detail Course"
+    assert [review["author"]["first_name"] for review in payload["reviews"]] == ["Author3", "Author2", "Author1"]
+
+    empty_response = client.get(f"/courses/{empty_course_id}")
+    assert empty_response.status_code == 200
+    assert empty_response.get_json()["reviews"] == []
+    assert client.get("/courses/9999").status_code == 404
+
+
+def test_review_create_updates_course_rating_aggregates(
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    auth_headers,
+):
+    first_student = create_user(role="student")
+    second_student = create_user(role="student")
+    course = create_course()
+    create_enrollment(first_student.id, course.id)
+    create_enrollment(second_student.id, course.id)
+
+    for student, rating in ((first_student, 5), (second_student, 2)):
+        response = client.post(
+            f"/courses/{course.id}/reviews/",
+            json={"rating": rating, "comment": "Rated"},
+            headers=auth_headers(student),
+        )
+        assert response.status_code == 201
+
+    db.session.refresh(course)
+    assert course.rating_sum == 7
+    assert course.rating_count == 2
+
+    list_response = client.get("/courses/")
+    assert list_response.get_json()["data"][0]["average_rating"] == 3.5
+
+
+def test_repair_course_ratings_cli_backfills_aggregates(app, create_course):
+    course = create_course()
+    _add_anonymous_reviews(course, [4, 5])
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["repair-course-ratings"])
+
+    assert result.exit_code == 0
+    assert "1 course(s) updated" in result.output
+
+    db.session.refresh(course)
+    assert course.rating_sum == 9
+    assert course.rating_count == 2
+    assert course.average_rating == 4.5
+
+
+def test_course_search_falls_back_to_ilike_without_index(client, create_course):
+    create_course(title="Watercolour Basics", description="Paint with light washes")
+    create_course(title="Pottery", description="Throwing on the wheel")
+
+    response = client.get("/courses/?search=washes")
+
+    assert response.status_code == 200
+    titles = [item["title"] for item in response.get_json()["data"]]
+    assert titles == ["Watercolour Basics"]
+
+
+def test_course_search_uses_fts_index_with_ranking_and_prefix(
+    client,
+    app,
+    create_user,
+    create_course,
+    auth_headers,
+):
+    from utils.course_search import SqliteCourseSearch, get_course_search, rebuild_course_search_index
+
+    create_course(title="Gardening", description="Includes a short module on python care for pets")
+    create_course(title="Python Foundations", description="Start programming from scratch")
+    rebuild_course_search_index()
+    db.session.commit()
+
+    assert isinstance(get_course_search(), SqliteCourseSearch)
+
+    admin = create_user(role="admin")
+    create_response = client.post(
+        "/courses/",
+        data={"title": "Pythonic Patterns", "description": "Idioms for experienced developers", "price": "20.00"},
+        headers=auth_headers(admin, fresh=True),
+        content_type="multipart/form-data",
+    )
+    assert create_response.status_code == 201
+
+    response = client.get("/courses/?search=pyth")
+
+    assert response.status_code == 200
+    titles = [item["title"] for item in response.get_json()["data"]]
+    assert set(titles) == {"Gardening", "Python Foundations", "Pythonic Patterns"}
+    assert titles[-1] == "Gardening"
+
+    course_id = create_response.get_json()["id"]
+    client.put(
+        f"/courses/{course_id}",
+        data={"title": "Design Patterns"},
+        headers=auth_headers(admin, fresh=True),
+        content_type="multipart/form-data",
+    )
+    renamed_response = client.get("/courses/?search=pythonic")
+    assert renamed_response.get_json()["pagination"]["total"] == 0
+
+
+def test_authenticated_catalog_annotates_saved_and_enrolled_courses_in_one_query(
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    auth_headers,
+    count_queries,
+):
+    student = create_user(role="student")
+    saved_course = create_course(title="Saved Course")
+    active_course = create_course(title="Active Course")
+    cancelled_course = create_course(title="Cancelled Course")
+    create_course(title="Plain Course")
+    db.session.add(SavedCourse(user_id=student.id, course_id=saved_course.id))
+    db.session.commit()
+    create_enrollment(student.id, active_course.id, status="active")
+    create_enrollment(student.id, cancelled_course.id, status="cancelled")
+    headers = auth_headers(student)
+
+    anonymous_item = client.get("/courses/?page_size=10").get_json()["data"][0]
+    assert "is_saved" not in anonymous_item
+
+    with count_queries() as small_page_statements:
+        small_page = client.get("/courses/?page_size=2", headers=headers)
+    with count_queries() as full_page_statements:
+        full_page = client.get("/courses/?page_size=10", headers=headers)
+    assert small_page.status_code == 200
+    assert len(full_page_statements) == len(small_page_statements)
+
+    annotations = {
+        item["title"]: (item["is_saved"], item["is_enrolled"], item["enrollment_status"])
+        for item in full_page.get_json()["data"]
+    }
+    assert annotations == {
+        "Saved Course": (True, False, None),
+        "Active Course": (False, True, "active"),
+        "Cancelled Course": (False, False, "cancelled"),
+        "Plain Course": (False, False, None),
+    }
+
+    # Saving a course changes the caller's catalog validator.
+    etag = full_page.headers["ETag"]
+    save_response = client.post(f"/courses/{active_course.id}/save", headers=headers)
+    assert save_response.status_code == 201
+    refreshed = client.get("/courses/?page_size=10", headers={**headers, "If-None-Match": etag})
+    assert refreshed.status_code == 200
+
+
+def test_course_list_cursor_pagination_walks_forward_and_back(client, create_course, count_queries):
+    from datetime import datetime
+
+    shared_timestamp = datetime(2026, 1, 1, 12, 0, 0)
+    created = [create_course(title=f"Cursor {index}", created_at=shared_timestamp) for index in range(5)]
+    expected_ids = [course.id for course in sorted(created, key=lambda course: course.id, reverse=True)]
+
+    first_page = client.get("/courses/?cursor=&page_size=2").get_json()
+    assert [item["id"] for item in first_page["data"]] == expected_ids[:2]
+    assert first_page["pagination"]["total"] == 5
+    assert first_page["pagination"]["prev_cursor"] is None
+    assert "page" not in first_page["pagination"]
+
+    with count_queries() as statements:
+        second_response = client.get(
+            "/courses/",
+            query_string={"cursor": first_page["pagination"]["next_cursor"], "page_size": 2, "with_total": "false"},
+        )
+    second_page = second_response.get_json()
+    assert [item["id"] for item in second_page["data"]] == expected_ids[2:4]
+    assert second_page["pagination"]["total"] is None
+    # Only the conditional-GET version probe may count; the page query is never wrapped in a COUNT.
+    assert not any("count(*) as count_1 \nfrom (select" in statement.lower() for statement in statements)
+
+    third_page = client.get(
+        "/courses/",
+        query_string={"cursor": second_page["pagination"]["next_cursor"], "page_size": 2},
+    ).get_json()
+    assert [item["id"] for item in third_page["data"]] == expected_ids[4:]
+    assert third_page["pagination"]["next_cursor"] is None
+
+    back_page = client.get(
+        "/courses/",
+        query_string={"cursor": third_page["pagination"]["prev_cursor"], "page_size": 2},
+    ).get_json()
+    assert [item["id"] for item in back_page["data"]] == expected_ids[2:4]
+
+
+def test_course_list_rejects_tampered_cursor(client, create_course):
+    create_course()
+
+    response = client.get("/courses/?cursor=not-a-real-cursor")
+
+    assert response.status_code == 400
+
+
+def test_course_list_offset_pagination_shape_is_unchanged(client, create_course):
+    create_course()
+
+    payload = client.get("/courses/?page=1&page_size=5").get_json()
+
+    assert payload["pagination"] == {"page": 1, "page_size": 5, "total": 1, "total_pages": 1}
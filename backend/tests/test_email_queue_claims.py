@@ -73,4 +73,415 @@ def test_stale_claim_is_reclaimed_and_processed(app, monkeypatch):
         assert stale_claimed.status == "sent"
         assert stale_claimed.processing_claim_token is None
         assert stale_claimed.claimed_at is None
-        assert sent_to == ["stale@example.com"]
\ No newline at end of file
+        assert sent_to == ["stale@example.com"]
+
+
+def _queue(count, prefix="user", retry_count=0):
+    emails = []
+    for index in range(count):
+        email = EmailNotification()
+        email.to_email = f"{prefix}{index}@example.com"
+        email.subject = "Subject"
+        email.body = "body"
+        email.retry_count = retry_count
+        emails.append(email)
+    db.session.add_all(emails)
+    db.session.commit()
+    return [email.id for email in emails]
+
+
+def test_batch_is_sent_concurrently_and_outcomes_are_bulk_updated(app, monkeypatch, count_queries):
+    import threading
+    import time
+
+    app.config.update(
+        EMAIL_MAX_RETRIES=2,
+        EMAIL_BATCH_SIZE=20,
+        EMAIL_PROCESSING_CLAIM_TTL_SECONDS=300,
+        EMAIL_SEND_CONCURRENCY=6,
+    )
+    sender_threads = set()
+
+    def _fake_send(to_email, _subject, _body):
+        sender_threads.add(threading.get_ident())
+        time.sleep(0.1)
+        if to_email.startswith("bounce"):
+            raise RuntimeError("mailbox unavailable")
+        if to_email.startswith("timeout"):
+            raise RuntimeError("provider timeout")
+
+    monkeypatch.setattr(email_utils, "_send_via_sendgrid", _fake_send)
+
+    with app.app_context():
+        ok_ids = _queue(8, prefix="ok")
+        bounce_ids = _queue(2, prefix="bounce")
+        last_try_ids = _queue(2, prefix="timeout", retry_count=1)
+
+        started = time.perf_counter()
+        with count_queries() as statements:
+            email_utils.process_pending_emails()
+        elapsed = time.perf_counter() - started
+
+        # 12 sends of 100 ms on 6 senders take ~0.2 s instead of 1.2 s sequentially.
+        assert elapsed < 0.8
+        assert 1 < len(sender_threads) <= 6
+
+        updates = [statement for statement in statements if statement.lstrip().upper().startswith("UPDATE")]
+        # reclaim + claim + sent + one executemany for every failed row.
+        assert len(updates) == 4
+
+        db.session.expire_all()
+        rows = {email.id: email for email in EmailNotification.query.all()}
+        assert all(rows[email_id].status == "sent" and rows[email_id].sent_at for email_id in ok_ids)
+        assert all(rows[email_id].status == "pending" for email_id in bounce_ids)
+        assert all(rows[email_id].retry_count == 1 for email_id in bounce_ids)
+        assert all(rows[email_id].last_error == "mailbox unavailable" for email_id in bounce_ids)
+        assert all(rows[email_id].next_attempt_at > rows[email_id].created_at for email_id in bounce_ids)
+        assert all(rows[email_id].status == "failed" for email_id in last_try_ids)
+        assert all(rows[email_id].processing_claim_token is None for email_id in rows)
+
+
+def test_sendgrid_session_is_reused_per_sender_thread(app, monkeypatch):
+    import threading
+
+    created = []
+    posted = []
+
+    class _FakeResponse:
+        status_code = 202
+        text = ""
+
+    class _FakeSession:
+        def __init__(self):
+            self.headers = {}
+            created.append(threading.get_ident())
+
+        def post(self, url, json, timeout):
+            posted.append((url, self.headers["Authorization"], json["personalizations"][0]["to"][0]["email"]))
+            return _FakeResponse()
+
+    monkeypatch.setattr(email_utils.requests, "Session", _FakeSession)
+    app.config.update(
+        SENDGRID_API_KEY="reuse-test-key",
+        SENDGRID_API_HOST="https://sendgrid.test",
+        EMAIL_FROM="noreply@example.com",
+        EMAIL_MAX_RETRIES=3,
+        EMAIL_BATCH_SIZE=20,
+        EMAIL_PROCESSING_CLAIM_TTL_SECONDS=300,
+        EMAIL_SEND_CONCURRENCY=2,
+    )
+
+    with app.app_context():
+        _queue(10)
+        email_utils.process_pending_emails()
+
+        assert EmailNotification.query.filter_by(status="sent").count() == 10
+        # One session per sender thread, not one per message.
+        assert 1 <= len(created) <= 2
+        assert len(created) == len(set(created))
+        assert len(posted) == 10
+        assert posted[0][:2] == ("https://sendgrid.test/v3/mail/send", "Bearer reuse-test-key")
+
+
+def test_broadcast_recipients_are_sent_in_batched_personalizations(app, monkeypatch):
+    from models.notification import EmailBroadcast
+
+    requests_sent = []
+
+    class _FakeResponse:
+        status_code = 202
+        text = ""
+
+    class _FakeSession:
+        def __init__(self):
+            self.headers = {}
+
+        def post(self, url, json, timeout):
+            requests_sent.append(json)
+            if any(p["to"][0]["email"] == "student3@example.com" for p in json["personalizations"]):
+                return type("_Rejected", (), {"status_code": 400, "text": "bad request"})()
+            return _FakeResponse()
+
+    monkeypatch.setattr(email_utils.requests, "Session", _FakeSession)
+    app.config.update(
+        SENDGRID_API_KEY="broadcast-key",
+        EMAIL_FROM="noreply@example.com",
+        EMAIL_MAX_RETRIES=3,
+        EMAIL_BATCH_SIZE=2,
+        EMAIL_PROCESSING_CLAIM_TTL_SECONDS=300,
+        EMAIL_SEND_CONCURRENCY=1,
+        EMAIL_BROADCAST_BATCH_SIZE=3,
+        EMAIL_BROADCAST_CLAIM_SIZE=100,
+    )
+
+    with app.app_context():
+        broadcast = email_utils.queue_broadcast(
+            "New course available",
+            "<p>Hi -first_name-,</p>",
+            ((f"student{index}@example.com", {"-first_name-": f"Student {index}"}) for index in range(7)),
+        )
+        assert broadcast.recipient_count == 7
+        assert db.session.get(EmailBroadcast, broadcast.id).recipients.count() == 7
+
+        email_utils.process_pending_emails()
+
+        # 7 recipients at 3 per request despite EMAIL_BATCH_SIZE=2; the rejected
+        # second batch is split into [student3] and [student4, student5].
+        assert [len(payload["personalizations"]) for payload in requests_sent] == [3, 3, 1, 2, 1]
+        assert requests_sent[0]["content"][0]["value"] == "<p>Hi -first_name-,</p>"
+        assert requests_sent[0]["personalizations"][1] == {
+            "to": [{"email": "student1@example.com"}],
+            "substitutions": {"-first_name-": "Student 1"},
+        }
+
+        db.session.expire_all()
+        statuses = {
+            email.to_email: (email.status, email.retry_count)
+            for email in EmailNotification.query.filter_by(broadcast_id=broadcast.id)
+        }
+        # Only the rejected recipient is retried.
+        assert [address for address, (status, _) in statuses.items() if status == "pending"] == [
+            "student3@example.com",
+        ]
+        assert statuses["student3@example.com"] == ("pending", 1)
+        assert sum(status == "sent" for status, _ in statuses.values()) == 6
+
+
+def test_rejected_broadcast_batch_is_split_until_the_invalid_address_fails_alone(app, monkeypatch):
+    requests_sent = []
+
+    class _FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = "" if status_code < 400 else "invalid email address"
+
+    class _FakeSession:
+        def __init__(self):
+            self.headers = {}
+
+        def post(self, url, json, timeout):
+            addresses = [p["to"][0]["email"] for p in json["personalizations"]]
+            requests_sent.append(addresses)
+            return _FakeResponse(400 if "not-an-address" in addresses else 202)
+
+    monkeypatch.setattr(email_utils.requests, "Session", _FakeSession)
+    app.config.update(
+        SENDGRID_API_KEY="split-broadcast-key",
+        EMAIL_FROM="noreply@example.com",
+        EMAIL_MAX_RETRIES=1,
+        EMAIL_SEND_CONCURRENCY=1,
+        EMAIL_BROADCAST_BATCH_SIZE=1000,
+        EMAIL_BROADCAST_CLAIM_SIZE=100,
+    )
+    addresses = [f"student{index}@example.com" for index in range(8)]
+    addresses[5] = "not-an-address"
+
+    with app.app_context():
+        broadcast = email_utils.queue_broadcast("Hello", "<p>Hi</p>", ((address, {}) for address in addresses))
+        email_utils.process_pending_emails()
+
+        # 8 -> [0-3] sent, [4-7] -> [4, 5] -> [4] sent, [5] rejected; then [6, 7] sent.
+        assert [len(batch) for batch in requests_sent] == [8, 4, 4, 2, 1, 1, 2]
+        assert requests_sent[5] == ["not-an-address"]
+        db.session.expire_all()
+        statuses = {
+            email.to_email: email.status
+            for email in EmailNotification.query.filter_by(broadcast_id=broadcast.id)
+        }
+        assert statuses.pop("not-an-address") == "failed"
+        assert set(statuses.values()) == {"sent"}
+        # A rejected request is not a provider outage.
+        assert email_utils._circuit_breaker.remaining_seconds() == 0
+
+
+def test_queue_emails_bulk_inserts_once_and_skips_known_reference_keys(app, count_queries):
+    with app.app_context():
+        email_utils.queue_email("first@example.com", "Reminder", "<p>1</p>", reference_key="reminder:1")
+
+        emails = [
+            {"to_email": "first@example.com", "subject": "Reminder", "body": "<p>1</p>", "reference_key": "reminder:1"},
+            {"to_email": "second@example.com", "subject": "Reminder", "body": "<p>2</p>", "reference_key": "reminder:2"},
+            {"to_email": "second@example.com", "subject": "Reminder", "body": "<p>2</p>", "reference_key": "reminder:2"},
+            {"to_email": "third@example.com", "subject": "Hello", "body": "<p>3</p>"},
+        ]
+        with count_queries() as statements:
+            queued = email_utils.queue_emails_bulk(emails)
+
+        assert queued == 2
+        inserts = [statement for statement in statements if statement.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 1
+        assert "ON CONFLICT" in inserts[0].upper()
+        assert sorted(email.to_email for email in EmailNotification.query.all()) == [
+            "first@example.com",
+            "second@example.com",
+            "third@example.com",
+        ]
+
+        # Joining the caller's transaction: nothing is persisted until the caller commits.
+        assert email_utils.queue_emails_bulk(
+            [{"to_email": "rolled-back@example.com", "subject": "Hello", "body": "<p>4</p>"}],
+            commit=False,
+        ) == 1
+        db.session.rollback()
+        assert EmailNotification.query.filter_by(to_email="rolled-back@example.com").count() == 0
+
+
+class _ProviderSession:
+    """Fake ``requests.Session`` answering with queued ``(status, headers)`` responses."""
+
+    responses = []
+    calls = 0
+
+    def __init__(self):
+        self.headers = {}
+
+    def post(self, url, json, timeout):
+        type(self).calls += 1
+        status_code, headers = type(self).responses.pop(0) if type(self).responses else (202, {})
+        return type("_Response", (), {"status_code": status_code, "headers": headers, "text": "provider says no"})()
+
+
+def _use_provider(app, monkeypatch, responses, **config):
+    _ProviderSession.responses = list(responses)
+    _ProviderSession.calls = 0
+    monkeypatch.setattr(email_utils.requests, "Session", _ProviderSession)
+    app.config.update(
+        SENDGRID_API_KEY="backoff-key",
+        EMAIL_FROM="noreply@example.com",
+        EMAIL_MAX_RETRIES=5,
+        EMAIL_BATCH_SIZE=10,
+        EMAIL_PROCESSING_CLAIM_TTL_SECONDS=300,
+        EMAIL_SEND_CONCURRENCY=1,
+        EMAIL_RETRY_BACKOFF_BASE_SECONDS=60,
+        EMAIL_RETRY_BACKOFF_MAX_SECONDS=600,
+        **config,
+    )
+
+
+def test_failed_email_is_retried_after_jittered_exponential_backoff(app, monkeypatch):
+    _use_provider(app, monkeypatch, [(400, {}), (400, {})])
+
+    with app.app_context():
+        (email_id,) = _queue(1)
+
+        before = datetime.now(UTC).replace(tzinfo=None)
+        email_utils.process_pending_emails()
+        email = db.session.get(EmailNotification, email_id)
+        assert (email.status, email.retry_count) == ("pending", 1)
+        assert before + timedelta(seconds=30) <= email.next_attempt_at <= before + timedelta(seconds=61)
+
+        # Not due yet: the next tick leaves it alone.
+        email_utils.process_pending_emails()
+        assert _ProviderSession.calls == 1
+
+        email.next_attempt_at = before
+        db.session.commit()
+        before = datetime.now(UTC).replace(tzinfo=None)
+        email_utils.process_pending_emails()
+        db.session.expire_all()
+        email = db.session.get(EmailNotification, email_id)
+        assert email.retry_count == 2
+        # Second attempt waits between half and all of 2 * base.
+        assert before + timedelta(seconds=60) <= email.next_attempt_at <= before + timedelta(seconds=121)
+
+
+def test_retry_after_opens_the_circuit_and_defers_the_rest_of_the_batch(app, monkeypatch):
+    _use_provider(app, monkeypatch, [(202, {}), (429, {"Retry-After": "120"})])
+
+    with app.app_context():
+        first, throttled, *untouched = _queue(4)
+
+        before = datetime.now(UTC).replace(tzinfo=None)
+        email_utils.process_pending_emails()
+        db.session.expire_all()
+        rows = {email.id: email for email in EmailNotification.query.all()}
+
+        assert rows[first].status == "sent"
+        assert (rows[throttled].status, rows[throttled].retry_count) == ("pending", 1)
+        assert rows[throttled].next_attempt_at >= before + timedelta(seconds=119)
+        # Not attempted after the breaker opened: back to pending without spending a retry.
+        for email_id in untouched:
+            assert (rows[email_id].status, rows[email_id].retry_count) == ("pending", 0)
+            assert rows[email_id].next_attempt_at >= before + timedelta(seconds=110)
+        assert _ProviderSession.calls == 2
+
+        # While the breaker is open nothing is claimed, not even new emails.
+        _queue(1, prefix="late")
+        email_utils.process_pending_emails()
+        assert _ProviderSession.calls == 2
+        assert EmailNotification.query.filter_by(status="processing").count() == 0
+
+
+def test_consecutive_provider_errors_trip_the_circuit_breaker(app, monkeypatch):
+    _use_provider(
+        app,
+        monkeypatch,
+        [(503, {}), (502, {}), (500, {})],
+        EMAIL_CIRCUIT_BREAKER_THRESHOLD=3,
+        EMAIL_CIRCUIT_BREAKER_COOLDOWN_SECONDS=60,
+    )
+
+    with app.app_context():
+        _queue(6)
+        email_utils.process_pending_emails()
+        db.session.expire_all()
+
+        assert _ProviderSession.calls == 3
+        assert EmailNotification.query.filter_by(retry_count=1).count() == 3
+        assert EmailNotification.query.filter_by(status="pending", retry_count=0).count() == 3
+
+        email_utils.reset_circuit_breaker()
+        for email in EmailNotification.query.all():
+            email.next_attempt_at = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=1)
+        db.session.commit()
+        email_utils.process_pending_emails()
+        assert EmailNotification.query.filter_by(status="sent").count() == 6
+
+
+def test_lane_quotas_split_the_batch_by_weight_and_pass_on_unused_capacity():
+    weights = {"reminder": 8, "payment": 4, "schedule": 2, "marketing": 1}
+
+    busy = dict.fromkeys(weights, 1000)
+    assert email_utils._lane_quotas(busy, weights, 50) == {"reminder": 27, "payment": 14, "schedule": 6, "marketing": 3}
+
+    # Lanes that need less than their share hand the rest to the others.
+    assert email_utils._lane_quotas({"reminder": 2, "schedule": 1000}, weights, 50) == {"reminder": 2, "schedule": 48}
+    assert email_utils._lane_quotas({"marketing": 5}, weights, 50) == {"marketing": 5}
+    assert email_utils._lane_quotas({}, weights, 50) == {}
+
+
+def test_reminders_are_claimed_ahead_of_an_older_backlog(app, client, monkeypatch):
+    from utils.metrics import reset_timings
+
+    reset_timings()
+    sent = []
+    monkeypatch.setattr(email_utils, "_send_via_sendgrid", lambda to_email, subject, _body: sent.append(subject))
+    app.config.update(
+        EMAIL_MAX_RETRIES=3,
+        EMAIL_BATCH_SIZE=6,
+        EMAIL_SEND_CONCURRENCY=1,
+        EMAIL_LANE_WEIGHTS="reminder:4,payment:2,schedule:1,marketing:1",
+    )
+
+    with app.app_context():
+        email_utils.queue_emails_bulk(
+            {"to_email": f"backlog{index}@example.com", "subject": "Schedule", "body": "<p>1</p>"}
+            for index in range(40)
+        )
+        email_utils.queue_emails_bulk([
+            {"to_email": "student@example.com", "subject": "Reminder", "body": "<p>2</p>", "lane": "reminder"},
+            {"to_email": "payer@example.com", "subject": "Payment", "body": "<p>3</p>", "lane": "payment"},
+        ])
+        old = datetime.now(UTC).replace(tzinfo=None) - timedelta(minutes=5)
+        EmailNotification.query.filter_by(lane="schedule").update({EmailNotification.next_attempt_at: old})
+        db.session.commit()
+
+        email_utils.process_pending_emails()
+
+        assert sorted(sent) == ["Payment", "Reminder", "Schedule", "Schedule", "Schedule", "Schedule"]
+
+    lanes = client.get("/health/metrics").get_json()["email_lanes"]
+    assert lanes["email.lane.reminder.depth"] == 1
+    assert lanes["email.lane.schedule.depth"] == 40
+    assert lanes["email.lane.schedule.oldest_due_age_seconds"] >= 300
+    assert lanes["email.lane.marketing.depth"] == 0
@@ -0,0 +1,98 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from db import db
+from models.notification import EmailNotification
+from utils import email as email_utils
+
+
+def _queue(count):
+    db.session.execute(EmailNotification.__table__.delete())
+    db.session.execute(
+        EmailNotification.__table__.insert(),
+        [
+            {
+                "to_email": f"worker{index}@example.com",
+                "subject": "Parallel",
+                "body": "<p>Hello</p>",
+                "status": "pending",
+                "retry_count": 0,
+            }
+            for index in range(count)
+        ],
+    )
+    db.session.commit()
+
+
+def _drain_in_child(db_url, log_dir, send_seconds, barrier, elapsed):
+    from app import create_app
+
+    def _fake_send(to_email, _subject, _body):
+        time.sleep(send_seconds)
+        with open(os.path.join(log_dir, f"{os.getpid()}.log"), "a") as log:
+            log.write(f"{to_email}\n")
+
+    email_utils._send_via_sendgrid = _fake_send
+    worker_app = create_app(db_url=db_url)
+    worker_app.config.update(
+        EMAIL_BATCH_SIZE=4,
+        EMAIL_SEND_CONCURRENCY=1,
+        EMAIL_MAX_RETRIES=3,
+        EMAIL_PROCESSING_CLAIM_TTL_SECONDS=300,
+    )
+    with worker_app.app_context():
+        # Warm up the connection and statement caches before the clock starts.
+        EmailNotification.query.filter_by(status="pending").count()
+        barrier.wait()
+        started = time.perf_counter()
+        while EmailNotification.query.filter_by(status="pending").count():
+            email_utils.process_pending_emails()
+        elapsed.put(time.perf_counter() - started)
+
+
+def _drain_with_workers(app, tmp_path, worker_count, email_count, send_seconds):
+    _queue(email_count)
+    db.session.remove()
+
+    log_dir = tmp_path / f"sends-{worker_count}"
+    log_dir.mkdir()
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(worker_count)
+    elapsed = context.Queue()
+    workers = [
+        context.Process(
+            target=_drain_in_child,
+            args=(app.config["SQLALCHEMY_DATABASE_URI"], str(log_dir), send_seconds, barrier, elapsed),
+        )
+        for _ in range(worker_count)
+    ]
+    for worker in workers:
+        worker.start()
+    wall_seconds = max(elapsed.get(timeout=60) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=10)
+        assert worker.exitcode == 0
+
+    sends = []
+    for log_name in os.listdir(log_dir):
+        with open(log_dir / log_name) as log:
+            sends.extend(line.strip() for line in log)
+    return wall_seconds, sends, len(os.listdir(log_dir))
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_workers_send_each_email_once(app, tmp_path):
+    email_count = 48
+    send_seconds = 0.03
+
+    _, sends, active_workers = _drain_with_workers(app, tmp_path, 4, email_count, send_seconds)
+
+    assert len(sends) == email_count
+    assert len(set(sends)) == email_count
+    assert EmailNotification.query.filter_by(status="sent").count() == email_count
+    # Disjoint batches: every worker sent something. Throughput is measured by
+    # benchmarks/email_workers_benchmark.py, not asserted here.
+    assert active_workers == 4
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+import pytest
+from jinja2 import TemplateNotFound
+
+from db import db
+from models import EmailNotification
+from utils import email as email_utils
+from utils.email_templates import EMAIL_TEMPLATE_SOURCES, render_email_body
+from utils.notifications import notify_schedule_change_requested, notify_schedule_created
+
+
+def test_templates_render_the_same_html_as_before_and_escape_user_values():
+    assert render_email_body(
+        "schedule_created.student",
+        {"first_name": "Ada", "course_title": "Python", "schedule_count": 2, "first_date": "2026-04-01"},
+    ) == (
+        "<p>Hi Ada,</p>"
+        "<p>Your schedule for <strong>Python</strong> has been updated.</p>"
+        "<p>2 sessions were created starting on <strong>2026-04-01</strong>.</p>"
+    )
+    assert "1 session were created." in render_email_body(
+        "schedule_created.student",
+        {"first_name": "Ada", "course_title": "Python", "schedule_count": 1, "first_date": None},
+    )
+    assert "&lt;b&gt;Ada&lt;/b&gt;" in render_email_body(
+        "payment_confirmed.admin",
+        {"first_name": "Admin", "course_title": "Python", "student_name": "<b>Ada</b>"},
+    )
+
+    with pytest.raises(TemplateNotFound):
+        render_email_body("missing.template", {})
+    assert "meeting_reminder.student" in EMAIL_TEMPLATE_SOURCES
+
+
+def test_notifications_store_template_context_and_render_at_dispatch(
+    app, create_user, create_course, create_enrollment, create_schedule, monkeypatch
+):
+    sent = {}
+    monkeypatch.setattr(email_utils, "_send_via_sendgrid", lambda to_email, subject, body: sent.update({to_email: body}))
+    app.config.update(EMAIL_MAX_RETRIES=3, EMAIL_BATCH_SIZE=10, EMAIL_PROCESSING_CLAIM_TTL_SECONDS=300)
+
+    admin = create_user(role="admin", email="templated-admin@example.com", first_name="Grace")
+    student = create_user(email="templated-student@example.com")
+    enrollment = create_enrollment(student.id, create_course(title="Templated Course").id)
+    schedule = create_schedule(enrollment.id)
+
+    notify_schedule_change_requested(student, schedule, "Move it", "<script>alert(1)</script>")
+    notify_schedule_created(student, "Templated Course", 3, date.today() + timedelta(days=1))
+
+    rows = EmailNotification.query.order_by(EmailNotification.id.asc()).all()
+    assert [row.template_key for row in rows] == ["schedule_change_requested.admin", "schedule_created.student"]
+    assert all(row.body == "" for row in rows)
+    assert rows[0].context["comments"] == "<script>alert(1)</script>"
+
+    email_utils.process_pending_emails()
+
+    db.session.expire_all()
+    assert {row.status for row in EmailNotification.query.all()} == {"sent"}
+    assert sent[admin.email].startswith("<p>Hi Grace,</p><p>A student requested a schedule change.</p>")
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in sent[admin.email]
+    assert "<strong>Templated Course</strong> has been updated" in sent[student.email]
+    assert "3 sessions were created" in sent[student.email]
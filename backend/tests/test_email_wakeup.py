@@ -0,0 +1,116 @@
+import os
+import queue
+import threading
+
+import pytest
+from sqlalchemy import text
+
+import utils.scheduler as scheduler_module
+from app import create_app
+from db import db
+from models.notification import EmailNotification
+from utils import email as email_utils
+from utils.email_wakeup import EMAIL_WAKEUP_CHANNEL, PostgresWakeupListener, email_wakeup, signal_email_queued
+
+
+def test_dispatcher_is_woken_only_by_committed_emails(app):
+    email_wakeup.clear()
+
+    email = EmailNotification()
+    email.to_email = "rolled-back@example.com"
+    email.subject = "Rolled back"
+    email.body = "body"
+    db.session.add(email)
+    signal_email_queued()
+    db.session.rollback()
+    assert email_wakeup.wait(0) is False
+
+    email_utils.queue_email("committed@example.com", "Committed", "body")
+    assert email_wakeup.wait(0) is True
+    # The wakeup is consumed by the wait.
+    assert email_wakeup.wait(0) is False
+
+    assert email_utils.queue_emails_bulk(
+        [{"to_email": "bulk@example.com", "subject": "Bulk", "body": "body", "reference_key": "bulk-1"}]
+    ) == 1
+    assert email_wakeup.wait(0) is True
+    # A duplicate reference key inserts nothing and wakes nobody.
+    assert email_utils.queue_emails_bulk(
+        [{"to_email": "bulk@example.com", "subject": "Bulk", "body": "body", "reference_key": "bulk-1"}]
+    ) == 0
+    assert email_wakeup.wait(0) is False
+
+
+def test_queued_email_is_sent_without_waiting_for_the_idle_poll(app, monkeypatch):
+    sent = queue.Queue()
+    idle = threading.Event()
+    monkeypatch.setattr(email_utils, "_send_via_sendgrid", lambda to_email, _subject, _body: sent.put(to_email))
+    original_next_email = scheduler_module.seconds_until_next_email
+
+    def _next_email_then_idle(idle_seconds):
+        wait_seconds = original_next_email(idle_seconds)
+        idle.set()
+        return wait_seconds
+
+    monkeypatch.setattr(scheduler_module, "seconds_until_next_email", _next_email_then_idle)
+    # An hour-long idle poll: only the wakeup can get these emails sent within the test.
+    app.config.update(EMAIL_IDLE_POLL_SECONDS=3600, SCHEDULER_LEADER_LEASE_SECONDS=3600)
+    email_wakeup.clear()
+
+    dispatcher = scheduler_module.EmailDispatcher(app)
+    dispatcher.start()
+    try:
+        for index in range(3):
+            assert idle.wait(timeout=30)
+            idle.clear()
+            to_email = f"wakeup{index}@example.com"
+            email_utils.queue_email(to_email, "Wakeup", "body")
+            assert sent.get(timeout=30) == to_email
+    finally:
+        dispatcher.stop()
+        dispatcher.join(timeout=5)
+
+    assert not dispatcher.is_alive()
+    assert sent.empty()
+
+
+def test_deprecated_retry_interval_is_used_as_idle_poll_fallback(app, monkeypatch, caplog):
+    monkeypatch.delenv("EMAIL_IDLE_POLL_SECONDS", raising=False)
+    monkeypatch.setenv("EMAIL_RETRY_INTERVAL_SECONDS", "45")
+    with caplog.at_level("WARNING"):
+        legacy_app = create_app(db_url=app.config["SQLALCHEMY_DATABASE_URI"])
+    assert legacy_app.config["EMAIL_IDLE_POLL_SECONDS"] == 45
+    assert "EMAIL_RETRY_INTERVAL_SECONDS is deprecated" in caplog.text
+
+    # Once the new name is set, the old one no longer overrides it.
+    monkeypatch.setenv("EMAIL_IDLE_POLL_SECONDS", "90")
+    renamed_app = create_app(db_url=app.config["SQLALCHEMY_DATABASE_URI"])
+    assert renamed_app.config["EMAIL_IDLE_POLL_SECONDS"] == app.config["EMAIL_IDLE_POLL_SECONDS"]
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="set TEST_POSTGRES_URL to run against PostgreSQL")
+def test_postgres_listener_relays_committed_notifications_only():
+    pg_app = create_app(db_url=os.environ["TEST_POSTGRES_URL"])
+    with pg_app.app_context():
+        listener = PostgresWakeupListener(db.engine)
+        try:
+            email_wakeup.clear()
+            listener.start()
+            # The listener wakes the dispatcher once it is listening.
+            assert email_wakeup.wait(30) is True
+
+            # A NOTIFY committed by another connection, as another process would send it.
+            with db.engine.begin() as connection:
+                connection.execute(text("SELECT pg_notify(:channel, '')"), {"channel": EMAIL_WAKEUP_CHANNEL})
+            assert email_wakeup.wait(30) is True
+
+            signal_email_queued()
+            db.session.rollback()
+            # Neither the rolled-back NOTIFY nor the in-process flag wakes the dispatcher.
+            assert email_wakeup.wait(2) is False
+        finally:
+            listener.stop()
+            listener.join(timeout=30)
+            db.session.remove()
+
+    assert not listener.is_alive()
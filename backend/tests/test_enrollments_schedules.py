@@ -584,12 +584,9 @@ def test_schedule_create_skips_email_when_schedule_notifications_disabled(
     create_enrollment,
     create_schedule,
     auth_headers,
-    monkeypatch,
+    queued_emails,
 ):
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(notifications_module, "queue_email", lambda to_email, subject, body: queued.append((to_email, subject, body)))
+    queued = queued_emails
 
     admin = create_user(role="admin", email="schedule-notify-admin@example.com")
     student = create_user(email="schedule-notify-off@example.com")
@@ -629,12 +626,9 @@ def test_onboarding_schedule_creation_notifies_student_and_admin(
     create_course,
     create_enrollment,
     auth_headers,
-    monkeypatch,
+    queued_emails,
 ):
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(notifications_module, "queue_email", lambda to_email, subject, body: queued.append((to_email, subject, body)))
+    queued = queued_emails
 
     admin = create_user(role="admin", email="onboarding-notify-admin@example.com")
     student = create_user(email="onboarding-notify-student@example.com")
@@ -794,16 +788,9 @@ def test_student_can_request_schedule_change_and_admin_is_emailed(
     create_enrollment,
     create_schedule,
     auth_headers,
-    monkeypatch,
+    queued_emails,
 ):
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(
-        notifications_module,
-        "queue_email",
-        lambda to_email, subject, body, reference_key=None: queued.append((to_email, subject, body, reference_key)),
-    )
+    queued = queued_emails
 
     admin = create_user(role="admin", email="schedule-change-admin@example.com")
     student = create_user(email="schedule-change-student@example.com")
@@ -0,0 +1,175 @@
+import hashlib
+import os
+from datetime import UTC, datetime, timedelta
+from io import BytesIO
+
+import pytest
+
+from db import db
+from models import BackgroundJob, Course, MediaObject
+from utils.jobs import process_pending_jobs
+from utils.media_objects import claim_media_object, collect_unreferenced_media
+from utils.media_upload import MediaUploadService
+from utils.metrics import reset_timings, timing_snapshot
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png_bytes(color):
+    buffer = BytesIO()
+    Image.new("RGB", (800, 400), color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _upload_image(client, headers, course_id, data):
+    response = client.put(
+        f"/courses/{course_id}",
+        data={"media": (BytesIO(data), "cover.png")},
+        headers=headers,
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def _media_dir(app):
+    return os.path.join(app.config["MEDIA_LOCAL_UPLOAD_DIR"], "courses", "images")
+
+
+def test_identical_uploads_share_one_content_addressed_object(app, client, create_user, create_course, auth_headers):
+    reset_timings()
+    admin = create_user(role="admin")
+    headers = auth_headers(admin, fresh=True)
+    first_course = create_course()
+    second_course = create_course()
+    image = _png_bytes((10, 120, 200))
+    digest = hashlib.sha256(image).hexdigest()
+
+    first = _upload_image(client, headers, first_course.id, image)
+    assert first["image_url"] == f"/media/courses/images/{digest}.png"
+    assert process_pending_jobs() == 1
+
+    second = _upload_image(client, headers, second_course.id, image)
+    assert second["image_url"] == first["image_url"]
+    # Variants are copied from the first course instead of queuing another job.
+    assert [variant["width"] for variant in second["image_variants"]] == [320, 640]
+    assert BackgroundJob.query.count() == 1
+
+    assert sorted(os.listdir(_media_dir(app))) == [f"{digest}-w320.webp", f"{digest}-w640.webp", f"{digest}.png"]
+    media_object = MediaObject.query.filter_by(storage_key=f"courses/images/{digest}.png").one()
+    assert media_object.ref_count == 2
+    assert media_object.sha256 == digest
+    assert media_object.size_bytes == len(image)
+
+    # Re-saving the same file on the same course changes nothing.
+    _upload_image(client, headers, first_course.id, image)
+    db.session.expire_all()
+    assert db.session.get(MediaObject, media_object.id).ref_count == 2
+    assert timing_snapshot("media.upload.deduplicated")["media.upload.deduplicated"]["count"] == 2
+
+
+def test_unreferenced_media_is_garbage_collected_after_grace_period(
+    app, client, create_user, create_course, auth_headers
+):
+    admin = create_user(role="admin")
+    headers = auth_headers(admin, fresh=True)
+    first_course = create_course()
+    second_course = create_course()
+    shared_image = _png_bytes((200, 30, 30))
+    replacement_image = _png_bytes((30, 200, 30))
+    shared_digest = hashlib.sha256(shared_image).hexdigest()
+    replacement_digest = hashlib.sha256(replacement_image).hexdigest()
+
+    _upload_image(client, headers, first_course.id, shared_image)
+    _upload_image(client, headers, second_course.id, shared_image)
+    process_pending_jobs()
+    _upload_image(client, headers, first_course.id, replacement_image)
+    assert client.delete(f"/courses/{second_course.id}", headers=headers).status_code == 200
+
+    db.session.expire_all()
+    shared_object = MediaObject.query.filter_by(sha256=shared_digest).one()
+    assert shared_object.ref_count == 0
+    assert MediaObject.query.filter_by(sha256=replacement_digest).one().ref_count == 1
+
+    runner = app.test_cli_runner()
+    within_grace = runner.invoke(args=["gc-media"])
+    assert "deleted: 0 object(s)" in within_grace.output
+
+    dry_run = runner.invoke(args=["gc-media", "--grace-seconds", "0", "--dry-run"])
+    assert f"courses/images/{shared_digest}.png" in dry_run.output
+    assert os.path.exists(os.path.join(_media_dir(app), f"{shared_digest}.png"))
+
+    collected = runner.invoke(args=["gc-media", "--grace-seconds", "0"])
+    assert collected.exit_code == 0
+    assert "deleted: 1 object(s)" in collected.output
+
+    remaining_files = os.listdir(_media_dir(app))
+    assert not [name for name in remaining_files if name.startswith(shared_digest)]
+    assert f"{replacement_digest}.png" in remaining_files
+    assert MediaObject.query.filter_by(sha256=shared_digest).count() == 0
+    assert client.get(db.session.get(Course, first_course.id).image_url).status_code == 200
+
+
+def _idle_shared_image(app, client, headers, create_course):
+    """Upload an image, replace it, and age its unreferenced row past a one-hour grace period."""
+    course = create_course()
+    image = _png_bytes((90, 90, 200))
+    digest = hashlib.sha256(image).hexdigest()
+    _upload_image(client, headers, course.id, image)
+    _upload_image(client, headers, course.id, _png_bytes((200, 200, 90)))
+
+    media_object = MediaObject.query.filter_by(sha256=digest).one()
+    assert media_object.ref_count == 0
+    media_object.updated_at = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=2)
+    db.session.commit()
+    return image, digest
+
+
+def test_gc_between_dedup_hit_and_attach_keeps_the_claimed_object(
+    app, client, create_user, create_course, auth_headers, monkeypatch
+):
+    headers = auth_headers(create_user(role="admin"), fresh=True)
+    image, digest = _idle_shared_image(app, client, headers, create_course)
+    media_service = MediaUploadService.from_app(app)
+    collected = []
+
+    original_store = MediaUploadService.store_course_media
+
+    def _store_then_collect(self, file_storage, **kwargs):
+        stored = original_store(self, file_storage, **kwargs)
+        # gc-media runs after the dedup hit but before the course is attached and committed.
+        collected.extend(collect_unreferenced_media(media_service, grace_seconds=3600))
+        return stored
+
+    monkeypatch.setattr(MediaUploadService, "store_course_media", _store_then_collect)
+    course = create_course()
+    assert _upload_image(client, headers, course.id, image)["image_url"] == f"/media/courses/images/{digest}.png"
+
+    assert collected == []
+    assert os.path.exists(os.path.join(_media_dir(app), f"{digest}.png"))
+    db.session.expire_all()
+    assert MediaObject.query.filter_by(sha256=digest).one().ref_count == 1
+
+
+def test_dedup_hit_losing_to_gc_stores_the_upload_again(
+    app, client, create_user, create_course, auth_headers, monkeypatch
+):
+    import resources.course as course_resource
+
+    headers = auth_headers(create_user(role="admin"), fresh=True)
+    image, digest = _idle_shared_image(app, client, headers, create_course)
+    media_service = MediaUploadService.from_app(app)
+
+    def _collect_then_claim(storage_key):
+        # gc-media deletes the object after the upload saw it stored but before it was claimed.
+        assert collect_unreferenced_media(media_service, grace_seconds=3600) == [storage_key]
+        return claim_media_object(storage_key)
+
+    monkeypatch.setattr(course_resource, "claim_media_object", _collect_then_claim)
+    course = create_course()
+    _upload_image(client, headers, course.id, image)
+
+    assert os.path.exists(os.path.join(_media_dir(app), f"{digest}.png"))
+    db.session.expire_all()
+    assert MediaObject.query.filter_by(sha256=digest).one().ref_count == 1
+    assert client.get(db.session.get(Course, course.id).image_url).status_code == 200
@@ -0,0 +1,138 @@
+from io import BytesIO
+
+import pytest
+
+from db import db
+from models import BackgroundJob, Course
+from utils.jobs import enqueue_job, job_handler, process_pending_jobs
+from utils.media_derivatives import IMAGE_VARIANTS_JOB, VIDEO_POSTER_JOB
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png_upload(width, height, name="cover.png"):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color=(200, 80, 40)).save(buffer, format="PNG")
+    buffer.seek(0)
+    return buffer, name
+
+
+def test_course_image_upload_returns_before_variants_are_built(app, client, create_user, auth_headers):
+    admin = create_user(role="admin")
+
+    response = client.post(
+        "/courses/",
+        data={
+            "title": "Responsive Images",
+            "description": "Variants are built later",
+            "price": "10.00",
+            "media": _png_upload(1600, 800),
+        },
+        headers=auth_headers(admin, fresh=True),
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 201
+    payload = response.get_json()
+    assert payload["image_url"].startswith("/media/courses/images/")
+    assert payload.get("image_variants") is None
+
+    job = BackgroundJob.query.filter_by(kind=IMAGE_VARIANTS_JOB).one()
+    assert job.status == "pending"
+
+    # The variants job plus the new-course announcement.
+    assert process_pending_jobs() == 2
+    db.session.expire_all()
+    assert db.session.get(BackgroundJob, job.id).status == "succeeded"
+
+    course = db.session.get(Course, payload["id"])
+    assert [variant["width"] for variant in course.image_variants] == [320, 640, 1280]
+    assert course.image_variants[0]["height"] == 160
+
+    variant_response = client.get(course.image_variants[0]["url"])
+    assert variant_response.status_code == 200
+    with Image.open(BytesIO(variant_response.data)) as variant:
+        assert variant.format == "WEBP"
+        assert variant.size == (320, 160)
+
+    catalog_item = client.get("/courses/").get_json()["data"][0]
+    assert catalog_item["image_variants"] == course.image_variants
+
+
+def test_small_images_are_not_upscaled_and_replaced_uploads_skip_stale_jobs(
+    app, client, create_user, create_course, auth_headers
+):
+    admin = create_user(role="admin")
+    course = create_course()
+
+    def _upload(size):
+        response = client.put(
+            f"/courses/{course.id}",
+            data={"media": _png_upload(*size)},
+            headers=auth_headers(admin, fresh=True),
+            content_type="multipart/form-data",
+        )
+        assert response.status_code == 200
+        return response.get_json()["image_url"]
+
+    _upload((400, 300))
+    latest_url = _upload((200, 100))
+
+    assert process_pending_jobs() == 2
+    db.session.expire_all()
+
+    refreshed = db.session.get(Course, course.id)
+    assert refreshed.image_url == latest_url
+    assert refreshed.image_variants == [
+        {"width": 200, "height": 100, "url": refreshed.image_variants[0]["url"]},
+    ]
+    assert {job.status for job in BackgroundJob.query.all()} == {"succeeded"}
+
+
+def test_video_poster_is_skipped_without_ffmpeg(app, create_course, monkeypatch):
+    monkeypatch.setattr("utils.media_derivatives._ffmpeg_binary", lambda: None)
+    course = create_course(preview_video_url="/media/courses/videos/clip.mp4")
+    enqueue_job(
+        VIDEO_POSTER_JOB,
+        {"course_id": course.id, "storage_key": "courses/videos/clip.mp4", "url": course.preview_video_url},
+    )
+    db.session.commit()
+
+    assert process_pending_jobs() == 1
+    db.session.expire_all()
+    assert BackgroundJob.query.one().status == "succeeded"
+    assert db.session.get(Course, course.id).preview_poster_url is None
+
+
+def test_failed_jobs_are_retried_with_delay_then_marked_failed(app):
+    from datetime import timedelta
+
+    calls = []
+
+    @job_handler("tests.always_fails")
+    def _always_fails(payload):
+        calls.append(payload)
+        raise RuntimeError("boom")
+
+    app.config["BACKGROUND_JOB_MAX_ATTEMPTS"] = 2
+    job = enqueue_job("tests.always_fails", {"value": 1})
+    db.session.commit()
+    job_id = job.id
+
+    assert process_pending_jobs() == 1
+    db.session.expire_all()
+    job = db.session.get(BackgroundJob, job_id)
+    assert job.status == "pending"
+    assert job.attempts == 1
+    assert job.last_error == "boom"
+
+    # Not due yet, so nothing is claimed until run_after passes.
+    assert process_pending_jobs() == 0
+    job.run_after = job.run_after - timedelta(hours=1)
+    db.session.commit()
+
+    assert process_pending_jobs() == 1
+    db.session.expire_all()
+    job = db.session.get(BackgroundJob, job_id)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert calls == [{"value": 1}, {"value": 1}]
@@ -0,0 +1,113 @@
+from db import db
+from models import BackgroundJob, Course
+from utils.media_derivatives import VIDEO_POSTER_JOB
+
+
+def _request_ticket(client, headers, **overrides):
+    payload = {"file_name": "preview.mp4", "content_type": "video/mp4", "size_bytes": 16, **overrides}
+    return client.post("/media-uploads/", json=payload, headers=headers)
+
+
+def test_local_signed_upload_is_confirmed_and_attached(client, create_user, create_course, auth_headers):
+    admin = create_user(role="admin")
+    course = create_course()
+    headers = auth_headers(admin, fresh=True)
+    video_bytes = b"0123456789abcdef"
+
+    ticket_response = _request_ticket(client, headers)
+    assert ticket_response.status_code == 201
+    ticket = ticket_response.get_json()
+    assert ticket["method"] == "PUT"
+    assert ticket["media_type"] == "videos"
+    assert ticket["url"] == f"/media-uploads/{ticket['upload_token']}"
+    assert ticket["headers"] == {"Content-Type": "video/mp4"}
+
+    upload_response = client.put(ticket["url"], data=video_bytes, headers=ticket["headers"])
+    assert upload_response.status_code == 200
+
+    confirm_response = client.post(
+        f"/courses/{course.id}/media",
+        json={"upload_token": ticket["upload_token"]},
+        headers=headers,
+    )
+    assert confirm_response.status_code == 200
+    preview_video_url = confirm_response.get_json()["preview_video_url"]
+    assert preview_video_url == f"/media/{ticket['storage_key']}"
+    assert client.get(preview_video_url).data == video_bytes
+
+    db.session.expire_all()
+    assert db.session.get(Course, course.id).preview_video_url == preview_video_url
+    assert BackgroundJob.query.one().kind == VIDEO_POSTER_JOB
+
+
+def test_direct_upload_rejects_mismatched_or_missing_objects(client, create_user, create_course, auth_headers):
+    admin = create_user(role="admin")
+    student = create_user(role="student")
+    course = create_course()
+    headers = auth_headers(admin, fresh=True)
+
+    assert _request_ticket(client, auth_headers(student, fresh=True)).status_code == 403
+    assert _request_ticket(client, headers, content_type="application/pdf").status_code == 400
+    assert _request_ticket(client, headers, size_bytes=51 * 1024 * 1024).status_code == 400
+
+    ticket = _request_ticket(client, headers, size_bytes=8).get_json()
+
+    not_uploaded = client.post(
+        f"/courses/{course.id}/media",
+        json={"upload_token": ticket["upload_token"]},
+        headers=headers,
+    )
+    assert not_uploaded.status_code == 409
+
+    wrong_type = client.put(ticket["url"], data=b"12345678", headers={"Content-Type": "image/png"})
+    assert wrong_type.status_code == 400
+    too_large = client.put(ticket["url"], data=b"0123456789", headers=ticket["headers"])
+    assert too_large.status_code == 400
+
+    tampered = client.post(
+        f"/courses/{course.id}/media",
+        json={"upload_token": ticket["upload_token"] + "x"},
+        headers=headers,
+    )
+    assert tampered.status_code == 400
+    assert client.put(f"{ticket['url']}x", data=b"12345678", headers=ticket["headers"]).status_code == 400
+
+    db.session.expire_all()
+    assert db.session.get(Course, course.id).preview_video_url is None
+
+
+def test_signed_upload_cannot_overwrite_an_uploaded_or_confirmed_object(
+    app, client, create_user, create_course, auth_headers,
+):
+    admin = create_user(role="admin")
+    course = create_course()
+    headers = auth_headers(admin, fresh=True)
+    ticket = _request_ticket(client, headers, size_bytes=8).get_json()
+
+    assert client.put(ticket["url"], data=b"original", headers=ticket["headers"]).status_code == 200
+    # A second PUT with the same ticket is refused before confirmation...
+    assert client.put(ticket["url"], data=b"replaced", headers=ticket["headers"]).status_code == 409
+
+    confirm_response = client.post(
+        f"/courses/{course.id}/media",
+        json={"upload_token": ticket["upload_token"]},
+        headers=headers,
+    )
+    assert confirm_response.status_code == 200
+    # ...and after it, so the immutable URL keeps serving the confirmed bytes.
+    assert client.put(ticket["url"], data=b"replaced", headers=ticket["headers"]).status_code == 409
+    assert client.get(confirm_response.get_json()["preview_video_url"]).data == b"original"
+
+
+def test_signed_upload_expires_after_the_upload_window(app, client, create_user, auth_headers, monkeypatch):
+    import time
+
+    admin = create_user(role="admin")
+    app.config["MEDIA_DIRECT_UPLOAD_TTL_SECONDS"] = 60
+    ticket = _request_ticket(client, auth_headers(admin, fresh=True), size_bytes=8).get_json()
+
+    issued_at = time.time()
+    monkeypatch.setattr(time, "time", lambda: issued_at + 90)
+    response = client.put(ticket["url"], data=b"12345678", headers=ticket["headers"])
+    assert response.status_code == 400
+    assert "expired" in response.get_json()["message"]
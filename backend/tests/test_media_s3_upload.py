@@ -0,0 +1,146 @@
+from io import BytesIO
+
+import pytest
+
+from utils.media_upload import MediaUploadService, clear_s3_client_cache
+from utils.metrics import reset_timings
+
+moto = pytest.importorskip("moto")
+
+BUCKET = "insideout-test-media"
+MEGABYTE = 1024 * 1024
+
+
+@pytest.fixture()
+def s3_app(app, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    app.config.update(
+        MEDIA_STORAGE_DRIVER="s3",
+        MEDIA_BUCKET_NAME=BUCKET,
+        MEDIA_S3_REGION="us-east-1",
+        MEDIA_S3_ENDPOINT_URL="",
+        MEDIA_S3_ACCESS_KEY="testing",
+        MEDIA_S3_SECRET_KEY="testing",
+        MEDIA_S3_MULTIPART_THRESHOLD_MB=5,
+        MEDIA_S3_MULTIPART_CHUNKSIZE_MB=5,
+        MEDIA_S3_MAX_CONCURRENCY=3,
+    )
+    clear_s3_client_cache()
+    reset_timings()
+    with moto.mock_aws():
+        with app.app_context():
+            MediaUploadService.from_app(app)._s3_client().create_bucket(Bucket=BUCKET)
+        yield app
+    clear_s3_client_cache()
+
+
+def test_large_video_upload_uses_multipart_and_records_timing(s3_app, client, create_user, auth_headers):
+    admin = create_user(role="admin")
+    video_bytes = b"\x00\x01" * (6 * MEGABYTE)
+
+    response = client.post(
+        "/courses/",
+        data={
+            "title": "Large Preview",
+            "description": "Multipart upload",
+            "price": "25.00",
+            "media": (BytesIO(video_bytes), "preview.mp4", "video/mp4"),
+        },
+        headers=auth_headers(admin, fresh=True),
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 201
+    video_url = response.get_json()["preview_video_url"]
+    storage_key = video_url.split(f"{BUCKET}.s3.us-east-1.amazonaws.com/", 1)[1]
+
+    with s3_app.app_context():
+        s3_client = MediaUploadService.from_app(s3_app)._s3_client()
+        head = s3_client.head_object(Bucket=BUCKET, Key=storage_key)
+    assert head["ContentLength"] == len(video_bytes)
+    assert head["ContentType"] == "video/mp4"
+    # Multipart ETags carry the part count: 12MB in 5MB chunks -> 3 parts.
+    assert head["ETag"].strip('"').endswith("-3")
+
+    metrics = client.get("/health/metrics").get_json()["media"]
+    upload_timing = metrics["media.upload.s3"]
+    assert upload_timing["count"] == 1
+    assert upload_timing["errors"] == 0
+    assert upload_timing["total_bytes"] == len(video_bytes)
+    assert upload_timing["max_seconds"] >= upload_timing["avg_seconds"] > 0
+
+
+def test_s3_client_is_reused_per_configuration(s3_app):
+    with s3_app.app_context():
+        first = MediaUploadService.from_app(s3_app)._s3_client()
+        second = MediaUploadService.from_app(s3_app)._s3_client()
+        assert first is second
+        assert first.meta.config.max_pool_connections == 16
+
+        s3_app.config["MEDIA_S3_MAX_POOL_CONNECTIONS"] = 32
+        resized = MediaUploadService.from_app(s3_app)._s3_client()
+        assert resized is not first
+        assert resized.meta.config.max_pool_connections == 32
+
+        transfer_config = MediaUploadService.from_app(s3_app)._s3_transfer_config()
+        assert transfer_config.multipart_threshold == 5 * MEGABYTE
+        assert transfer_config.max_request_concurrency == 3
+
+
+def test_presigned_post_upload_is_verified_before_attaching(s3_app, client, create_user, create_course, auth_headers):
+    requests = pytest.importorskip("requests")
+    admin = create_user(role="admin")
+    course = create_course()
+    headers = auth_headers(admin, fresh=True)
+
+    def _presigned_upload(body, declared_size):
+        ticket = client.post(
+            "/media-uploads/",
+            json={"file_name": "cover.png", "content_type": "image/png", "size_bytes": declared_size},
+            headers=headers,
+        ).get_json()
+        assert ticket["method"] == "POST"
+        assert ticket["fields"]["Content-Type"] == "image/png"
+        upload = requests.post(
+            ticket["url"],
+            data=ticket["fields"],
+            files={"file": ("cover.png", body, "image/png")},
+            timeout=5,
+        )
+        assert upload.status_code in (200, 201, 204)
+        return client.post(
+            f"/courses/{course.id}/media",
+            json={"upload_token": ticket["upload_token"]},
+            headers=headers,
+        )
+
+    # The HEAD check rejects objects larger than the ticket even if the store accepted them.
+    oversized = _presigned_upload(b"x" * 32, declared_size=16)
+    assert oversized.status_code == 400
+
+    confirmed = _presigned_upload(b"x" * 16, declared_size=16)
+    assert confirmed.status_code == 200
+    assert confirmed.get_json()["image_url"].startswith(f"https://{BUCKET}.s3.us-east-1.amazonaws.com/courses/images/")
+
+
+def test_s3_uploads_are_deduplicated_and_deleted_with_derivatives(s3_app):
+    from werkzeug.datastructures import FileStorage
+
+    def _file():
+        return FileStorage(stream=BytesIO(b"same image bytes"), filename="cover.png", content_type="image/png")
+
+    with s3_app.app_context():
+        media_service = MediaUploadService.from_app(s3_app)
+        first = media_service.store_course_media(_file())
+        second = media_service.store_course_media(_file())
+        assert first.deduplicated is False
+        assert second.deduplicated is True
+        assert second.url == first.url
+
+        media_service.store_bytes(first.storage_key.replace(".png", "-w320.webp"), b"variant", "image/webp")
+        s3_client = media_service._s3_client()
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 2
+
+        assert media_service.delete_object(first.storage_key) == 2
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 0
+        assert media_service.object_exists(first.storage_key) is False
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+VIDEO_KEY = "courses/videos/0123456789abcdef0123456789abcdef.mp4"
+VIDEO_BYTES = bytes(range(256)) * 40
+
+
+@pytest.fixture()
+def stored_video(app):
+    path = os.path.join(app.config["MEDIA_LOCAL_UPLOAD_DIR"], *VIDEO_KEY.split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as target:
+        target.write(VIDEO_BYTES)
+    return path
+
+
+def test_unique_media_keys_are_immutable_and_support_ranges(client, stored_video):
+    full = client.get(f"/media/{VIDEO_KEY}")
+    assert full.status_code == 200
+    assert full.data == VIDEO_BYTES
+    assert full.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert full.headers["Accept-Ranges"] == "bytes"
+    assert full.headers["Content-Type"] == "video/mp4"
+
+    partial = client.get(f"/media/{VIDEO_KEY}", headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.headers["Content-Range"] == f"bytes 100-199/{len(VIDEO_BYTES)}"
+    assert partial.headers["Content-Length"] == "100"
+    assert partial.data == VIDEO_BYTES[100:200]
+    assert partial.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    open_ended = client.get(f"/media/{VIDEO_KEY}", headers={"Range": f"bytes={len(VIDEO_BYTES) - 10}-"})
+    assert open_ended.status_code == 206
+    assert open_ended.data == VIDEO_BYTES[-10:]
+
+    unsatisfiable = client.get(f"/media/{VIDEO_KEY}", headers={"Range": f"bytes={len(VIDEO_BYTES) + 1}-"})
+    assert unsatisfiable.status_code == 416
+
+    revalidated = client.get(f"/media/{VIDEO_KEY}", headers={"If-None-Match": full.headers["ETag"]})
+    assert revalidated.status_code == 304
+
+
+def test_other_media_revalidates_and_paths_cannot_escape_upload_dir(app, client):
+    default_path = os.path.join(app.config["MEDIA_LOCAL_UPLOAD_DIR"], "defaults", "course-default.png")
+    os.makedirs(os.path.dirname(default_path), exist_ok=True)
+    with open(default_path, "wb") as target:
+        target.write(b"png")
+
+    response = client.get("/media/defaults/course-default.png")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=300, must-revalidate"
+
+    assert client.get("/media/../test.db").status_code == 404
+    assert client.get("/media/courses/videos/missing.mp4").status_code == 404
+
+
+def test_media_transfer_can_be_offloaded_to_front_proxy(app, client, stored_video):
+    app.config.update(MEDIA_SERVE_OFFLOAD="x-accel-redirect", MEDIA_ACCEL_REDIRECT_PREFIX="/internal-media/")
+    accel = client.get(f"/media/{VIDEO_KEY}", headers={"Range": "bytes=0-99"})
+    assert accel.status_code == 200
+    assert accel.data == b""
+    assert accel.headers["X-Accel-Redirect"] == f"/internal-media/{VIDEO_KEY}"
+    assert accel.headers["Content-Type"] == "video/mp4"
+    assert accel.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    app.config["MEDIA_SERVE_OFFLOAD"] = "x-sendfile"
+    sendfile = client.get(f"/media/{VIDEO_KEY}")
+    assert sendfile.status_code == 200
+    assert sendfile.data == b""
+    assert os.path.samefile(sendfile.headers["X-Sendfile"], stored_video)
@@ -47,12 +47,9 @@ def test_meeting_reminder_respects_user_settings_and_marks_processed(
     create_course,
     create_enrollment,
     create_schedule,
-    monkeypatch,
+    queued_emails,
 ):
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(notifications_module, "queue_email", lambda to_email, subject, body, reference_key=None: queued.append((to_email, subject, body, reference_key)))
+    queued = queued_emails
 
     with app.app_context():
         app.config.update(
@@ -131,4 +128,140 @@ def test_meeting_reminder_is_not_sent_twice(
         second_count = EmailNotification.query.count()
 
         assert first_count > 0
-        assert second_count == first_count
\ No newline at end of file
+        assert second_count == first_count
+
+
+def test_reminder_index_follows_schedule_and_settings_changes(
+    app,
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    create_schedule,
+    auth_headers,
+):
+    from models import MeetingReminderDue
+
+    app.config.update(
+        MEETING_REMINDER_DEFAULT_LEAD_MINUTES=60,
+        MEETING_REMINDER_MIN_LEAD_MINUTES=30,
+        MEETING_REMINDER_MAX_LEAD_MINUTES=1440,
+    )
+    tutor = create_user(role="admin", email="tutor-index@example.com")
+    student = create_user(role="student", email="student-index@example.com")
+    enrollment = create_enrollment(student.id, create_course(title="Index Course").id)
+    schedule = create_schedule(enrollment.id)
+    start_at = datetime.combine(schedule.date, schedule.start_time)
+
+    def _due_by_recipient():
+        db.session.expire_all()
+        return {row.recipient_id: (row.lead_minutes, row.due_at) for row in MeetingReminderDue.query.all()}
+
+    assert _due_by_recipient() == {
+        student.id: (60, start_at - timedelta(minutes=60)),
+        tutor.id: (60, start_at - timedelta(minutes=60)),
+    }
+
+    response = client.post(
+        "/notification-settings/",
+        json={"user_id": student.id, "meeting_reminder_lead_minutes": 120},
+        headers=auth_headers(student),
+    )
+    assert response.status_code == 200
+    assert _due_by_recipient()[student.id] == (120, start_at - timedelta(minutes=120))
+
+    response = client.post(
+        "/notification-settings/",
+        json={"user_id": tutor.id, "notify_on_meeting_reminder": False},
+        headers=auth_headers(tutor),
+    )
+    assert response.status_code == 200
+    assert set(_due_by_recipient()) == {student.id}
+
+    response = client.post(
+        f"/schedules/{schedule.id}/request-change",
+        json={"subject": "Move it", "comments": ""},
+        headers=auth_headers(student),
+    )
+    assert response.status_code == 200
+    assert _due_by_recipient() == {}
+
+
+def test_reminder_job_reads_only_due_rows_and_marks_them_processed(
+    app,
+    create_user,
+    create_course,
+    create_enrollment,
+    create_schedule,
+    count_queries,
+):
+    from models import MeetingReminderDue, Schedule
+
+    app.config.update(
+        MEETING_REMINDER_DEFAULT_LEAD_MINUTES=60,
+        MEETING_REMINDER_MIN_LEAD_MINUTES=30,
+        MEETING_REMINDER_MAX_LEAD_MINUTES=1440,
+        MEETING_REMINDER_WINDOW_SECONDS=300,
+    )
+    create_user(role="admin", email="tutor-scan@example.com")
+    now = datetime.now(UTC).replace(tzinfo=None)
+    due_start = (now + timedelta(minutes=60)).replace(second=0, microsecond=0)
+    schedule_ids = []
+    for index in range(6):
+        student = create_user(role="student", email=f"student-scan{index}@example.com")
+        enrollment = create_enrollment(student.id, create_course(title=f"Scan Course {index}").id)
+        # Two sessions are due now; the rest are days away.
+        start_at = due_start if index < 2 else due_start + timedelta(days=index)
+        schedule_ids.append(create_schedule(
+            enrollment.id,
+            date=start_at.date(),
+            start_time=start_at.time(),
+            end_time=(start_at + timedelta(hours=1)).time(),
+        ).id)
+
+    with count_queries() as statements:
+        assert process_meeting_reminders() == 4
+    # One due-row read, the bulk insert, the mark-processed and reminder_sent_at
+    # updates, then an empty read that ends the loop.
+    assert len(statements) <= 6
+
+    db.session.expire_all()
+    assert MeetingReminderDue.query.filter(MeetingReminderDue.processed_at.isnot(None)).count() == 4
+    assert [db.session.get(Schedule, schedule_id).reminder_sent_at is not None for schedule_id in schedule_ids] == [
+        True, True, False, False, False, False,
+    ]
+    assert process_meeting_reminders() == 0
+
+
+def test_scheduler_leader_backfills_an_empty_reminder_index(
+    app,
+    monkeypatch,
+    create_user,
+    create_course,
+    create_enrollment,
+    create_schedule,
+):
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    import utils.scheduler as scheduler_module
+    from models import MeetingReminderDue
+    from utils.leader_lease import LeaderLease
+    from utils.notifications import ensure_meeting_reminder_index
+
+    create_user(role="admin", email="tutor-backfill@example.com")
+    student = create_user(role="student", email="student-backfill@example.com")
+    enrollment = create_enrollment(student.id, create_course(title="Backfill Course").id)
+    schedule = create_schedule(enrollment.id)
+    # A freshly migrated database: sessions exist but the index table is empty.
+    db.session.execute(MeetingReminderDue.__table__.delete())
+    db.session.commit()
+
+    monkeypatch.setattr(scheduler_module, "scheduler_lease", LeaderLease("scheduler", holder="worker-1"))
+    target = BackgroundScheduler()
+    scheduler_module._register_jobs(target, app)
+    {job.id: job.func for job in target.get_jobs()}["scheduler_leader_lease"]()
+
+    db.session.expire_all()
+    assert {row.schedule_id for row in MeetingReminderDue.query.all()} == {schedule.id}
+    assert MeetingReminderDue.query.count() == 2
+    assert ensure_meeting_reminder_index() == 0
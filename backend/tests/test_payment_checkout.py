@@ -350,17 +350,11 @@ def test_finalize_payment_queues_email_when_enabled(
     create_user,
     create_course,
     auth_headers,
+    queued_emails,
     monkeypatch,
 ):
     import resources.payment as payment_resource
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(
-        notifications_module,
-        "queue_email",
-        lambda to_email, subject, body, reference_key=None: queued.append((to_email, subject, body, reference_key)),
-    )
+    queued = queued_emails
 
     admin = create_user(role="admin", email="notify-payment-admin@example.com")
     user = create_user(role="student", email="notify-payment@example.com")
@@ -404,17 +398,11 @@ def test_finalize_payment_skips_email_when_disabled(
     create_user,
     create_course,
     auth_headers,
+    queued_emails,
     monkeypatch,
 ):
     import resources.payment as payment_resource
-    import utils.notifications as notifications_module
-
-    queued = []
-    monkeypatch.setattr(
-        notifications_module,
-        "queue_email",
-        lambda to_email, subject, body, reference_key=None: queued.append((to_email, subject, body, reference_key)),
-    )
+    queued = queued_emails
 
     admin = create_user(role="admin", email="notify-off-admin@example.com")
     user = create_user(role="student", email="notify-off@example.com")
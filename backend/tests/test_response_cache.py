@@ -0,0 +1,165 @@
+import threading
+import time
+
+from utils.response_cache import MemoryCacheBackend, RedisCacheBackend, ResponseCache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.expiries = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode("utf-8") if isinstance(value, str) else value
+        self.expiries[key] = ex
+
+    def incr(self, key):
+        value = int(self.values.get(key, 0)) + 1
+        self.values[key] = str(value).encode("utf-8")
+        return value
+
+
+def test_public_catalog_is_cached_until_admin_edit(client, create_user, create_course, auth_headers):
+    admin = create_user(role="admin")
+    course = create_course(title="Cached Course")
+
+    first = client.get("/courses/?page_size=5")
+    second = client.get("/courses/?page_size=5")
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.get_json() == first.get_json()
+
+    detail = client.get(f"/courses/{course.id}")
+    assert detail.headers["X-Cache"] == "MISS"
+    assert client.get(f"/courses/{course.id}").headers["X-Cache"] == "HIT"
+
+    update_response = client.put(
+        f"/courses/{course.id}",
+        data={"title": "Renamed Course"},
+        headers=auth_headers(admin, fresh=True),
+        content_type="multipart/form-data",
+    )
+    assert update_response.status_code == 200
+
+    refreshed = client.get("/courses/?page_size=5")
+    assert refreshed.headers["X-Cache"] == "MISS"
+    assert refreshed.get_json()["data"][0]["title"] == "Renamed Course"
+    assert client.get(f"/courses/{course.id}").get_json()["title"] == "Renamed Course"
+
+    metrics = client.get("/health/metrics").get_json()["response_cache"]
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 4
+    assert metrics["invalidations"] == 1
+
+
+def test_cached_review_author_names_follow_profile_updates(
+    client,
+    create_user,
+    create_course,
+    create_enrollment,
+    auth_headers,
+):
+    student = create_user(role="student", first_name="Ada")
+    course = create_course()
+    create_enrollment(student.id, course.id)
+    response = client.post(
+        f"/courses/{course.id}/reviews/",
+        json={"rating": 5, "comment": "Great"},
+        headers=auth_headers(student),
+    )
+    assert response.status_code == 201
+
+    assert client.get(f"/courses/{course.id}").get_json()["reviews"][0]["author"]["first_name"] == "Ada"
+    assert client.get(f"/courses/{course.id}").headers["X-Cache"] == "HIT"
+
+    response = client.put("/me", json={"first_name": "Grace"}, headers=auth_headers(student))
+    assert response.status_code == 200
+
+    detail = client.get(f"/courses/{course.id}")
+    assert detail.headers["X-Cache"] == "MISS"
+    assert detail.get_json()["reviews"][0]["author"]["first_name"] == "Grace"
+
+
+def test_query_string_is_normalized_and_authorized_requests_bypass_cache(
+    client,
+    create_user,
+    create_course,
+    auth_headers,
+):
+    student = create_user()
+    create_course()
+
+    assert client.get("/courses/?page=1&page_size=5").headers["X-Cache"] == "MISS"
+    assert client.get("/courses/?page_size=5&page=1&search=").headers["X-Cache"] == "HIT"
+
+    authorized = client.get("/courses/?page=1&page_size=5", headers=auth_headers(student))
+    assert authorized.status_code == 200
+    assert "X-Cache" not in authorized.headers
+
+
+def test_missing_course_detail_is_not_cached(client):
+    assert client.get("/courses/999").status_code == 404
+    assert client.get("/courses/999").status_code == 404
+
+
+def test_redis_backend_round_trips_and_invalidates():
+    fake = FakeRedis()
+    cache = ResponseCache(RedisCacheBackend(fake), ttl_seconds=30)
+    computed = []
+
+    def _compute():
+        computed.append(1)
+        return {"status": 200, "mimetype": "application/json", "body": "{}"}
+
+    assert cache.get_or_compute("catalog", "/courses/?", _compute)[1] is False
+    assert cache.get_or_compute("catalog", "/courses/?", _compute)[1] is True
+    assert 30 in fake.expiries.values()
+
+    cache.invalidate("catalog")
+    assert cache.get_or_compute("catalog", "/courses/?", _compute)[1] is False
+    assert len(computed) == 2
+
+
+def test_concurrent_misses_are_computed_once():
+    cache = ResponseCache(MemoryCacheBackend(), ttl_seconds=30)
+    computed = []
+    start = threading.Barrier(8)
+
+    def _compute():
+        computed.append(1)
+        time.sleep(0.05)
+        return {"status": 200, "mimetype": "application/json", "body": "[]"}
+
+    def _request():
+        start.wait()
+        cache.get_or_compute("catalog", "/courses/?", _compute)
+
+    threads = [threading.Thread(target=_request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(computed) == 1
+    assert cache.stats()["hits"] == 7
+
+
+def test_memory_backend_evicts_least_recently_used_and_expired_entries(monkeypatch):
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.get("a")
+    backend.set("c", "3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+
+    backend.set("short", "x", ttl_seconds=1)
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + 5)
+    assert backend.get("short") is None
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime, timedelta
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+import utils.scheduler as scheduler_module
+from db import db
+from models import SchedulerLease
+from utils.leader_lease import LeaderLease
+
+
+def _expire(name):
+    lease = db.session.get(SchedulerLease, name)
+    lease.expires_at = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=1)
+    db.session.commit()
+
+
+def test_only_one_process_holds_the_lease_until_it_expires_or_is_released(app):
+    first = LeaderLease("jobs", holder="web-1")
+    second = LeaderLease("jobs", holder="web-2")
+
+    assert first.acquire(30) is True
+    assert second.acquire(30) is False
+    assert first.acquire(30) is True
+    assert (first.is_leader(), second.is_leader()) == (True, False)
+
+    # A holder that stopped renewing loses the lease to the next contender.
+    _expire("jobs")
+    assert second.acquire(30) is True
+    assert first.acquire(30) is False
+    assert (first.is_leader(), second.is_leader()) == (False, True)
+
+    second.release()
+    assert second.is_leader() is False
+    assert first.acquire(30) is True
+    db.session.expire_all()
+    assert db.session.get(SchedulerLease, "jobs").holder == "web-1"
+
+
+def test_reminder_tick_runs_only_in_the_lease_holder_and_queues_drain_everywhere(app, monkeypatch):
+    calls = []
+    monkeypatch.setattr(scheduler_module, "process_meeting_reminders", lambda: calls.append("reminders"))
+    monkeypatch.setattr(scheduler_module, "process_pending_jobs", lambda: calls.append("jobs"))
+    monkeypatch.setattr(scheduler_module, "scheduler_lease", LeaderLease("scheduler", holder="worker-1"))
+    LeaderLease("scheduler", holder="worker-2").acquire(30)
+
+    target = BackgroundScheduler()
+    scheduler_module._register_jobs(target, app)
+    jobs = {job.id: job.func for job in target.get_jobs()}
+
+    jobs["scheduler_leader_lease"]()
+    jobs["meeting_reminder_job"]()
+    # Background job claims skip locked rows, so standbys drain the queue too.
+    jobs["background_job_processor"]()
+    assert calls == ["jobs"]
+
+    _expire("scheduler")
+    jobs["scheduler_leader_lease"]()
+    for job_id in ("meeting_reminder_job", "background_job_processor"):
+        jobs[job_id]()
+    assert calls == ["jobs", "reminders", "jobs"]
@@ -0,0 +1,178 @@
+"""Process-level cache of admin notification recipients.
+
+Every notification dispatcher that copies admins in used to query all admin
+users and then lazy-load each admin's notification settings. The roster is
+loaded with one query (admins outer-joined to their settings), kept as
+immutable ``RosterAdmin`` entries, and shared by all dispatchers in
+``utils.notifications``. Entries expose the same ``id``/``email``/names and
+``notification_settings`` attributes as ``User``, so they can be passed
+wherever a recipient is expected.
+
+Writes that change an admin's role, profile or settings call
+``invalidate_admin_roster()`` after committing. That clears this process's
+copy and bumps the ``admin_roster`` generation in the response cache
+backend. With the Redis backend every process sees the new generation on its
+next lookup. With the in-memory backend other processes catch up within
+``ADMIN_ROSTER_CACHE_TTL_SECONDS``.
+
+Only dispatchers that send right away use the roster. The meeting reminder
+index stores admins' lead times and opt-outs in its rows, so it queries admins
+inside the writing transaction instead; a stale roster there would leave
+wrong rows that nothing corrects.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from flask import current_app
+from sqlalchemy import select
+
+from db import db
+from models import EmailNotificationSettings, User
+from utils.response_cache import get_response_cache, invalidate_response_cache
+
+logger = logging.getLogger(__name__)
+
+ADMIN_ROSTER_NAMESPACE = "admin_roster"
+
+
+@dataclass(frozen=True)
+class RosterSettings:
+    notify_on_new_payment: bool | None
+    notify_on_schedule_change: bool | None
+    notify_on_new_course: bool | None
+    notify_on_meeting_reminder: bool | None
+    meeting_reminder_lead_minutes: int | None
+
+
+@dataclass(frozen=True)
+class RosterAdmin:
+    id: int
+    email: str
+    first_name: str
+    last_name: str
+    notification_settings: RosterSettings | None
+    role: str = "admin"
+
+
+class AdminRoster:
+    """Thread-safe cached admin list with hit/miss counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._admins: tuple[RosterAdmin, ...] | None = None
+        self._loaded_at = 0.0
+        self._generation: int | None = None
+        self._version = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, load, *, ttl_seconds: float, generation: int | None) -> tuple[RosterAdmin, ...]:
+        with self._lock:
+            fresh = (
+                self._admins is not None
+                and self._generation == generation
+                and time.monotonic() - self._loaded_at < ttl_seconds
+            )
+            if fresh:
+                self._stats["hits"] += 1
+                return self._admins
+            self._stats["misses"] += 1
+            version = self._version
+
+        admins = load()
+        with self._lock:
+            # Skip storing a roster read before a concurrent invalidation.
+            if version == self._version:
+                self._admins = admins
+                self._loaded_at = time.monotonic()
+                self._generation = generation
+        return admins
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._admins = None
+            self._version += 1
+            self._stats["invalidations"] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._admins = None
+            self._version += 1
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._admins) if self._admins is not None else 0
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+
+_roster = AdminRoster()
+
+
+def _load_admins() -> tuple[RosterAdmin, ...]:
+    rows = db.session.execute(
+        select(
+            User.id,
+            User.email,
+            User.first_name,
+            User.last_name,
+            EmailNotificationSettings.id.label("settings_id"),
+            EmailNotificationSettings.notify_on_new_payment,
+            EmailNotificationSettings.notify_on_schedule_change,
+            EmailNotificationSettings.notify_on_new_course,
+            EmailNotificationSettings.notify_on_meeting_reminder,
+            EmailNotificationSettings.meeting_reminder_lead_minutes,
+        )
+        .outerjoin(EmailNotificationSettings, EmailNotificationSettings.user_id == User.id)
+        .where(User.role == "admin")
+        .order_by(User.id.asc())
+    ).all()
+    return tuple(
+        RosterAdmin(
+            id=row.id,
+            email=row.email,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            notification_settings=None if row.settings_id is None else RosterSettings(
+                notify_on_new_payment=row.notify_on_new_payment,
+                notify_on_schedule_change=row.notify_on_schedule_change,
+                notify_on_new_course=row.notify_on_new_course,
+                notify_on_meeting_reminder=row.notify_on_meeting_reminder,
+                meeting_reminder_lead_minutes=row.meeting_reminder_lead_minutes,
+            ),
+        )
+        for row in rows
+    )
+
+
+def get_admin_roster() -> tuple[RosterAdmin, ...]:
+    """Return all admins with their notification settings, from cache when fresh."""
+    cache = get_response_cache()
+    generation = None
+    if cache is not None:
+        try:
+            generation = cache.generation(ADMIN_ROSTER_NAMESPACE)
+        except Exception:
+            logger.exception("Admin roster generation lookup failed")
+    ttl_seconds = float(current_app.config.get("ADMIN_ROSTER_CACHE_TTL_SECONDS", 300))
+    return _roster.get(_load_admins, ttl_seconds=ttl_seconds, generation=generation)
+
+
+def invalidate_admin_roster() -> None:
+    """Drop the cached roster here and, through the response cache backend, in other processes."""
+    _roster.invalidate()
+    invalidate_response_cache(ADMIN_ROSTER_NAMESPACE)
+
+
+def admin_roster_stats() -> dict:
+    return _roster.stats()
+
+
+def reset_admin_roster() -> None:
+    """Clear the roster and its counters (used by tests)."""
+    _roster.reset()
@@ -0,0 +1,103 @@
+"""Conditional GET support (ETag) for read endpoints.
+
+``conditional_response(version_fn)`` asks ``version_fn`` for a cheap version
+of the resource before the view runs, typically ``count``/``max(updated_at)``
+aggregates over the rows the response is built from (see ``row_version``).
+The version becomes a weak ``ETag``. Requests whose ``If-None-Match``
+matches get an empty 304 without the full query or schema dump.
+
+No ``Last-Modified`` is sent and ``If-Modified-Since`` is ignored: deleting a
+row that is not the newest leaves ``max(updated_at)`` unchanged, so a date
+alone would answer 304 for a list that lost rows. Only the ETag carries the
+row counts.
+
+Version functions return ``None`` to opt a request out, e.g. when the
+resource does not exist and the view should produce its usual 404.
+"""
+
+import hashlib
+import json
+import logging
+from functools import wraps
+from typing import NamedTuple
+
+from flask import current_app, request
+from sqlalchemy import func, select
+
+from db import db
+
+logger = logging.getLogger(__name__)
+
+CONDITIONAL_METHODS = {"GET", "HEAD"}
+
+
+class ResourceVersion(NamedTuple):
+    parts: tuple
+
+
+def row_version(model, *criteria):
+    """Return ``count`` and ``max(updated_at)`` scalar subqueries over matching rows."""
+    return (
+        select(func.count()).select_from(model).where(*criteria).scalar_subquery(),
+        select(func.max(model.updated_at)).where(*criteria).scalar_subquery(),
+    )
+
+
+def fetch_resource_version(*columns, key: tuple = ()) -> ResourceVersion:
+    """Evaluate version columns in one round trip; ``key`` adds request-specific parts."""
+    values = tuple(db.session.execute(select(*columns)).one())
+    return ResourceVersion(parts=(*key, *values))
+
+
+def _etag_for(version: ResourceVersion) -> str:
+    normalized_args = sorted(request.args.items(multi=True))
+    raw = json.dumps([request.path, normalized_args, list(version.parts)], default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _is_not_modified(etag: str) -> bool:
+    return bool(request.if_none_match) and request.if_none_match.contains_weak(etag)
+
+
+def _apply_validators(response, etag: str):
+    response.set_etag(etag, weak=True)
+    # Always revalidate; private responses must not land in shared caches.
+    response.cache_control.no_cache = True
+    if request.headers.get("Authorization"):
+        response.cache_control.private = True
+    response.vary.add("Authorization")
+    return response
+
+
+def conditional_response(version_fn):
+    """Answer conditional GETs from ``version_fn`` before running the view.
+
+    ``version_fn`` receives the view's URL arguments as keywords and returns
+    a ``ResourceVersion`` or ``None``. Stack it below ``jwt_required`` when the
+    version depends on the caller, and above ``cached_response`` so
+    revalidations never touch the response cache.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.method not in CONDITIONAL_METHODS:
+                return fn(*args, **kwargs)
+
+            version = version_fn(**kwargs)
+            if version is None:
+                return fn(*args, **kwargs)
+
+            etag = _etag_for(version)
+            if _is_not_modified(etag):
+                logger.debug("Conditional request not modified", extra={"endpoint": request.endpoint})
+                return _apply_validators(current_app.response_class(status=304), etag)
+
+            response = current_app.make_response(fn(*args, **kwargs))
+            if response.status_code == 200:
+                _apply_validators(response, etag)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,200 @@
+"""Course catalog search backends.
+
+Three strategies share one interface:
+- ``PostgresCourseSearch`` ranks against a maintained ``courses.search_vector``
+  tsvector column backed by a GIN index.
+- ``SqliteCourseSearch`` ranks against an FTS5 shadow table ``courses_fts``.
+- ``LikeCourseSearch`` is the ILIKE scan used only when no index exists.
+
+Course writes call ``index_course``/``remove_course`` inside the request
+transaction so the search document never drifts from the row it describes.
+"""
+
+import logging
+import re
+
+from flask import current_app
+from sqlalchemy import inspect, literal_column, or_, text, func
+
+from db import db
+from models import Course
+
+logger = logging.getLogger(__name__)
+
+SEARCH_BACKEND_EXTENSION_KEY = "course_search_backend"
+SQLITE_FTS_TABLE = "courses_fts"
+POSTGRES_SEARCH_COLUMN = "search_vector"
+POSTGRES_SEARCH_INDEX = "ix_courses_search_vector"
+MAX_SEARCH_TOKENS = 8
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _search_tokens(term: str) -> list[str]:
+    return _TOKEN_PATTERN.findall((term or "").lower())[:MAX_SEARCH_TOKENS]
+
+
+class LikeCourseSearch:
+    """Unindexed substring search over title and description."""
+
+    name = "like"
+
+    def apply(self, query, term: str):
+        pattern = f"%{term}%"
+        return query.filter(
+            or_(
+                Course.title.ilike(pattern),
+                Course.description.ilike(pattern),
+            )
+        )
+
+    def index_course(self, course: Course) -> None:
+        return None
+
+    def remove_course(self, course_id: int) -> None:
+        return None
+
+
+class SqliteCourseSearch:
+    """FTS5-backed search with bm25 ranking and prefix matching."""
+
+    name = "sqlite_fts5"
+
+    # Title matches weigh more than description matches in bm25 ranking.
+    _rank_sql = (
+        f"SELECT rowid AS course_id, bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) AS rank "
+        f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match_query"
+    )
+
+    def apply(self, query, term: str):
+        tokens = _search_tokens(term)
+        if not tokens:
+            return LikeCourseSearch().apply(query, term)
+
+        match_query = " ".join(f'"{token}"*' for token in tokens)
+        ranked = (
+            text(self._rank_sql)
+            .bindparams(match_query=match_query)
+            .columns(course_id=db.Integer, rank=db.Float)
+            .subquery("course_search_rank")
+        )
+        return query.join(ranked, ranked.c.course_id == Course.id).order_by(ranked.c.rank.asc())
+
+    def index_course(self, course: Course) -> None:
+        self.remove_course(course.id)
+        db.session.execute(
+            text(f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, description) VALUES (:id, :title, :description)"),
+            {"id": course.id, "title": course.title or "", "description": course.description or ""},
+        )
+
+    def remove_course(self, course_id: int) -> None:
+        db.session.execute(text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :id"), {"id": course_id})
+
+
+class PostgresCourseSearch:
+    """tsvector/GIN-backed search with ts_rank_cd ranking and prefix matching."""
+
+    name = "postgres_tsvector"
+
+    _document_sql = (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    )
+
+    def apply(self, query, term: str):
+        tokens = _search_tokens(term)
+        if not tokens:
+            return LikeCourseSearch().apply(query, term)
+
+        tsquery = func.to_tsquery("english", " & ".join(f"{token}:*" for token in tokens))
+        vector = literal_column(f"courses.{POSTGRES_SEARCH_COLUMN}")
+        return query.filter(vector.op("@@")(tsquery)).order_by(func.ts_rank_cd(vector, tsquery).desc())
+
+    def index_course(self, course: Course) -> None:
+        db.session.execute(
+            text(f"UPDATE courses SET {POSTGRES_SEARCH_COLUMN} = {self._document_sql} WHERE id = :id"),
+            {"id": course.id},
+        )
+
+    def remove_course(self, course_id: int) -> None:
+        return None
+
+
+_BACKENDS = {
+    LikeCourseSearch.name: LikeCourseSearch,
+    SqliteCourseSearch.name: SqliteCourseSearch,
+    PostgresCourseSearch.name: PostgresCourseSearch,
+}
+
+
+def _detect_backend_name() -> str:
+    configured = str(current_app.config.get("COURSE_SEARCH_BACKEND", "auto") or "auto").strip().lower()
+    if configured == LikeCourseSearch.name:
+        return LikeCourseSearch.name
+
+    engine = db.engine
+    inspector = inspect(engine)
+    if engine.dialect.name == "sqlite" and inspector.has_table(SQLITE_FTS_TABLE):
+        return SqliteCourseSearch.name
+    if engine.dialect.name == "postgresql":
+        column_names = {column["name"] for column in inspector.get_columns("courses")}
+        if POSTGRES_SEARCH_COLUMN in column_names:
+            return PostgresCourseSearch.name
+
+    return LikeCourseSearch.name
+
+
+def get_course_search():
+    """Return the search backend for the active app, detecting it once per app."""
+    backend_name = current_app.extensions.get(SEARCH_BACKEND_EXTENSION_KEY)
+    if backend_name is None:
+        backend_name = _detect_backend_name()
+        current_app.extensions[SEARCH_BACKEND_EXTENSION_KEY] = backend_name
+        logger.info("Course search backend selected", extra={"backend": backend_name})
+    return _BACKENDS[backend_name]()
+
+
+def reset_course_search_backend() -> None:
+    """Forget the detected backend so the next lookup re-inspects the schema."""
+    current_app.extensions.pop(SEARCH_BACKEND_EXTENSION_KEY, None)
+
+
+def rebuild_course_search_index() -> int:
+    """Create the dialect's search index if missing and repopulate it from courses.
+
+    Returns the number of indexed courses. The caller owns the transaction.
+    """
+    dialect_name = db.engine.dialect.name
+
+    if dialect_name == "sqlite":
+        db.session.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} "
+                "USING fts5(title, description, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+        )
+        db.session.execute(text(f"DELETE FROM {SQLITE_FTS_TABLE}"))
+        result = db.session.execute(
+            text(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, description) "
+                "SELECT id, title, description FROM courses"
+            )
+        )
+    elif dialect_name == "postgresql":
+        db.session.execute(text(f"ALTER TABLE courses ADD COLUMN IF NOT EXISTS {POSTGRES_SEARCH_COLUMN} tsvector"))
+        db.session.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {POSTGRES_SEARCH_INDEX} "
+                f"ON courses USING gin ({POSTGRES_SEARCH_COLUMN})"
+            )
+        )
+        result = db.session.execute(
+            text(f"UPDATE courses SET {POSTGRES_SEARCH_COLUMN} = {PostgresCourseSearch._document_sql}")
+        )
+    else:
+        raise RuntimeError(f"Course search indexing is not supported for the {dialect_name} dialect.")
+
+    reset_course_search_backend()
+    indexed_count = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else 0
+    logger.info("Course search index rebuilt", extra={"dialect": dialect_name, "indexed_count": indexed_count})
+    return indexed_count
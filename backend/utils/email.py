@@ -1,35 +1,97 @@
-"""Email utility helpers."""
+"""Email utility helpers.
+
+Most emails are queued as one ``EmailNotification`` row each and sent with
+one provider call each. Broadcasts (one message to many users) are stored as
+a single ``EmailBroadcast`` template plus one lightweight recipient row per
+user holding that user's substitution values. The dispatcher sends up to
+``EMAIL_BROADCAST_BATCH_SIZE`` recipients of a broadcast in one SendGrid
+request using personalizations, while keeping status and retries per
+recipient row.
+
+Several dispatcher processes or replicas can drain the queue at once. Each
+claims its batch with ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP
+LOCKED)``: on PostgreSQL the subquery skips rows another worker is claiming,
+so workers get disjoint batches instead of blocking on the head of the queue
+and then claiming nothing. SQLite ignores ``FOR UPDATE``; it takes a
+database-wide write lock per ``UPDATE``, so concurrent claims are serialized
+and still disjoint, and only the claim itself (not sending) is serialized.
+
+Every row belongs to a lane, from most to least urgent: ``reminder``,
+``payment``, ``schedule`` and ``marketing``. Each run splits
+``EMAIL_BATCH_SIZE`` between lanes with due emails in proportion to
+``EMAIL_LANE_WEIGHTS``, so a backlog in one lane delays but never starves the
+others, and capacity a lane cannot use goes to the next most urgent one.
+Broadcast recipients (always ``marketing``) keep their own, larger claim.
+Per-lane queue depth and oldest due age are published as gauges on
+``/health/metrics``.
+"""
 import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timedelta
 from datetime import UTC
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import NamedTuple
 from uuid import uuid4
 
+import requests
 from flask import current_app
-from sendgrid import SendGridAPIClient
+from markupsafe import escape
 from sendgrid.helpers.mail import Mail
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 
 from db import db
-from models.notification import EmailNotification
+from models.notification import EmailBroadcast, EmailNotification
+from utils.email_templates import render_email_body
+from utils.email_wakeup import signal_email_queued
+from utils.metrics import set_gauge
 
 logger = logging.getLogger(__name__)
 
+# SendGrid accepts at most 1000 personalizations per request.
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+# Rows per multi-row INSERT, well under SQLite's bound-parameter limit.
+BULK_INSERT_CHUNK_SIZE = 500
+# Lanes from most to least urgent; unused capacity flows down this order.
+EMAIL_LANES = ("reminder", "payment", "schedule", "marketing")
+DEFAULT_EMAIL_LANE = "schedule"
+
+_thread_state = threading.local()
+_dispatch_lock = threading.Lock()
+_dispatch_executor: ThreadPoolExecutor | None = None
+_dispatch_concurrency = 0
+
 
 def _utcnow_naive() -> datetime:
     return datetime.now(UTC).replace(tzinfo=None)
 
 
-def queue_email(to_email: str, subject: str, body: str, reference_key: str | None = None):
+def queue_email(
+    to_email: str,
+    subject: str,
+    body: str,
+    reference_key: str | None = None,
+    lane: str = DEFAULT_EMAIL_LANE,
+):
     """
     Add email to queue instead of sending immediately.
     """
+    if lane not in EMAIL_LANES:
+        raise ValueError(f"Unknown email lane: {lane}")
+
     email = EmailNotification()
     email.to_email = to_email
     email.subject = subject
     email.body = body
     email.reference_key = reference_key
+    email.lane = lane
 
     if reference_key:
         existing = EmailNotification.query.filter_by(reference_key=reference_key).first()
@@ -38,6 +100,7 @@ def queue_email(to_email: str, subject: str, body: str, reference_key: str | Non
 
     try:
         db.session.add(email)
+        signal_email_queued()
         db.session.commit()
     except IntegrityError:
         db.session.rollback()
@@ -52,32 +115,690 @@ def queue_email(to_email: str, subject: str, body: str, reference_key: str | Non
     return email
 
 
-def _send_via_sendgrid(to_email: str, subject: str, body: str):
+def _insert_skipping_existing_reference_keys(rows: list[dict]) -> int:
+    """Insert ``rows`` with one statement per chunk; return how many were new."""
+    dialect = db.session.get_bind().dialect.name
+    table = EmailNotification.__table__
+    inserted = 0
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = insert(table).values(chunk).on_conflict_do_nothing(index_elements=["reference_key"])
+            inserted += db.session.execute(statement).rowcount
+            continue
+
+        # No portable upsert: drop keys that already exist, then insert the rest.
+        keys = [row["reference_key"] for row in chunk if row["reference_key"]]
+        existing = set()
+        if keys:
+            existing = set(db.session.scalars(
+                select(EmailNotification.reference_key).where(EmailNotification.reference_key.in_(keys))
+            ))
+        fresh = [row for row in chunk if row["reference_key"] not in existing]
+        if fresh:
+            db.session.execute(table.insert().values(fresh))
+        inserted += len(fresh)
+    return inserted
+
+
+def queue_emails_bulk(emails, *, commit: bool = True) -> int:
+    """Queue many emails with multi-row INSERTs and at most one commit.
+
+    ``emails`` yields mappings with ``to_email``, ``subject``, either a
+    rendered ``body`` or a ``template_key`` + ``context`` to render at dispatch
+    time (see ``utils.email_templates``), an optional ``reference_key`` and an
+    optional ``lane`` (default ``schedule``). Rows whose ``reference_key`` is
+    already queued are skipped by the database (``ON CONFLICT DO NOTHING``),
+    so retried callers stay idempotent without a lookup per email. With
+    ``commit=False`` the rows join the caller's transaction and the caller
+    commits; the dispatcher is woken when that transaction commits.
+
+    Returns the number of newly queued emails.
+    """
+    created_at = _utcnow_naive()
+    rows = []
+    seen_reference_keys = set()
+    for email in emails:
+        reference_key = email.get("reference_key")
+        if reference_key:
+            if reference_key in seen_reference_keys:
+                continue
+            seen_reference_keys.add(reference_key)
+        lane = email.get("lane") or DEFAULT_EMAIL_LANE
+        if lane not in EMAIL_LANES:
+            raise ValueError(f"Unknown email lane: {lane}")
+        rows.append({
+            "to_email": email["to_email"],
+            "subject": email["subject"],
+            "body": email.get("body") or "",
+            "template_key": email.get("template_key"),
+            "context": email.get("context"),
+            "reference_key": reference_key,
+            "lane": lane,
+            "status": "pending",
+            "retry_count": 0,
+            "created_at": created_at,
+            "next_attempt_at": created_at,
+        })
+    if not rows:
+        return 0
+
+    try:
+        inserted = _insert_skipping_existing_reference_keys(rows)
+        if inserted:
+            signal_email_queued()
+        if commit:
+            db.session.commit()
+    except Exception:
+        if commit:
+            db.session.rollback()
+        logger.exception("Failed to queue emails in bulk", extra={"count": len(rows)})
+        raise
+
+    return inserted
+
+
+def queue_broadcast(
+    subject: str,
+    body: str,
+    recipients,
+    *,
+    chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+    reference_key: str | None = None,
+) -> EmailBroadcast | None:
+    """Queue one templated message for many recipients.
+
+    ``recipients`` yields ``(to_email, substitutions)`` pairs, where
+    ``substitutions`` maps tags used in ``subject``/``body`` (e.g.
+    ``"-first_name-"``) to this recipient's values. Broadcast bodies are HTML
+    and the provider inserts values verbatim, so values are HTML-escaped when
+    queued. The iterable is consumed
+    ``chunk_size`` recipients at a time, so a streamed query keeps memory flat;
+    all rows are committed together with the broadcast.
+
+    A broadcast with a ``reference_key`` is queued at most once: if one with
+    that key already exists (or a concurrent caller commits it first), it is
+    returned and no recipients are added.
+    """
+    if reference_key:
+        existing = EmailBroadcast.query.filter_by(reference_key=reference_key).first()
+        if existing:
+            logger.info("Skipping already queued email broadcast", extra={"reference_key": reference_key})
+            return existing
+
+    broadcast = EmailBroadcast()
+    broadcast.subject = subject
+    broadcast.body = body
+    broadcast.reference_key = reference_key
+    broadcast.recipient_count = 0
+
+    recipients = iter(recipients)
+    queued_count = 0
+    try:
+        db.session.add(broadcast)
+        db.session.flush()
+
+        created_at = _utcnow_naive()
+        while chunk := list(islice(recipients, max(1, chunk_size))):
+            db.session.execute(
+                EmailNotification.__table__.insert(),
+                [
+                    {
+                        "to_email": to_email,
+                        "subject": subject,
+                        "body": "",
+                        "broadcast_id": broadcast.id,
+                        "substitutions": {tag: str(escape(value)) for tag, value in (substitutions or {}).items()},
+                        "lane": "marketing",
+                        "status": "pending",
+                        "retry_count": 0,
+                        "created_at": created_at,
+                        "next_attempt_at": created_at,
+                    }
+                    for to_email, substitutions in chunk
+                ],
+            )
+            queued_count += len(chunk)
+            logger.info(
+                "Email broadcast fan-out progress",
+                extra={"broadcast_id": broadcast.id, "queued_count": queued_count},
+            )
+
+        if not queued_count:
+            db.session.rollback()
+            return None
+
+        broadcast.recipient_count = queued_count
+        signal_email_queued()
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        if reference_key:
+            logger.info("Skipping already queued email broadcast", extra={"reference_key": reference_key})
+            return EmailBroadcast.query.filter_by(reference_key=reference_key).first()
+        raise
+    except Exception:
+        db.session.rollback()
+        logger.exception("Failed to queue email broadcast", extra={"subject": subject})
+        raise
+
+    logger.info("Queued email broadcast", extra={"broadcast_id": broadcast.id, "recipient_count": queued_count})
+    return broadcast
+
+
+def _sendgrid_session(api_key: str) -> requests.Session:
+    """Return this thread's keep-alive HTTP session for the SendGrid API.
+
+    ``SendGridAPIClient`` opens a new connection and builds a new TLS context
+    for every message; a session per sender thread reuses both.
+    """
+    if getattr(_thread_state, "sendgrid_api_key", None) != api_key:
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "insideout-email-dispatcher",
+        })
+        _thread_state.sendgrid_session = session
+        _thread_state.sendgrid_api_key = api_key
+    return _thread_state.sendgrid_session
+
+
+def _sendgrid_settings() -> tuple[str, str]:
     api_key = current_app.config.get("SENDGRID_API_KEY")
     email_from = current_app.config.get("EMAIL_FROM")
     if not api_key or not email_from:
         raise RuntimeError("Missing SendGrid configuration: SENDGRID_API_KEY and EMAIL_FROM are required")
+    return api_key, email_from
+
+
+class EmailProviderError(RuntimeError):
+    """The provider rejected or could not take a request.
+
+    ``outage`` marks failures of the provider itself (rate limiting, 5xx,
+    network errors) as opposed to problems with one message; only those
+    count towards the circuit breaker. ``retry_after`` is the provider's
+    ``Retry-After`` in seconds, when it sent one.
+    """
+
+    def __init__(self, message: str, *, status_code: int | None = None, retry_after: float | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def outage(self) -> bool:
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return ``Retry-After`` (delta-seconds or HTTP-date) as seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
 
+
+def _post_to_sendgrid(api_key: str, payload: dict):
+    host = (current_app.config.get("SENDGRID_API_HOST") or "https://api.sendgrid.com").rstrip("/")
+    timeout_seconds = float(current_app.config.get("EMAIL_SEND_TIMEOUT_SECONDS", 10))
+    try:
+        response = _sendgrid_session(api_key).post(
+            f"{host}/v3/mail/send",
+            json=payload,
+            timeout=timeout_seconds,
+        )
+    except requests.RequestException as exc:
+        raise EmailProviderError(f"SendGrid request failed: {exc}") from exc
+    if response.status_code >= 400:
+        retry_after = None
+        if response.status_code in (429, 503):
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        raise EmailProviderError(
+            f"SendGrid API error {response.status_code}: {response.text[:200]}",
+            status_code=response.status_code,
+            retry_after=retry_after,
+        )
+
+
+def _send_via_sendgrid(to_email: str, subject: str, body: str):
+    api_key, email_from = _sendgrid_settings()
     message = Mail(
         from_email=email_from,
         to_emails=to_email,
         subject=subject,
         html_content=body,
     )
+    _post_to_sendgrid(api_key, message.get())
+
+
+def _send_broadcast_via_sendgrid(subject: str, body: str, recipients: list[tuple[str, dict]]):
+    """Send ``subject``/``body`` to every ``(to_email, substitutions)`` pair in one request."""
+    if len(recipients) > SENDGRID_MAX_PERSONALIZATIONS:
+        raise ValueError(f"A SendGrid request takes at most {SENDGRID_MAX_PERSONALIZATIONS} recipients")
+
+    api_key, email_from = _sendgrid_settings()
+    payload = Mail(from_email=email_from, subject=subject, html_content=body).get()
+    # One personalization per recipient keeps addresses private from each other.
+    payload["personalizations"] = [
+        {"to": [{"email": to_email}], "substitutions": substitutions or {}}
+        for to_email, substitutions in recipients
+    ]
+    _post_to_sendgrid(api_key, payload)
+
+
+def _get_dispatch_executor(concurrency: int) -> ThreadPoolExecutor:
+    """Return the process-wide send pool, resized when the configured concurrency changes."""
+    global _dispatch_executor, _dispatch_concurrency
+    with _dispatch_lock:
+        if _dispatch_executor is None or _dispatch_concurrency != concurrency:
+            if _dispatch_executor is not None:
+                _dispatch_executor.shutdown(wait=False)
+            _dispatch_executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="email-send")
+            _dispatch_concurrency = concurrency
+        return _dispatch_executor
 
-    sg = SendGridAPIClient(api_key)
-    sg.send(message)
 
+class SendOutcome(NamedTuple):
+    email_id: int
+    retry_count: int
+    error: str | None = None
+    retry_after: float | None = None
+    deferred: bool = False  # not attempted because the circuit breaker was open
 
-def process_pending_emails():
+
+class _CircuitBreaker:
+    """Pause dispatch in this process while the provider is failing.
+
+    ``EMAIL_CIRCUIT_BREAKER_THRESHOLD`` consecutive outage failures, or any
+    response carrying ``Retry-After``, open the breaker for
+    ``EMAIL_CIRCUIT_BREAKER_COOLDOWN_SECONDS`` (or longer if the provider
+    asked). While open, no batch is claimed and sends that have not started
+    yet are deferred without spending a retry. After the cool-down the next
+    batch probes the provider; one more outage failure re-opens the breaker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._open_until = 0.0
+
+    def remaining_seconds(self) -> float:
+        """Seconds until the breaker closes again; ``0`` when closed."""
+        with self._lock:
+            return max(0.0, self._open_until - time.monotonic())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def record_outage(self, retry_after: float | None, threshold: int, cooldown_seconds: float) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures < threshold and retry_after is None:
+                return
+            pause = max(cooldown_seconds, retry_after or 0.0)
+            was_open = self._open_until > time.monotonic()
+            self._open_until = max(self._open_until, time.monotonic() + pause)
+        if not was_open:
+            logger.warning("Email circuit breaker opened", extra={"pause_seconds": pause})
+
+
+_circuit_breaker = _CircuitBreaker()
+
+
+def reset_circuit_breaker() -> None:
+    """Close the email circuit breaker (used by tests and after config changes)."""
+    _circuit_breaker.reset()
+
+
+def _run_send(send, email_ids: list[tuple[int, int]], log_extra: dict) -> list[SendOutcome]:
+    """Call ``send`` unless the breaker is open and turn its result into outcomes for ``email_ids``."""
+    if _circuit_breaker.remaining_seconds():
+        return [SendOutcome(email_id, retry_count, deferred=True) for email_id, retry_count in email_ids]
+
+    try:
+        send()
+    except Exception as exc:
+        logger.warning("Failed to send queued email", exc_info=True, extra=log_extra)
+        retry_after = getattr(exc, "retry_after", None)
+        if isinstance(exc, EmailProviderError) and exc.outage:
+            _circuit_breaker.record_outage(
+                retry_after,
+                threshold=max(1, int(current_app.config.get("EMAIL_CIRCUIT_BREAKER_THRESHOLD", 5))),
+                cooldown_seconds=float(current_app.config.get("EMAIL_CIRCUIT_BREAKER_COOLDOWN_SECONDS", 60)),
+            )
+        return [SendOutcome(email_id, retry_count, str(exc), retry_after) for email_id, retry_count in email_ids]
+
+    _circuit_breaker.record_success()
+    return [SendOutcome(email_id, retry_count) for email_id, retry_count in email_ids]
+
+
+def _send_claimed_email(
+    app,
+    email_id: int,
+    retry_count: int,
+    to_email: str,
+    subject: str,
+    body: str,
+    template_key: str | None = None,
+    context: dict | None = None,
+) -> list[SendOutcome]:
+    """Render (for templated rows) and send one claimed email on a pool thread."""
+
+    def _send():
+        rendered = render_email_body(template_key, context) if template_key else body
+        _send_via_sendgrid(to_email, subject, rendered)
+
+    with app.app_context():
+        return _run_send(
+            _send,
+            [(email_id, retry_count)],
+            {"email_id": email_id, "to_email": to_email, "subject": subject},
+        )
+
+
+def _send_claimed_broadcast_batch(
+    app,
+    broadcast_id: int,
+    subject: str,
+    body: str,
+    recipients: list[tuple[int, int, str, dict]],
+) -> list[SendOutcome]:
+    """Send one batch of broadcast recipients on a pool thread; see ``_send_broadcast_recipients``."""
+    with app.app_context():
+        return _send_broadcast_recipients(broadcast_id, subject, body, recipients)
+
+
+def _send_broadcast_recipients(
+    broadcast_id: int,
+    subject: str,
+    body: str,
+    recipients: list[tuple[int, int, str, dict]],
+) -> list[SendOutcome]:
+    """Send ``recipients`` in a single request; the outcome applies to every row.
+
+    SendGrid rejects the whole request with a ``400`` when one personalization
+    is invalid, e.g. a malformed address. A rejected batch is split in halves
+    and each half is sent again, so the rejected recipients end up failing on
+    their own, after about two requests per halving, while the rest are sent.
+    """
+    rejected = False
+
+    def _send():
+        nonlocal rejected
+        try:
+            _send_broadcast_via_sendgrid(
+                subject,
+                body,
+                [(to_email, substitutions) for _, _, to_email, substitutions in recipients],
+            )
+        except EmailProviderError as exc:
+            rejected = exc.status_code == 400 and len(recipients) > 1
+            raise
+
+    outcomes = _run_send(
+        _send,
+        [(email_id, retry_count) for email_id, retry_count, _, _ in recipients],
+        {"broadcast_id": broadcast_id, "recipient_count": len(recipients)},
+    )
+    if not rejected:
+        return outcomes
+    middle = len(recipients) // 2
+    logger.info(
+        "Splitting rejected broadcast batch",
+        extra={"broadcast_id": broadcast_id, "recipient_count": len(recipients)},
+    )
+    return (
+        _send_broadcast_recipients(broadcast_id, subject, body, recipients[:middle])
+        + _send_broadcast_recipients(broadcast_id, subject, body, recipients[middle:])
+    )
+
+
+def _broadcast_batch_size() -> int:
+    configured = int(current_app.config.get("EMAIL_BROADCAST_BATCH_SIZE", SENDGRID_MAX_PERSONALIZATIONS))
+    return max(1, min(configured, SENDGRID_MAX_PERSONALIZATIONS))
+
+
+def _dispatch_tasks(claimed, broadcasts: dict[int, tuple[str, str]]) -> list[tuple]:
+    """Turn claimed rows into send tasks: one per single email, one per broadcast batch."""
+    tasks = []
+    recipients_by_broadcast = defaultdict(list)
+    for row in claimed:
+        if row.broadcast_id is None:
+            tasks.append((
+                _send_claimed_email,
+                row.id,
+                row.retry_count,
+                row.to_email,
+                row.subject,
+                row.body,
+                row.template_key,
+                row.context,
+            ))
+        else:
+            recipients_by_broadcast[row.broadcast_id].append((row.id, row.retry_count, row.to_email, row.substitutions))
+
+    batch_size = _broadcast_batch_size()
+    for broadcast_id, recipients in recipients_by_broadcast.items():
+        subject, body = broadcasts[broadcast_id]
+        for start in range(0, len(recipients), batch_size):
+            tasks.append(
+                (_send_claimed_broadcast_batch, broadcast_id, subject, body, recipients[start:start + batch_size])
+            )
+    return tasks
+
+
+def _dispatch(tasks: list[tuple]) -> list[SendOutcome]:
+    concurrency = max(1, int(current_app.config.get("EMAIL_SEND_CONCURRENCY", 8)))
+    app = current_app._get_current_object()
+    if concurrency == 1 or len(tasks) == 1:
+        results = [send(app, *args) for send, *args in tasks]
+    else:
+        executor = _get_dispatch_executor(concurrency)
+        futures = [executor.submit(send, app, *args) for send, *args in tasks]
+        results = [future.result() for future in futures]
+    return [outcome for result in results for outcome in result]
+
+
+def _retry_delay_seconds(attempt: int, retry_after: float | None) -> float:
+    """Exponential backoff with jitter for ``attempt`` (1-based), or the provider's ``Retry-After``."""
+    if retry_after is not None:
+        return retry_after
+    base_seconds = float(current_app.config.get("EMAIL_RETRY_BACKOFF_BASE_SECONDS", 30))
+    max_seconds = float(current_app.config.get("EMAIL_RETRY_BACKOFF_MAX_SECONDS", 3600))
+    delay = min(max_seconds, base_seconds * 2 ** (attempt - 1))
+    # Jitter spreads out retries of rows that failed together.
+    return random.uniform(delay / 2, delay)
+
+
+def _apply_outcomes(outcomes: list[SendOutcome], claim_token: str, max_retries: int) -> None:
+    """Persist send results in bulk with a single commit.
+
+    Sent rows and deferred rows take one UPDATE each; failed rows get their own
+    ``next_attempt_at`` and share one executemany UPDATE. Every UPDATE is
+    scoped to ``claim_token`` so rows reclaimed by another worker after a claim
+    expired are left alone.
+    """
+    now = _utcnow_naive()
+    sent_ids = [outcome.email_id for outcome in outcomes if outcome.error is None and not outcome.deferred]
+    deferred_ids = [outcome.email_id for outcome in outcomes if outcome.deferred]
+    failed = [outcome for outcome in outcomes if outcome.error is not None]
+
+    claimed_by_us = (
+        EmailNotification.status == "processing",
+        EmailNotification.processing_claim_token == claim_token,
+    )
+    if sent_ids:
+        EmailNotification.query.filter(EmailNotification.id.in_(sent_ids), *claimed_by_us).update(
+            {
+                EmailNotification.status: "sent",
+                EmailNotification.sent_at: now,
+                EmailNotification.last_error: None,
+                EmailNotification.processing_claim_token: None,
+                EmailNotification.claimed_at: None,
+            },
+            synchronize_session=False,
+        )
+
+    if deferred_ids:
+        EmailNotification.query.filter(EmailNotification.id.in_(deferred_ids), *claimed_by_us).update(
+            {
+                EmailNotification.status: "pending",
+                EmailNotification.next_attempt_at: now + timedelta(seconds=_circuit_breaker.remaining_seconds()),
+                EmailNotification.processing_claim_token: None,
+                EmailNotification.claimed_at: None,
+            },
+            synchronize_session=False,
+        )
+
+    if failed:
+        table = EmailNotification.__table__
+        db.session.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("failed_id"),
+                table.c.status == "processing",
+                table.c.processing_claim_token == claim_token,
+            )
+            .values(
+                status=bindparam("new_status"),
+                retry_count=bindparam("new_retry_count"),
+                last_error=bindparam("error"),
+                next_attempt_at=bindparam("retry_at"),
+                processing_claim_token=None,
+                claimed_at=None,
+            ),
+            [
+                {
+                    "failed_id": outcome.email_id,
+                    "new_status": "failed" if outcome.retry_count + 1 >= max_retries else "pending",
+                    "new_retry_count": outcome.retry_count + 1,
+                    "error": outcome.error,
+                    "retry_at": now + timedelta(
+                        seconds=_retry_delay_seconds(outcome.retry_count + 1, outcome.retry_after)
+                    ),
+                }
+                for outcome in failed
+            ],
+        )
+
+    try:
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("Failed to persist queued email statuses", extra={"count": len(outcomes)})
+    else:
+        logger.info(
+            "Queued email batch processed",
+            extra={"sent_count": len(sent_ids), "failed_count": len(failed), "deferred_count": len(deferred_ids)},
+        )
+
+
+def _lane_weights() -> dict[str, int]:
+    """Parse ``EMAIL_LANE_WEIGHTS`` (``lane:weight`` pairs); unlisted lanes weigh 1."""
+    weights = dict.fromkeys(EMAIL_LANES, 1)
+    configured = current_app.config.get("EMAIL_LANE_WEIGHTS") or ""
+    for item in configured.split(","):
+        lane, _, weight = item.partition(":")
+        lane = lane.strip()
+        if lane not in weights:
+            continue
+        try:
+            weights[lane] = max(1, int(weight))
+        except ValueError:
+            logger.warning("Ignoring invalid email lane weight", extra={"lane": lane, "weight": weight})
+    return weights
+
+
+def _lane_quotas(due_counts: dict[str, int], weights: dict[str, int], batch_size: int) -> dict[str, int]:
+    """Split ``batch_size`` claims between lanes with due emails.
+
+    Each round gives every lane that still has due emails its weighted share
+    of the remaining capacity (at least one claim, most urgent lane first);
+    shares a lane cannot fill are handed out again in the next round.
+    """
+    quotas = dict.fromkeys(EMAIL_LANES, 0)
+    remaining = batch_size
+    while remaining > 0:
+        wanting = [lane for lane in EMAIL_LANES if due_counts.get(lane, 0) > quotas[lane]]
+        if not wanting:
+            break
+        total_weight = sum(weights[lane] for lane in wanting)
+        round_capacity = remaining
+        for lane in wanting:
+            share = max(1, round_capacity * weights[lane] // total_weight)
+            share = min(share, due_counts[lane] - quotas[lane], remaining)
+            quotas[lane] += share
+            remaining -= share
+            if not remaining:
+                break
+    return {lane: quota for lane, quota in quotas.items() if quota}
+
+
+def _collect_lane_stats(now: datetime, max_retries: int) -> dict[str, int]:
+    """Publish per-lane queue gauges and return due individual (non-broadcast) emails per lane."""
+    is_due = EmailNotification.next_attempt_at <= now
+    rows = db.session.execute(
+        select(
+            EmailNotification.lane,
+            func.count(),
+            func.sum(case((is_due & EmailNotification.broadcast_id.is_(None), 1), else_=0)),
+            func.min(case((is_due, EmailNotification.next_attempt_at))),
+        ).where(
+            EmailNotification.status == "pending",
+            EmailNotification.retry_count < max_retries,
+        ).group_by(EmailNotification.lane)
+    ).all()
+    stats = {lane: (depth, due or 0, oldest_due) for lane, depth, due, oldest_due in rows}
+
+    due_counts = {}
+    for lane in EMAIL_LANES:
+        depth, due, oldest_due = stats.get(lane, (0, 0, None))
+        # SQLite returns MIN() over a CASE expression as a string.
+        if isinstance(oldest_due, str):
+            oldest_due = datetime.fromisoformat(oldest_due)
+        set_gauge(f"email.lane.{lane}.depth", depth)
+        set_gauge(
+            f"email.lane.{lane}.oldest_due_age_seconds",
+            round((now - oldest_due).total_seconds(), 3) if oldest_due else 0.0,
+        )
+        due_counts[lane] = due
+    return due_counts
+
+
+def process_pending_emails() -> int:
     """
     Background job that:
-    - Fetches pending emails
-    - Attempts to send
-    - Retries on failure
+    - Publishes per-lane queue depth and age gauges
+    - Fetches pending emails whose ``next_attempt_at`` has come, splitting
+      ``EMAIL_BATCH_SIZE`` between lanes by weight, unless the circuit
+      breaker has paused dispatch
+    - Sends them concurrently (``EMAIL_SEND_CONCURRENCY`` pooled senders),
+      broadcast recipients in batches of ``EMAIL_BROADCAST_BATCH_SIZE`` per request
+    - Records sent/retry/failed outcomes in bulk; retries are scheduled with
+      exponential backoff and jitter, or after the provider's ``Retry-After``
+
+    Returns the number of emails claimed, so callers can keep draining while
+    it is non-zero.
     """
     max_retries = current_app.config["EMAIL_MAX_RETRIES"]
     batch_size = current_app.config["EMAIL_BATCH_SIZE"]
+    broadcast_claim_size = int(current_app.config.get("EMAIL_BROADCAST_CLAIM_SIZE", 5000))
     claim_ttl_seconds = current_app.config["EMAIL_PROCESSING_CLAIM_TTL_SECONDS"]
     now = _utcnow_naive()
 
@@ -101,14 +822,44 @@ def process_pending_emails():
         db.session.commit()
         logger.warning("Reclaimed stale email processing claims", extra={"count": reclaimed_count})
 
+    due_counts = _collect_lane_stats(now, max_retries)
+
+    paused_seconds = _circuit_breaker.remaining_seconds()
+    if paused_seconds:
+        logger.info("Email dispatch paused by circuit breaker", extra={"remaining_seconds": round(paused_seconds, 1)})
+        return 0
+
     claim_token = uuid4().hex
-    candidate_ids = select(EmailNotification.id).where(
+    # SKIP LOCKED: concurrent workers claim disjoint batches (a no-op on SQLite, see module docstring).
+    lane_candidate_ids = [
+        select(EmailNotification.id).where(
+            EmailNotification.status == "pending",
+            EmailNotification.lane == lane,
+            EmailNotification.next_attempt_at <= now,
+            EmailNotification.retry_count < max_retries,
+            EmailNotification.broadcast_id.is_(None),
+        ).order_by(
+            EmailNotification.next_attempt_at.asc(),
+            EmailNotification.id.asc(),
+        ).limit(quota).with_for_update(skip_locked=True)
+        for lane, quota in _lane_quotas(due_counts, _lane_weights(), batch_size).items()
+    ]
+    # Broadcast recipients are cheap to send in bulk, so they get a much larger claim.
+    broadcast_candidate_ids = select(EmailNotification.id).where(
         EmailNotification.status == "pending",
+        EmailNotification.next_attempt_at <= now,
         EmailNotification.retry_count < max_retries,
-    ).order_by(EmailNotification.created_at.asc()).limit(batch_size)
+        EmailNotification.broadcast_id.isnot(None),
+    ).order_by(
+        EmailNotification.broadcast_id.asc(),
+        EmailNotification.id.asc(),
+    ).limit(broadcast_claim_size).with_for_update(skip_locked=True)
 
     claimed_count = EmailNotification.query.filter(
-        EmailNotification.id.in_(candidate_ids),
+        or_(
+            *(EmailNotification.id.in_(candidate_ids) for candidate_ids in lane_candidate_ids),
+            EmailNotification.id.in_(broadcast_candidate_ids),
+        ),
         EmailNotification.status == "pending",
     ).update(
         {
@@ -121,48 +872,60 @@ def process_pending_emails():
     db.session.commit()
 
     if not claimed_count:
-        return
+        return 0
 
-    pending_emails = EmailNotification.query.filter(
-        EmailNotification.status == "processing",
-        EmailNotification.processing_claim_token == claim_token,
-    ).order_by(EmailNotification.created_at.asc()).all()
+    # Plain tuples: ORM instances must not cross into the sender threads.
+    claimed = db.session.execute(
+        select(
+            EmailNotification.id,
+            EmailNotification.retry_count,
+            EmailNotification.to_email,
+            EmailNotification.subject,
+            EmailNotification.body,
+            EmailNotification.template_key,
+            EmailNotification.context,
+            EmailNotification.broadcast_id,
+            EmailNotification.substitutions,
+        ).where(
+            EmailNotification.status == "processing",
+            EmailNotification.processing_claim_token == claim_token,
+        ).order_by(EmailNotification.created_at.asc(), EmailNotification.id.asc())
+    ).all()
+    broadcast_ids = {row.broadcast_id for row in claimed if row.broadcast_id is not None}
+    broadcasts = {}
+    if broadcast_ids:
+        broadcasts = {
+            row.id: (row.subject, row.body)
+            for row in db.session.execute(
+                select(EmailBroadcast.id, EmailBroadcast.subject, EmailBroadcast.body).where(
+                    EmailBroadcast.id.in_(broadcast_ids)
+                )
+            )
+        }
+    # Release the connection while the batch waits on the provider.
+    db.session.rollback()
 
-    logger.info("Processing pending emails", extra={"count": len(pending_emails)})
+    tasks = _dispatch_tasks(claimed, broadcasts)
+    logger.info("Processing pending emails", extra={"count": len(claimed), "request_count": len(tasks)})
+    outcomes = _dispatch(tasks)
+    _apply_outcomes(outcomes, claim_token, max_retries)
+    return claimed_count
 
-    for email in pending_emails:
-        try:
-            _send_via_sendgrid(email.to_email, email.subject, email.body)
-
-            email.status = "sent"
-            email.sent_at = _utcnow_naive()
-            email.last_error = None
-            email.processing_claim_token = None
-            email.claimed_at = None
-
-        except Exception as e:
-            email.retry_count += 1
-            email.last_error = str(e)
-            email.processing_claim_token = None
-            email.claimed_at = None
-            logger.exception(
-                "Failed to send queued email",
-                extra={
-                    "email_id": email.id,
-                    "to_email": email.to_email,
-                    "subject": email.subject,
-                    "retry_count": email.retry_count,
-                },
-            )
 
-            if email.retry_count >= max_retries:
-                email.status = "failed"
-            else:
-                email.status = "pending"
-
-        finally:
-            try:
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
-                logger.exception("Failed to persist queued email status", extra={"email_id": email.id})
+def seconds_until_next_email(max_seconds: float) -> float:
+    """How long the dispatcher may sleep: until the next retry is due or the circuit closes, at most ``max_seconds``.
+
+    Newly queued emails wake the dispatcher early (see ``utils.email_wakeup``).
+    """
+    max_retries = current_app.config["EMAIL_MAX_RETRIES"]
+    next_attempt_at = db.session.scalar(
+        select(func.min(EmailNotification.next_attempt_at)).where(
+            EmailNotification.status == "pending",
+            EmailNotification.retry_count < max_retries,
+        )
+    )
+    db.session.rollback()
+    wait_seconds = max_seconds
+    if next_attempt_at is not None:
+        wait_seconds = min(wait_seconds, (next_attempt_at - _utcnow_naive()).total_seconds())
+    return min(max_seconds, max(0.0, wait_seconds, _circuit_breaker.remaining_seconds()))
@@ -0,0 +1,82 @@
+"""Registry of email body templates rendered at dispatch time.
+
+Queued emails store a ``template_key`` and a small JSON ``context`` instead of
+rendered HTML; the dispatcher renders the body just before sending. All
+templates are compiled once when this module is imported. Autoescaping is on,
+so names, titles and comments from users are escaped.
+"""
+
+from jinja2 import DictLoader, Environment, StrictUndefined, TemplateNotFound
+
+EMAIL_TEMPLATE_SOURCES = {
+    "payment_confirmed.student": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>Your payment for <strong>{{ course_title }}</strong> was confirmed successfully.</p>"
+        "<p>You can now continue with onboarding and schedule your first session.</p>"
+        "{% if onboarding_booking_url %}"
+        "<p><a href=\"{{ onboarding_booking_url }}\">Book your onboarding meeting now</a></p>"
+        "{% endif %}"
+    ),
+    "payment_confirmed.admin": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>A payment for <strong>{{ course_title }}</strong> was confirmed.</p>"
+        "<p><strong>Student:</strong> {{ student_name }}</p>"
+    ),
+    "schedule_created.student": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>Your schedule for <strong>{{ course_title }}</strong> has been updated.</p>"
+        "<p>{{ schedule_count }} session{{ 's' if schedule_count != 1 else '' }} were created"
+        "{% if first_date %} starting on <strong>{{ first_date }}</strong>{% endif %}.</p>"
+    ),
+    "schedule_created.admin": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>A schedule for <strong>{{ course_title }}</strong> has been created.</p>"
+        "<p><strong>Student:</strong> {{ student_name }}<br/>"
+        "<strong>Sessions:</strong> {{ schedule_count }}</p>"
+    ),
+    "schedule_change_requested.admin": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>A student requested a schedule change.</p>"
+        "<p><strong>Student:</strong> {{ student_name }}<br/>"
+        "<strong>Email:</strong> {{ student_email }}<br/>"
+        "<strong>Course:</strong> {{ course_title }}<br/>"
+        "<strong>Schedule ID:</strong> {{ schedule_id }}<br/>"
+        "<strong>Date:</strong> {{ date }}<br/>"
+        "<strong>Time:</strong> {{ time }}</p>"
+        "<p><strong>Request Subject:</strong> {{ subject }}</p>"
+        "<p><strong>Comments:</strong><br/>{{ comments or 'No additional comments provided.' }}</p>"
+    ),
+    "meeting_reminder.student": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>This is a reminder that your session for <strong>{{ course_title }}</strong>"
+        " starts in {{ lead_minutes }} minute(s).</p>"
+        "<p><strong>Date:</strong> {{ date }}<br/><strong>Time:</strong> {{ time }}</p>"
+    ),
+    "meeting_reminder.admin": (
+        "<p>Hi {{ first_name }},</p>"
+        "<p>Reminder: a session for <strong>{{ course_title }}</strong> starts in {{ lead_minutes }} minute(s).</p>"
+        "<p><strong>Student:</strong> {{ student_name }}<br/>"
+        "<strong>Date:</strong> {{ date }}<br/><strong>Time:</strong> {{ time }}</p>"
+    ),
+    # Rendered once per broadcast; SendGrid fills -first_name- per recipient.
+    "new_course.broadcast": (
+        "<p>Hi -first_name-,</p>"
+        "<p>A new course <strong>{{ course_title }}</strong> is now available on InsideOut.</p>"
+        "<p>Log in to explore the new content.</p>"
+    ),
+}
+
+_environment = Environment(
+    loader=DictLoader(EMAIL_TEMPLATE_SOURCES),
+    autoescape=True,
+    undefined=StrictUndefined,
+)
+_TEMPLATES = {key: _environment.get_template(key) for key in EMAIL_TEMPLATE_SOURCES}
+
+
+def render_email_body(template_key: str, context: dict | None) -> str:
+    """Render the registered template ``template_key`` with ``context``."""
+    template = _TEMPLATES.get(template_key)
+    if template is None:
+        raise TemplateNotFound(template_key)
+    return template.render(context or {})
@@ -0,0 +1,126 @@
+"""Wake the email dispatcher as soon as queued emails are committed.
+
+``queue_email`` and friends call ``signal_email_queued()`` inside the
+transaction that inserts the rows. That does two things:
+- flags the session, and a session ``after_commit`` hook then sets the
+  in-process ``email_wakeup``; a rollback drops the flag, so the dispatcher is
+  never woken for rows that were not committed
+- on PostgreSQL, runs ``pg_notify('email_queue', '')``, which the database
+  delivers to listeners only when the transaction commits
+
+The dispatcher (``utils.scheduler``) waits on ``email_wakeup``. When it runs in
+another process, for example ``flask worker``, a ``PostgresWakeupListener``
+thread there holds a ``LISTEN email_queue`` connection and turns
+notifications into ``email_wakeup.set()``. SQLite has no cross-process
+signal, so a dispatcher in another process picks up emails queued elsewhere
+on its idle poll (``EMAIL_IDLE_POLL_SECONDS``).
+"""
+
+import logging
+import select as select_module
+import threading
+
+from sqlalchemy import event, func, select
+
+from db import db
+
+logger = logging.getLogger(__name__)
+
+EMAIL_WAKEUP_CHANNEL = "email_queue"
+# Session.info key marking a transaction that queued emails.
+_QUEUED_KEY = "email_wakeup_pending"
+# Seconds between checks for shutdown while listening, and before reconnecting.
+_LISTEN_POLL_SECONDS = 5.0
+
+
+class Wakeup:
+    """A sticky wakeup flag: a ``set()`` while nobody waits is kept for the next ``wait()``."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending = False
+
+    def set(self) -> None:
+        with self._condition:
+            self._pending = True
+            self._condition.notify_all()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until ``set()`` or ``timeout`` seconds; return whether it was woken. Clears the flag."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending, timeout)
+            woken = self._pending
+            self._pending = False
+        return woken
+
+    def clear(self) -> None:
+        with self._condition:
+            self._pending = False
+
+
+email_wakeup = Wakeup()
+
+
+def signal_email_queued() -> None:
+    """Wake the email dispatcher once the current transaction commits."""
+    db.session.info[_QUEUED_KEY] = True
+    if db.session.get_bind().dialect.name == "postgresql":
+        db.session.execute(select(func.pg_notify(EMAIL_WAKEUP_CHANNEL, "")))
+
+
+@event.listens_for(db.session, "after_commit")
+def _wake_after_commit(session) -> None:
+    if session.info.pop(_QUEUED_KEY, False):
+        email_wakeup.set()
+
+
+@event.listens_for(db.session, "after_rollback")
+def _forget_after_rollback(session) -> None:
+    session.info.pop(_QUEUED_KEY, None)
+
+
+class PostgresWakeupListener(threading.Thread):
+    """Relay ``NOTIFY email_queue`` from other processes to ``email_wakeup``.
+
+    Holds one dedicated connection (taken out of the pool) in autocommit mode.
+    After a connection error it reconnects and wakes the dispatcher once, in
+    case a notification was missed in between.
+    """
+
+    def __init__(self, engine) -> None:
+        super().__init__(name="email-wakeup-listener", daemon=True)
+        self._engine = engine
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            connection = None
+            try:
+                connection = self._engine.raw_connection()
+                connection.detach()
+                driver_connection = connection.driver_connection
+                driver_connection.autocommit = True
+                with driver_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {EMAIL_WAKEUP_CHANNEL}")
+                logger.info("Listening for queued email notifications", extra={"channel": EMAIL_WAKEUP_CHANNEL})
+                email_wakeup.set()
+                self._relay(driver_connection)
+            except Exception:
+                logger.exception("Email wakeup listener failed; reconnecting")
+                self._stopped.wait(_LISTEN_POLL_SECONDS)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _relay(self, driver_connection) -> None:
+        while not self._stopped.is_set():
+            readable, _, _ = select_module.select([driver_connection], [], [], _LISTEN_POLL_SECONDS)
+            if not readable:
+                continue
+            driver_connection.poll()
+            if driver_connection.notifies:
+                driver_connection.notifies.clear()
+                email_wakeup.set()
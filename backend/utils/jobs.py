@@ -0,0 +1,160 @@
+"""Database-backed background job queue.
+
+Jobs are rows in ``background_jobs`` identified by a ``kind``. Handlers
+register with ``job_handler(kind)`` and receive the job's JSON payload inside
+an app context. ``process_pending_jobs`` claims due jobs with a per-batch
+token (the same claim/reclaim scheme as the email queue), runs them, and
+retries failures after a growing delay until ``max_attempts`` is reached.
+Claims lock candidates with ``FOR UPDATE SKIP LOCKED`` so several workers
+take disjoint batches (see ``utils.email`` for the SQLite behaviour).
+
+Handlers must be idempotent: a job whose claim expires is run again.
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from flask import current_app
+from sqlalchemy import select
+
+from db import db
+from models.job import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+_HANDLERS = {}
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def job_handler(kind: str):
+    """Register the decorated function as the handler for jobs of ``kind``."""
+
+    def decorator(fn):
+        _HANDLERS[kind] = fn
+        return fn
+
+    return decorator
+
+
+def enqueue_job(kind: str, payload: dict | None = None, *, run_after: datetime | None = None) -> BackgroundJob:
+    """Add a job to the current session; the caller commits it with its own transaction."""
+    job = BackgroundJob()
+    job.kind = kind
+    job.payload = payload or {}
+    job.max_attempts = int(current_app.config.get("BACKGROUND_JOB_MAX_ATTEMPTS", 3))
+    job.run_after = run_after or _utcnow_naive()
+    db.session.add(job)
+    logger.debug("Background job enqueued", extra={"kind": kind})
+    return job
+
+
+def _reclaim_stale_jobs(now: datetime) -> None:
+    claim_ttl_seconds = int(current_app.config.get("BACKGROUND_JOB_CLAIM_TTL_SECONDS", 900))
+    stale_threshold = now - timedelta(seconds=claim_ttl_seconds)
+    reclaimed_count = BackgroundJob.query.filter(
+        BackgroundJob.status == "processing",
+        BackgroundJob.claimed_at.isnot(None),
+        BackgroundJob.claimed_at < stale_threshold,
+    ).update(
+        {
+            BackgroundJob.status: "pending",
+            BackgroundJob.processing_claim_token: None,
+            BackgroundJob.claimed_at: None,
+            BackgroundJob.last_error: "Claim expired before processing completed.",
+        },
+        synchronize_session=False,
+    )
+    if reclaimed_count:
+        db.session.commit()
+        logger.warning("Reclaimed stale background job claims", extra={"count": reclaimed_count})
+
+
+def _record_failure(job_id: int, error: Exception) -> None:
+    job = db.session.get(BackgroundJob, job_id)
+    if job is None:
+        return
+
+    retry_delay_seconds = int(current_app.config.get("BACKGROUND_JOB_RETRY_DELAY_SECONDS", 60))
+    job.attempts += 1
+    job.last_error = str(error)
+    job.processing_claim_token = None
+    job.claimed_at = None
+    if job.attempts >= job.max_attempts:
+        job.status = "failed"
+        job.finished_at = _utcnow_naive()
+    else:
+        job.status = "pending"
+        job.run_after = _utcnow_naive() + timedelta(seconds=retry_delay_seconds * job.attempts)
+
+
+def process_pending_jobs(batch_size: int | None = None) -> int:
+    """Run one batch of due jobs and return how many were claimed."""
+    batch_size = batch_size or int(current_app.config.get("BACKGROUND_JOB_BATCH_SIZE", 10))
+    now = _utcnow_naive()
+    _reclaim_stale_jobs(now)
+
+    claim_token = uuid4().hex
+    candidate_ids = select(BackgroundJob.id).where(
+        BackgroundJob.status == "pending",
+        BackgroundJob.run_after <= now,
+    ).order_by(
+        BackgroundJob.run_after.asc(),
+        BackgroundJob.id.asc(),
+    ).limit(batch_size).with_for_update(skip_locked=True)
+
+    claimed_count = BackgroundJob.query.filter(
+        BackgroundJob.id.in_(candidate_ids),
+        BackgroundJob.status == "pending",
+    ).update(
+        {
+            BackgroundJob.status: "processing",
+            BackgroundJob.processing_claim_token: claim_token,
+            BackgroundJob.claimed_at: now,
+        },
+        synchronize_session=False,
+    )
+    db.session.commit()
+
+    if not claimed_count:
+        return 0
+
+    claimed_jobs = [
+        (job.id, job.kind, dict(job.payload or {}))
+        for job in BackgroundJob.query.filter_by(processing_claim_token=claim_token)
+        .order_by(BackgroundJob.run_after.asc(), BackgroundJob.id.asc())
+        .all()
+    ]
+    logger.info("Processing background jobs", extra={"count": len(claimed_jobs)})
+
+    for job_id, kind, payload in claimed_jobs:
+        try:
+            handler = _HANDLERS.get(kind)
+            if handler is None:
+                raise RuntimeError(f"No handler registered for background job kind '{kind}'.")
+
+            handler(payload)
+            db.session.commit()
+
+            job = db.session.get(BackgroundJob, job_id)
+            job.status = "succeeded"
+            job.attempts += 1
+            job.last_error = None
+            job.processing_claim_token = None
+            job.claimed_at = None
+            job.finished_at = _utcnow_naive()
+        except Exception as exc:
+            db.session.rollback()
+            logger.exception("Background job failed", extra={"job_id": job_id, "kind": kind})
+            _record_failure(job_id, exc)
+        finally:
+            try:
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                logger.exception("Failed to persist background job status", extra={"job_id": job_id})
+
+    return claimed_count
@@ -0,0 +1,136 @@
+"""Database-backed leader election for periodic jobs.
+
+Every process that runs the scheduler competes for one row of
+``scheduler_leases``. A process holds the lease until ``expires_at`` and renews
+it well before then; another process can take the lease over only after it
+has expired. The meeting reminder tick runs only in the process holding the
+lease, so scaling web instances or running several ``flask worker`` processes
+never runs it twice. Queue draining is not gated by the lease.
+
+Acquiring and renewing is a single conditional ``UPDATE`` (plus an ``INSERT``
+the first time), so it works the same on PostgreSQL and SQLite and needs no
+session-level locks. Lease times come from the application clock, so hosts
+competing for a lease should keep their clocks in sync (NTP).
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import case, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from db import db
+from models import SchedulerLease
+from utils.metrics import set_gauge
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LEASE_NAME = "scheduler"
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _default_holder() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """One process's claim on a named lease row."""
+
+    def __init__(self, name: str, holder: str | None = None) -> None:
+        self.name = name
+        self.holder = holder or _default_holder()
+        self._lock = threading.Lock()
+        self._held_until = 0.0
+
+    def acquire(self, ttl_seconds: float) -> bool:
+        """Take or renew the lease for ``ttl_seconds``; return whether this process holds it.
+
+        Must run inside an application context. Database errors are logged and
+        count as not holding the lease.
+        """
+        started = time.monotonic()
+        now = _utcnow_naive()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        table = SchedulerLease.__table__
+        try:
+            with db.engine.begin() as connection:
+                held = connection.execute(
+                    update(table)
+                    .where(
+                        table.c.name == self.name,
+                        or_(table.c.holder == self.holder, table.c.expires_at <= now),
+                    )
+                    .values(
+                        holder=self.holder,
+                        expires_at=expires_at,
+                        acquired_at=case((table.c.holder == self.holder, table.c.acquired_at), else_=now),
+                        renewed_at=now,
+                    )
+                ).rowcount == 1
+                if not held and connection.execute(
+                    select(table.c.name).where(table.c.name == self.name)
+                ).first() is None:
+                    connection.execute(
+                        insert(table).values(
+                            name=self.name,
+                            holder=self.holder,
+                            expires_at=expires_at,
+                            acquired_at=now,
+                            renewed_at=now,
+                        )
+                    )
+                    held = True
+        except IntegrityError:
+            # Another process inserted the row first.
+            held = False
+        except SQLAlchemyError:
+            logger.exception("Leader lease renewal failed", extra={"lease": self.name})
+            held = False
+
+        with self._lock:
+            was_leader = self._held_until > time.monotonic()
+            # Measured from before the round trip, so the local view expires no later than the row.
+            self._held_until = started + ttl_seconds if held else 0.0
+        if held and not was_leader:
+            logger.info("Acquired leader lease", extra={"lease": self.name, "holder": self.holder})
+        elif was_leader and not held:
+            logger.warning("Lost leader lease", extra={"lease": self.name, "holder": self.holder})
+        set_gauge(f"scheduler.{self.name}.leader", 1 if held else 0)
+        return held
+
+    def is_leader(self) -> bool:
+        """Whether the last successful renewal is still within its TTL."""
+        with self._lock:
+            return self._held_until > time.monotonic()
+
+    def release(self) -> None:
+        """Expire the lease now if this process holds it, so another process can take over."""
+        with self._lock:
+            was_leader = self._held_until > time.monotonic()
+            self._held_until = 0.0
+        set_gauge(f"scheduler.{self.name}.leader", 0)
+        if not was_leader:
+            return
+        table = SchedulerLease.__table__
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(
+                    update(table)
+                    .where(table.c.name == self.name, table.c.holder == self.holder)
+                    .values(expires_at=_utcnow_naive())
+                )
+        except SQLAlchemyError:
+            logger.exception("Leader lease release failed", extra={"lease": self.name})
+            return
+        logger.info("Released leader lease", extra={"lease": self.name, "holder": self.holder})
+
+
+scheduler_lease = LeaderLease(SCHEDULER_LEASE_NAME)
@@ -0,0 +1,188 @@
+"""Background derivatives for uploaded course media.
+
+Course writes store only the original upload and enqueue a job; the job
+worker then produces:
+- responsive WebP variants of course images (requires Pillow), recorded on
+  ``Course.image_variants`` as ``[{"width", "height", "url"}, ...]``
+- a poster frame for preview videos when ``ffmpeg`` is on the PATH, recorded
+  on ``Course.preview_poster_url``.
+
+Handlers re-check that the course still points at the original they were
+queued for, so a replaced upload never receives stale derivatives. Because
+uploads are content-addressed, a course that reuses an original another
+course already has copies that course's derivatives instead of queuing a job.
+"""
+
+import importlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from io import BytesIO
+
+from flask import current_app
+
+from db import db
+from models import Course
+from utils.jobs import enqueue_job, job_handler
+from utils.media_upload import MediaUploadService
+from utils.response_cache import invalidate_response_cache
+
+logger = logging.getLogger(__name__)
+
+IMAGE_VARIANTS_JOB = "media.image_variants"
+VIDEO_POSTER_JOB = "media.video_poster"
+
+
+def _variant_widths():
+    widths = current_app.config.get("MEDIA_IMAGE_VARIANT_WIDTHS") or (320, 640, 1280)
+    return sorted({int(width) for width in widths if int(width) > 0})
+
+
+def _derivative_key(storage_key, suffix):
+    stem = storage_key.rsplit(".", 1)[0]
+    return f"{stem}-{suffix}"
+
+
+def enqueue_course_media_derivatives(course, stored_media):
+    """Reset stale derivatives for a new upload and queue their regeneration.
+
+    ``course`` must already have an id (flush first for new rows). The job is
+    committed with the caller's transaction.
+    """
+    if stored_media is None:
+        return None
+
+    payload = {"course_id": course.id, "storage_key": stored_media.storage_key, "url": stored_media.url}
+    if stored_media.media_type == "images":
+        course.image_variants = _existing_derivative(Course.image_url, Course.image_variants, stored_media.url)
+        if course.image_variants is not None:
+            return None
+        return enqueue_job(IMAGE_VARIANTS_JOB, payload)
+    if stored_media.media_type == "videos":
+        course.preview_poster_url = _existing_derivative(
+            Course.preview_video_url, Course.preview_poster_url, stored_media.url
+        )
+        if course.preview_poster_url is not None:
+            return None
+        return enqueue_job(VIDEO_POSTER_JOB, payload)
+    return None
+
+
+def _existing_derivative(source_column, derivative_column, url):
+    """Return a derivative another course already built for the same original, if any."""
+    with db.session.no_autoflush:
+        return db.session.execute(
+            db.select(derivative_column)
+            .where(source_column == url, derivative_column.isnot(None))
+            .limit(1)
+        ).scalar()
+
+
+def _load_pillow():
+    try:
+        return importlib.import_module("PIL.Image"), importlib.import_module("PIL.ImageOps")
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("Pillow is required for course image variants.") from exc
+
+
+@job_handler(IMAGE_VARIANTS_JOB)
+def build_course_image_variants(payload):
+    """Render WebP variants of a course image at the configured widths."""
+    course = db.session.get(Course, payload["course_id"])
+    if course is None or course.image_url != payload["url"]:
+        logger.info("Skipping image variants for replaced or deleted media", extra={"payload": payload})
+        return
+
+    Image, ImageOps = _load_pillow()
+    media_service = MediaUploadService.from_app(current_app)
+    quality = int(current_app.config.get("MEDIA_IMAGE_VARIANT_QUALITY", 80))
+    original_bytes = media_service.read_bytes(payload["storage_key"])
+
+    variants = []
+    with Image.open(BytesIO(original_bytes)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        # Never upscale; small originals still get one WebP at their own width.
+        widths = [width for width in _variant_widths() if width < image.width] or [image.width]
+        for width in widths:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            resized.save(buffer, format="WEBP", quality=quality, method=4)
+            url = media_service.store_bytes(
+                _derivative_key(payload["storage_key"], f"w{width}.webp"),
+                buffer.getvalue(),
+                "image/webp",
+            )
+            variants.append({"width": width, "height": height, "url": url})
+
+    course.image_variants = variants
+    db.session.commit()
+    invalidate_response_cache("catalog")
+    logger.info("Course image variants generated", extra={"course_id": course.id, "count": len(variants)})
+
+
+def _ffmpeg_binary():
+    return shutil.which(current_app.config.get("MEDIA_FFMPEG_BINARY") or "ffmpeg")
+
+
+@job_handler(VIDEO_POSTER_JOB)
+def build_course_video_poster(payload):
+    """Extract a representative JPEG frame from a course preview video."""
+    course = db.session.get(Course, payload["course_id"])
+    if course is None or course.preview_video_url != payload["url"]:
+        logger.info("Skipping video poster for replaced or deleted media", extra={"payload": payload})
+        return
+
+    ffmpeg = _ffmpeg_binary()
+    if not ffmpeg:
+        logger.info("ffmpeg not available; skipping video poster", extra={"course_id": course.id})
+        return
+
+    media_service = MediaUploadService.from_app(current_app)
+    poster_width = int(current_app.config.get("MEDIA_VIDEO_POSTER_WIDTH", 1280))
+    timeout_seconds = int(current_app.config.get("MEDIA_FFMPEG_TIMEOUT_SECONDS", 120))
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if media_service.driver == "local":
+            source_path = media_service.local_path(payload["storage_key"])
+        else:
+            source_path = os.path.join(work_dir, os.path.basename(payload["storage_key"]))
+            with open(source_path, "wb") as source:
+                source.write(media_service.read_bytes(payload["storage_key"]))
+
+        poster_path = os.path.join(work_dir, "poster.jpg")
+        subprocess.run(
+            [
+                ffmpeg,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-y",
+                "-i",
+                source_path,
+                "-vf",
+                f"thumbnail,scale='min({poster_width},iw)':-2",
+                "-frames:v",
+                "1",
+                poster_path,
+            ],
+            check=True,
+            capture_output=True,
+            timeout=timeout_seconds,
+        )
+        with open(poster_path, "rb") as poster:
+            poster_bytes = poster.read()
+
+    course.preview_poster_url = media_service.store_bytes(
+        _derivative_key(payload["storage_key"], "poster.jpg"),
+        poster_bytes,
+        "image/jpeg",
+    )
+    db.session.commit()
+    invalidate_response_cache("catalog")
+    logger.info("Course video poster generated", extra={"course_id": course.id})
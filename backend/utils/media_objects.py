@@ -0,0 +1,162 @@
+"""Reference counting and garbage collection for stored course media.
+
+Each stored object has a ``media_objects`` row whose ``ref_count`` is the
+number of course fields (``image_url`` / ``preview_video_url``) pointing at
+its URL. Content-addressed uploads make one object shareable between courses,
+so an object is only deleted once nothing references it any more and it has
+stayed unreferenced for a grace period (``MEDIA_GC_GRACE_SECONDS``). The grace
+period also covers direct uploads whose ticket was issued but not yet
+confirmed.
+
+An upload deduplicated against an idle object calls ``claim_media_object`` in
+the transaction that attaches it, which restarts the grace period. Garbage
+collection deletes the stored file before committing the row delete, so a
+concurrent claim either wins and keeps the object, or finds the row gone and
+the upload stores the bytes again.
+
+URLs with no row (the default image, uploads from before tracking existed)
+are never collected.
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import or_
+
+from db import db
+from models import Course, MediaObject
+
+logger = logging.getLogger(__name__)
+
+COURSE_MEDIA_FIELDS = {"images": "image_url", "videos": "preview_video_url"}
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def track_media_object(storage_key, url, media_type, *, sha256=None, content_type=None, size_bytes=None):
+    """Return the ``media_objects`` row for ``storage_key``, creating it unreferenced if needed."""
+    media_object = MediaObject.query.filter_by(storage_key=storage_key).first()
+    if media_object is None:
+        media_object = MediaObject()
+        media_object.storage_key = storage_key
+        media_object.url = url
+        media_object.media_type = media_type
+        media_object.ref_count = 0
+        db.session.add(media_object)
+    media_object.sha256 = media_object.sha256 or sha256
+    media_object.content_type = content_type or media_object.content_type
+    media_object.size_bytes = size_bytes or media_object.size_bytes
+    db.session.flush()
+    return media_object
+
+
+def claim_media_object(storage_key):
+    """Touch the row of an object being reused so garbage collection keeps it; return whether it exists.
+
+    Objects without a row (deleted meanwhile, or stored before tracking
+    existed) return ``False`` and should be stored again. The caller commits.
+    """
+    touched = MediaObject.query.filter(MediaObject.storage_key == storage_key).update(
+        {MediaObject.updated_at: _utcnow_naive()},
+        synchronize_session=False,
+    )
+    return touched > 0
+
+
+def _adjust_ref_count(url, delta):
+    if not url:
+        return
+    query = MediaObject.query.filter(MediaObject.url == url)
+    if delta < 0:
+        query = query.filter(MediaObject.ref_count > 0)
+    # A single UPDATE keeps concurrent attaches/releases from losing increments.
+    query.update(
+        {MediaObject.ref_count: MediaObject.ref_count + delta, MediaObject.updated_at: _utcnow_naive()},
+        synchronize_session=False,
+    )
+
+
+def attach_course_media(course, stored_media):
+    """Point the matching course field at ``stored_media`` and move the reference to it.
+
+    Returns ``False`` when the course already used this exact object, in which
+    case nothing changes and no derivatives need rebuilding.
+    """
+    field = COURSE_MEDIA_FIELDS.get(stored_media.media_type)
+    if field is None:
+        return False
+
+    previous_url = getattr(course, field)
+    if previous_url == stored_media.url:
+        return False
+
+    track_media_object(
+        stored_media.storage_key,
+        stored_media.url,
+        stored_media.media_type,
+        sha256=stored_media.sha256,
+        content_type=stored_media.content_type,
+        size_bytes=stored_media.size_bytes,
+    )
+    setattr(course, field, stored_media.url)
+    _adjust_ref_count(stored_media.url, 1)
+    _adjust_ref_count(previous_url, -1)
+    return True
+
+
+def release_course_media(course):
+    """Drop the references held by a course that is being deleted."""
+    for field in COURSE_MEDIA_FIELDS.values():
+        _adjust_ref_count(getattr(course, field), -1)
+
+
+def collect_unreferenced_media(media_service, *, grace_seconds=None, dry_run=False):
+    """Delete unreferenced objects older than the grace period; return their storage keys."""
+    if grace_seconds is None:
+        grace_seconds = int(current_app.config.get("MEDIA_GC_GRACE_SECONDS", 86400))
+    cutoff = _utcnow_naive() - timedelta(seconds=grace_seconds)
+
+    candidates = (
+        MediaObject.query
+        .filter(MediaObject.ref_count <= 0, MediaObject.updated_at < cutoff)
+        .order_by(MediaObject.id.asc())
+        .all()
+    )
+    collected = []
+    for media_object in candidates:
+        storage_key, url = media_object.storage_key, media_object.url
+        still_used = db.session.query(
+            Course.query.filter(or_(Course.image_url == url, Course.preview_video_url == url)).exists()
+        ).scalar()
+        if still_used:
+            logger.warning("Unreferenced media is still used by a course", extra={"storage_key": storage_key})
+            continue
+        if dry_run:
+            collected.append(storage_key)
+            continue
+
+        # Conditional delete: a concurrent attach or claim may have re-referenced the object meanwhile.
+        deleted = MediaObject.query.filter(
+            MediaObject.id == media_object.id,
+            MediaObject.ref_count <= 0,
+            MediaObject.updated_at < cutoff,
+        ).delete(synchronize_session=False)
+        if not deleted:
+            db.session.commit()
+            continue
+
+        # The row delete stays uncommitted until the file is gone, so a claim waiting on it
+        # sees no row afterwards and stores the bytes again.
+        try:
+            media_service.delete_object(storage_key)
+        except Exception:
+            db.session.rollback()
+            raise
+        db.session.commit()
+        collected.append(storage_key)
+        logger.info("Unreferenced media deleted", extra={"storage_key": storage_key})
+
+    return collected
@@ -0,0 +1,91 @@
+"""Serving of locally stored media files.
+
+Uploads are stored under content digests or random UUID keys (plus
+derivative suffixes), so a given URL never changes content and can be cached
+as ``immutable`` for a year. Anything else under the upload directory (e.g. ``defaults/``) gets a
+short revalidating max-age.
+
+Byte ranges are answered with ``206 Partial Content`` so video players can
+seek. ``MEDIA_SERVE_OFFLOAD`` hands the transfer to a front proxy instead:
+- ``x-accel-redirect``: nginx serves ``MEDIA_ACCEL_REDIRECT_PREFIX/<key>``
+  from an ``internal`` location
+- ``x-sendfile``: Apache/lighttpd read the absolute file path
+The app thread then returns headers only and is free again immediately.
+"""
+
+import logging
+import mimetypes
+import os
+import re
+
+from flask import abort, current_app, request
+from werkzeug.security import safe_join
+from werkzeug.utils import send_file
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age={max_age}, immutable"
+OFFLOAD_MODES = {"", "x-accel-redirect", "x-sendfile"}
+
+# courses/<images|videos>/<sha256 or uuid4 hex>[-<derivative suffix>].<ext>
+_IMMUTABLE_KEY_PATTERN = re.compile(
+    r"^courses/(images|videos)/([0-9a-f]{64}|[0-9a-f]{32})(-[A-Za-z0-9.]+)?\.[A-Za-z0-9]+$"
+)
+
+
+def is_immutable_media_key(storage_key: str) -> bool:
+    """Return whether ``storage_key`` is a unique upload key whose content never changes."""
+    return bool(_IMMUTABLE_KEY_PATTERN.match(storage_key))
+
+
+def _upload_root():
+    upload_dir = current_app.config.get("MEDIA_LOCAL_UPLOAD_DIR", "uploads")
+    if not os.path.isabs(upload_dir):
+        upload_dir = os.path.join(current_app.root_path, upload_dir)
+    return upload_dir
+
+
+def _apply_cache_headers(response, storage_key):
+    if is_immutable_media_key(storage_key):
+        max_age = int(current_app.config.get("MEDIA_IMMUTABLE_MAX_AGE_SECONDS", 31536000))
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL.format(max_age=max_age)
+    else:
+        max_age = int(current_app.config.get("MEDIA_MUTABLE_MAX_AGE_SECONDS", 300))
+        response.headers["Cache-Control"] = f"public, max-age={max_age}, must-revalidate"
+    return response
+
+
+def _accel_redirect_response(storage_key):
+    prefix = current_app.config.get("MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media").rstrip("/")
+    response = current_app.response_class(status=200)
+    response.headers["X-Accel-Redirect"] = f"{prefix}/{storage_key}"
+    response.content_type = mimetypes.guess_type(storage_key)[0] or "application/octet-stream"
+    # nginx keeps these headers and adds Content-Length, Range and validators itself.
+    response.headers["Accept-Ranges"] = "bytes"
+    return response
+
+
+def send_local_media(storage_key: str):
+    """Return a response for ``storage_key`` from the local upload directory."""
+    full_path = safe_join(_upload_root(), storage_key)
+    if full_path is None or not os.path.isfile(full_path):
+        abort(404)
+
+    offload = (current_app.config.get("MEDIA_SERVE_OFFLOAD") or "").lower()
+    if offload not in OFFLOAD_MODES:
+        raise RuntimeError("MEDIA_SERVE_OFFLOAD must be empty, 'x-accel-redirect' or 'x-sendfile'.")
+
+    if offload == "x-accel-redirect":
+        logger.debug("Offloading media to front proxy", extra={"storage_key": storage_key})
+        return _apply_cache_headers(_accel_redirect_response(storage_key), storage_key)
+
+    # conditional=True answers If-None-Match/If-Modified-Since and single byte
+    # ranges (206, or 416 when unsatisfiable) from the file itself.
+    response = send_file(
+        full_path,
+        request.environ,
+        conditional=True,
+        use_x_sendfile=offload == "x-sendfile",
+        response_class=current_app.response_class,
+    )
+    return _apply_cache_headers(response, storage_key)
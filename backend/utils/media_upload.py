@@ -2,16 +2,67 @@
 
 Provides validation, storage, and URL generation for uploaded course media
 across local and S3-compatible providers.
+
+Multipart uploads are content-addressed: the stream is SHA-256 hashed while
+its size is validated, the digest becomes the storage key, and an object that
+already exists is not uploaded again. Reference counts for stored objects
+live in ``media_objects`` (see ``utils.media_objects``).
+
+Large files can bypass the app server: ``create_direct_upload`` validates the
+declared file and signs a short-lived upload ticket (a presigned POST for S3
+drivers, a signed PUT to this app for the local driver), and
+``verify_direct_upload`` checks the stored object before it is attached.
+A signed PUT writes its key once: keys are served as ``immutable``, so a
+repeated PUT must not replace bytes that clients or a CDN may have cached.
+
+S3 clients are cached per process and per credential/endpoint set, so uploads
+reuse one connection pool instead of resolving a new session each time.
+Upload durations are recorded under ``media.*`` in ``utils.metrics``.
 """
 
+import hashlib
 import os
 import importlib
 import logging
+import threading
+from typing import NamedTuple
 from uuid import uuid4
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 from werkzeug.utils import secure_filename
 
+from utils.metrics import record_timing, timed
+
 logger = logging.getLogger(__name__)
 
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
+
+
+def clear_s3_client_cache():
+    """Drop cached S3 clients, e.g. after credentials rotate or between tests."""
+    with _s3_clients_lock:
+        _s3_clients.clear()
+
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class StoredMedia(NamedTuple):
+    """Location of a persisted upload: public URL, backend key, media type and content details."""
+
+    url: str
+    storage_key: str
+    media_type: str
+    sha256: str | None = None
+    content_type: str | None = None
+    size_bytes: int | None = None
+    deduplicated: bool = False
+
+
+def _is_s3_not_found(exc):
+    error_code = getattr(exc, "response", {}).get("Error", {}).get("Code")
+    return error_code in {"404", "NoSuchKey", "NotFound"}
+
 
 class MediaUploadService:
     """Handle secure upload processing for course media files."""
@@ -40,6 +91,16 @@ class MediaUploadService:
 
     def save_course_media(self, file_storage):
         """Validate and persist a course media file, returning its public URL."""
+        stored = self.store_course_media(file_storage)
+        return stored.url if stored else None
+
+    def store_course_media(self, file_storage, *, claim_existing=None):
+        """Validate and persist a course media file, returning a ``StoredMedia``.
+
+        When the content is already stored, ``claim_existing(storage_key)`` is
+        called before reusing it; if it returns ``False`` the bytes are stored
+        again instead.
+        """
         if file_storage is None:
             return None
         logger.info("Course media save requested")
@@ -50,19 +111,287 @@ class MediaUploadService:
 
         extension = self._get_extension(file_name)
         media_type = self._resolve_media_type(file_storage.mimetype, extension)
-        self._validate_size(file_storage)
+        digest, file_size = self._digest_stream(file_storage)
 
-        storage_key = self._build_storage_key("courses", media_type, extension)
+        storage_key = self._content_storage_key("courses", media_type, digest, extension)
         logger.debug("Generated media storage key", extra={"storage_key": storage_key, "driver": self.driver})
+        stored = StoredMedia(
+            url=None,
+            storage_key=storage_key,
+            media_type=media_type,
+            sha256=digest,
+            content_type=file_storage.mimetype,
+            size_bytes=file_size,
+        )
+
+        if self.object_exists(storage_key) and (claim_existing is None or claim_existing(storage_key)):
+            record_timing("media.upload.deduplicated", 0.0, size_bytes=file_size)
+            logger.info("Media upload deduplicated", extra={"storage_key": storage_key})
+            return stored._replace(url=self.public_url(storage_key), deduplicated=True)
 
         if self.driver == "local":
-            return self._save_local(file_storage, storage_key)
+            with timed("media.upload.local", size_bytes=file_size):
+                url = self._save_local(file_storage, storage_key)
+        elif self._is_s3_driver():
+            with timed("media.upload.s3", size_bytes=file_size):
+                url = self._save_s3_compatible(file_storage, storage_key)
+        else:
+            raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
+
+        return stored._replace(url=url)
+
+    def public_url(self, storage_key):
+        """Return the URL an object under ``storage_key`` is served from."""
+        if self.driver == "local":
+            return self._local_url(storage_key)
+        if self._is_s3_driver():
+            return self._s3_public_url(storage_key)
+        raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
 
-        if self.driver in {"s3", "aws", "digitalocean", "do"}:
-            return self._save_s3_compatible(file_storage, storage_key)
+    def object_exists(self, storage_key):
+        """Return whether an object is already stored under ``storage_key``."""
+        if self.driver == "local":
+            return os.path.isfile(self.local_path(storage_key))
+        if self._is_s3_driver():
+            try:
+                self._s3_client().head_object(Bucket=self._s3_bucket(), Key=storage_key)
+            except Exception as exc:
+                if _is_s3_not_found(exc):
+                    return False
+                raise
+            return True
+        raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
+
+    def delete_object(self, storage_key):
+        """Delete ``storage_key`` and its derivatives (``<stem>-*`` keys); missing objects are ignored."""
+        stem = storage_key.rsplit(".", 1)[0]
+        if self.driver == "local":
+            full_path = self.local_path(storage_key)
+            directory = os.path.dirname(full_path)
+            derivative_prefix = os.path.basename(stem) + "-"
+            removed = 0
+            if os.path.isdir(directory):
+                for entry in os.listdir(directory):
+                    if entry == os.path.basename(full_path) or entry.startswith(derivative_prefix):
+                        os.remove(os.path.join(directory, entry))
+                        removed += 1
+            return removed
+
+        if self._is_s3_driver():
+            client = self._s3_client()
+            bucket = self._s3_bucket()
+            keys = [storage_key]
+            paginator = client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=f"{stem}-"):
+                keys.extend(item["Key"] for item in page.get("Contents", []))
+            for start in range(0, len(keys), 1000):
+                client.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in keys[start:start + 1000]], "Quiet": True},
+                )
+            return len(keys)
 
         raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
 
+    def create_direct_upload(self, file_name, content_type, size_bytes, local_upload_url):
+        """Validate a declared upload and return a signed ticket for sending it directly.
+
+        ``local_upload_url(token)`` builds the signed PUT URL for the local driver.
+        """
+        file_name = secure_filename(file_name or "")
+        if not file_name:
+            raise ValueError("A media file with a valid filename is required.")
+
+        extension = self._get_extension(file_name)
+        media_type = self._resolve_media_type(content_type, extension)
+        if size_bytes > self.max_upload_bytes:
+            raise ValueError(f"File too large. Max allowed size is {self.max_upload_mb}MB.")
+
+        storage_key = self._build_storage_key("courses", media_type, extension)
+        expires_in = int(self.app.config.get("MEDIA_DIRECT_UPLOAD_TTL_SECONDS", 900))
+        token = self._upload_serializer().dumps({
+            "storage_key": storage_key,
+            "media_type": media_type,
+            "content_type": content_type,
+            "size_bytes": size_bytes,
+        })
+        ticket = {
+            "upload_token": token,
+            "storage_key": storage_key,
+            "media_type": media_type,
+            "expires_in": expires_in,
+        }
+
+        if self.driver == "local":
+            ticket.update(method="PUT", url=local_upload_url(token), form_fields={}, headers={"Content-Type": content_type})
+        elif self._is_s3_driver():
+            presigned = self._s3_client().generate_presigned_post(
+                Bucket=self._s3_bucket(),
+                Key=storage_key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, size_bytes],
+                ],
+                ExpiresIn=expires_in,
+            )
+            ticket.update(method="POST", url=presigned["url"], form_fields=presigned["fields"], headers={})
+        else:
+            raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
+
+        logger.info(
+            "Direct media upload issued",
+            extra={"storage_key": storage_key, "driver": self.driver, "size_bytes": size_bytes},
+        )
+        return ticket
+
+    def load_direct_upload(self, token, *, for_upload=False):
+        """Return the claims of a direct upload ticket, or raise ``ValueError``.
+
+        ``for_upload`` checks the ticket against the upload window itself; the
+        confirm step is allowed twice as long.
+        """
+        max_age = int(self.app.config.get("MEDIA_DIRECT_UPLOAD_TTL_SECONDS", 900))
+        if not for_upload:
+            max_age *= 2
+        try:
+            return self._upload_serializer().loads(token, max_age=max_age)
+        except SignatureExpired as exc:
+            raise ValueError("Upload token has expired.") from exc
+        except BadSignature as exc:
+            raise ValueError("Invalid upload token.") from exc
+
+    def receive_local_upload(self, claims, stream, content_type, content_length):
+        """Write a signed local PUT body to its reserved storage key.
+
+        Raises ``FileExistsError`` when the key was already uploaded. The body
+        is written to a temporary file and linked into place only if the key is
+        still free, so concurrent or repeated PUTs cannot replace stored bytes.
+        """
+        if self.driver != "local":
+            raise RuntimeError("Signed uploads to the app are only available for the local storage driver.")
+        if (content_type or "").lower() != claims["content_type"].lower():
+            raise ValueError("Content-Type does not match the upload ticket.")
+        if content_length is None or not 0 < content_length <= claims["size_bytes"]:
+            raise ValueError("Content-Length must be set and within the declared size.")
+
+        full_path = self.local_path(claims["storage_key"])
+        if os.path.exists(full_path):
+            raise FileExistsError("Media was already uploaded for this ticket.")
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        partial_path = f"{full_path}.{uuid4().hex}.part"
+        written = 0
+        try:
+            with timed("media.upload.local_direct", size_bytes=content_length):
+                with open(partial_path, "wb") as target:
+                    while chunk := stream.read(1024 * 1024):
+                        written += len(chunk)
+                        if written > claims["size_bytes"]:
+                            break
+                        target.write(chunk)
+
+            if written > claims["size_bytes"]:
+                raise ValueError("Upload exceeds the declared size.")
+            try:
+                os.link(partial_path, full_path)
+            except FileExistsError as exc:
+                raise FileExistsError("Media was already uploaded for this ticket.") from exc
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        logger.info("Direct media upload received", extra={"storage_key": claims["storage_key"], "size_bytes": written})
+
+    def verify_direct_upload(self, claims):
+        """Check the uploaded object exists and matches its ticket; return ``StoredMedia``."""
+        storage_key = claims["storage_key"]
+        if self.driver == "local":
+            full_path = self.local_path(storage_key)
+            if not os.path.isfile(full_path):
+                raise LookupError("Uploaded media was not found.")
+            size_bytes = os.path.getsize(full_path)
+            stored_content_type = claims["content_type"]
+            url = self._local_url(storage_key)
+        elif self._is_s3_driver():
+            try:
+                head = self._s3_client().head_object(Bucket=self._s3_bucket(), Key=storage_key)
+            except Exception as exc:
+                if _is_s3_not_found(exc):
+                    raise LookupError("Uploaded media was not found.") from exc
+                raise
+            size_bytes = head["ContentLength"]
+            stored_content_type = head.get("ContentType") or ""
+            url = self._s3_public_url(storage_key)
+        else:
+            raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
+
+        if stored_content_type.lower() != claims["content_type"].lower():
+            raise ValueError("Uploaded media type does not match the upload ticket.")
+        if not 0 < size_bytes <= min(claims["size_bytes"], self.max_upload_bytes):
+            raise ValueError("Uploaded media size does not match the upload ticket.")
+
+        return StoredMedia(
+            url=url,
+            storage_key=storage_key,
+            media_type=claims["media_type"],
+            content_type=claims["content_type"],
+            size_bytes=size_bytes,
+        )
+
+    def _upload_serializer(self):
+        secret_key = self.app.config.get("MEDIA_UPLOAD_TOKEN_SECRET") or self.app.config.get("JWT_SECRET_KEY")
+        if not secret_key:
+            raise RuntimeError("Media upload token secret is not configured.")
+        return URLSafeTimedSerializer(secret_key=secret_key, salt="insideout-media-upload")
+
+    def store_bytes(self, storage_key, data, content_type):
+        """Persist generated bytes (e.g. a derivative) under ``storage_key`` and return its URL."""
+        if self.driver == "local":
+            full_path = self.local_path(storage_key)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with timed("media.store_bytes.local", size_bytes=len(data)):
+                with open(full_path, "wb") as target:
+                    target.write(data)
+            logger.info("Generated media saved to local storage", extra={"path": full_path})
+            return self._local_url(storage_key)
+
+        if self._is_s3_driver():
+            with timed("media.store_bytes.s3", size_bytes=len(data)):
+                self._s3_client().put_object(
+                    Bucket=self._s3_bucket(),
+                    Key=storage_key,
+                    Body=data,
+                    ContentType=content_type,
+                )
+            logger.info("Generated media uploaded to S3-compatible storage", extra={"storage_key": storage_key})
+            return self._s3_public_url(storage_key)
+
+        raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
+
+    def read_bytes(self, storage_key):
+        """Return the stored bytes for ``storage_key``."""
+        if self.driver == "local":
+            with open(self.local_path(storage_key), "rb") as source:
+                return source.read()
+
+        if self._is_s3_driver():
+            response = self._s3_client().get_object(Bucket=self._s3_bucket(), Key=storage_key)
+            return response["Body"].read()
+
+        raise RuntimeError("Unsupported MEDIA_STORAGE_DRIVER configuration.")
+
+    def local_path(self, storage_key):
+        """Return the filesystem path of ``storage_key`` for the local driver."""
+        upload_dir = self.app.config.get("MEDIA_LOCAL_UPLOAD_DIR", "uploads")
+        target_root = upload_dir
+
+        if not os.path.isabs(target_root):
+            target_root = os.path.join(self.app.root_path, upload_dir)
+
+        return os.path.join(target_root, *storage_key.split("/"))
+
+    def _is_s3_driver(self):
+        return self.driver in {"s3", "aws", "digitalocean", "do"}
+
     def _get_extension(self, file_name):
         """Extract lowercase extension from a sanitized file name."""
         if "." not in file_name:
@@ -86,69 +415,104 @@ class MediaUploadService:
 
         raise ValueError("Only valid image or video files are allowed.")
 
-    def _validate_size(self, file_storage):
-        """Ensure uploaded file size is within configured limit."""
+    def _digest_stream(self, file_storage):
+        """Hash the upload with SHA-256 while enforcing the size limit; return ``(hexdigest, size)``."""
         stream = file_storage.stream
-        current_position = stream.tell()
-        stream.seek(0, os.SEEK_END)
-        file_size = stream.tell()
         stream.seek(0)
-
-        if file_size > self.max_upload_bytes:
-            raise ValueError(f"File too large. Max allowed size is {self.max_upload_mb}MB.")
+        digest = hashlib.sha256()
+        file_size = 0
+        while chunk := stream.read(HASH_CHUNK_BYTES):
+            file_size += len(chunk)
+            if file_size > self.max_upload_bytes:
+                raise ValueError(f"File too large. Max allowed size is {self.max_upload_mb}MB.")
+            digest.update(chunk)
+        stream.seek(0)
         logger.debug("Validated media size", extra={"file_size": file_size})
+        return digest.hexdigest(), file_size
 
-        if current_position:
-            stream.seek(0)
+    def _content_storage_key(self, folder, media_type, digest, extension):
+        """Build the content-addressed key for an upload with SHA-256 ``digest``."""
+        return f"{folder}/{media_type}/{digest}.{extension}"
 
     def _build_storage_key(self, folder, media_type, extension):
-        """Build unique storage key used by local/cloud backends."""
+        """Build a unique key for uploads whose content is not known up front."""
         token = uuid4().hex
         return f"{folder}/{media_type}/{token}.{extension}"
 
+    def _local_url(self, storage_key):
+        media_base_url = self.app.config.get("MEDIA_BASE_URL", "/media").rstrip("/")
+        return f"{media_base_url}/{storage_key}"
+
     def _save_local(self, file_storage, storage_key):
         """Save file to local filesystem and return a URL path."""
-        upload_dir = self.app.config.get("MEDIA_LOCAL_UPLOAD_DIR", "uploads")
-        target_root = upload_dir
-
-        if not os.path.isabs(target_root):
-            target_root = os.path.join(self.app.root_path, upload_dir)
-
-        full_path = os.path.join(target_root, *storage_key.split("/"))
+        full_path = self.local_path(storage_key)
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
 
         file_storage.stream.seek(0)
         file_storage.save(full_path)
         logger.info("Media saved to local storage", extra={"path": full_path})
 
-        media_base_url = self.app.config.get("MEDIA_BASE_URL", "/media").rstrip("/")
-        return f"{media_base_url}/{storage_key}"
+        return self._local_url(storage_key)
 
-    def _save_s3_compatible(self, file_storage, storage_key):
-        """Upload file to S3-compatible storage and return a public URL."""
+    def _s3_bucket(self):
         bucket = self.app.config.get("MEDIA_BUCKET_NAME")
-        region = self.app.config.get("MEDIA_S3_REGION")
-        endpoint_url = self.app.config.get("MEDIA_S3_ENDPOINT_URL")
-        access_key = self.app.config.get("MEDIA_S3_ACCESS_KEY")
-        secret_key = self.app.config.get("MEDIA_S3_SECRET_KEY")
-
         if not bucket:
             raise RuntimeError("MEDIA_BUCKET_NAME is required for cloud storage.")
+        return bucket
 
+    def _s3_client(self):
+        """Return the process-wide S3 client for the configured endpoint and credentials."""
         try:
             boto3 = importlib.import_module("boto3")
+            botocore_config = importlib.import_module("botocore.config")
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("boto3 is required for cloud media storage.") from exc
+
+        # Empty config values mean "use boto3's default", not an empty endpoint.
+        client_kwargs = {
+            "region_name": self.app.config.get("MEDIA_S3_REGION") or None,
+            "endpoint_url": self.app.config.get("MEDIA_S3_ENDPOINT_URL") or None,
+            "aws_access_key_id": self.app.config.get("MEDIA_S3_ACCESS_KEY") or None,
+            "aws_secret_access_key": self.app.config.get("MEDIA_S3_SECRET_KEY") or None,
+        }
+        max_pool_connections = int(self.app.config.get("MEDIA_S3_MAX_POOL_CONNECTIONS", 16))
+        cache_key = (*client_kwargs.values(), max_pool_connections)
+
+        with _s3_clients_lock:
+            client = _s3_clients.get(cache_key)
+            if client is None:
+                # Clients are thread-safe; sessions are not, so build once under the lock.
+                session = boto3.session.Session()
+                client = session.client(
+                    "s3",
+                    config=botocore_config.Config(max_pool_connections=max_pool_connections),
+                    **client_kwargs,
+                )
+                _s3_clients[cache_key] = client
+                logger.info("S3 client created", extra={"endpoint_url": client_kwargs["endpoint_url"]})
+        return client
+
+    def _s3_transfer_config(self):
+        """Build the multipart ``TransferConfig`` for large uploads."""
+        try:
+            transfer = importlib.import_module("boto3.s3.transfer")
         except ModuleNotFoundError as exc:
             raise RuntimeError("boto3 is required for cloud media storage.") from exc
 
-        session = boto3.session.Session()
-        client = session.client(
-            "s3",
-            region_name=region,
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
+        megabyte = 1024 * 1024
+        max_concurrency = max(1, int(self.app.config.get("MEDIA_S3_MAX_CONCURRENCY", 4)))
+        return transfer.TransferConfig(
+            multipart_threshold=int(self.app.config.get("MEDIA_S3_MULTIPART_THRESHOLD_MB", 8)) * megabyte,
+            multipart_chunksize=int(self.app.config.get("MEDIA_S3_MULTIPART_CHUNKSIZE_MB", 8)) * megabyte,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1,
         )
 
+    def _save_s3_compatible(self, file_storage, storage_key):
+        """Upload file to S3-compatible storage and return a public URL."""
+        bucket = self._s3_bucket()
+        client = self._s3_client()
+
         file_storage.stream.seek(0)
         client.upload_fileobj(
             Fileobj=file_storage.stream,
@@ -157,9 +521,17 @@ class MediaUploadService:
             ExtraArgs={
                 "ContentType": file_storage.mimetype or "application/octet-stream",
             },
+            Config=self._s3_transfer_config(),
         )
         logger.info("Media uploaded to S3-compatible storage", extra={"bucket": bucket, "storage_key": storage_key})
 
+        return self._s3_public_url(storage_key)
+
+    def _s3_public_url(self, storage_key):
+        """Return the public URL for an object in the configured bucket."""
+        bucket = self._s3_bucket()
+        region = self.app.config.get("MEDIA_S3_REGION")
+        endpoint_url = self.app.config.get("MEDIA_S3_ENDPOINT_URL")
         public_base_url = self.app.config.get("MEDIA_PUBLIC_BASE_URL")
         if public_base_url:
             return f"{public_base_url.rstrip('/')}/{storage_key}"
@@ -0,0 +1,76 @@
+"""Process-local timing metrics served from ``GET /health/metrics``.
+
+Counters live in memory per worker process, so each gunicorn worker reports
+its own numbers. ``timed(name)`` records a call's duration, outcome, and an
+optional byte count under ``name``; ``set_gauge(name, value)`` keeps the last
+observed value of a level such as a queue depth.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_timings: dict[str, dict] = {}
+_gauges: dict[str, float] = {}
+
+
+def _empty_timing() -> dict:
+    return {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0, "total_bytes": 0}
+
+
+def record_timing(name: str, seconds: float, *, size_bytes: int | None = None, error: bool = False) -> None:
+    """Add one observation to the ``name`` timing."""
+    with _lock:
+        timing = _timings.setdefault(name, _empty_timing())
+        timing["count"] += 1
+        timing["total_seconds"] += seconds
+        timing["max_seconds"] = max(timing["max_seconds"], seconds)
+        if error:
+            timing["errors"] += 1
+        if size_bytes:
+            timing["total_bytes"] += size_bytes
+
+
+@contextmanager
+def timed(name: str, *, size_bytes: int | None = None):
+    """Record the duration of the wrapped block; exceptions count as errors and propagate."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        record_timing(name, time.perf_counter() - started, size_bytes=size_bytes, error=True)
+        raise
+    record_timing(name, time.perf_counter() - started, size_bytes=size_bytes)
+
+
+def timing_snapshot(prefix: str = "") -> dict:
+    """Return timings whose name starts with ``prefix``, with derived averages."""
+    with _lock:
+        timings = {name: dict(timing) for name, timing in _timings.items() if name.startswith(prefix)}
+
+    for timing in timings.values():
+        count = timing["count"]
+        timing["avg_seconds"] = round(timing["total_seconds"] / count, 6) if count else 0.0
+        timing["total_seconds"] = round(timing["total_seconds"], 6)
+        timing["max_seconds"] = round(timing["max_seconds"], 6)
+    return timings
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Replace the current value of the ``name`` gauge."""
+    with _lock:
+        _gauges[name] = value
+
+
+def gauge_snapshot(prefix: str = "") -> dict:
+    """Return gauges whose name starts with ``prefix``."""
+    with _lock:
+        return {name: value for name, value in _gauges.items() if name.startswith(prefix)}
+
+
+def reset_timings() -> None:
+    """Clear all recorded timings and gauges (used by tests)."""
+    with _lock:
+        _timings.clear()
+        _gauges.clear()
@@ -6,14 +6,30 @@ from datetime import date, datetime, timedelta
 from datetime import UTC
 
 from flask import current_app
+from sqlalchemy import bindparam, delete, or_, select, update
+from sqlalchemy.orm import joinedload
 
-from models import Schedule, User
-from utils.email import queue_email
+from db import db
+from models import Course, EmailNotificationSettings, Enrollment, MeetingReminderDue, Schedule, User
+from utils.admin_roster import RosterAdmin, get_admin_roster
+from utils.email import queue_broadcast, queue_emails_bulk
+from utils.email_templates import render_email_body
+from utils.jobs import enqueue_job, job_handler
 
 logger = logging.getLogger(__name__)
 
+COURSE_PUBLISHED_JOB = "notifications.course_published"
+# Schedules per statement when (re)building the meeting reminder index.
+MEETING_REMINDER_SYNC_CHUNK_SIZE = 500
+# Admins come from the cached roster; everyone else is a loaded ``User``.
+Recipient = User | RosterAdmin
 
-def _is_notification_enabled(user: User, setting_field: str) -> bool:
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _is_notification_enabled(user: Recipient, setting_field: str) -> bool:
     settings = user.notification_settings
     if settings is None:
         return True
@@ -22,43 +38,58 @@ def _is_notification_enabled(user: User, setting_field: str) -> bool:
     return True if value is None else bool(value)
 
 
-def _queue_user_notification(user: User, setting_field: str, subject: str, body: str) -> bool:
-    outcome = _queue_user_notification_outcome(user, setting_field, subject, body)
-    return outcome == "queued"
-
-
-def _queue_user_notification_outcome(
-    user: User,
+def _notification_email(
+    user: Recipient,
     setting_field: str,
     subject: str,
-    body: str,
+    template_key: str,
+    context: dict,
+    *,
+    lane: str,
     reference_key: str | None = None,
-) -> str:
+) -> dict | None:
+    """Return the outbox row for ``user``, or ``None`` when their settings opt out.
+
+    The body is stored as ``template_key`` + ``context`` (see
+    ``utils.email_templates``) and rendered by the dispatcher. ``lane`` is
+    the queue priority lane (see ``utils.email``).
+    """
     if not _is_notification_enabled(user, setting_field):
         logger.info(
             "Notification skipped by user settings",
             extra={"user_id": user.id, "setting_field": setting_field},
         )
-        return "skipped"
+        return None
+
+    return {
+        "to_email": user.email,
+        "subject": subject,
+        "template_key": template_key,
+        "context": {"first_name": user.first_name, **context},
+        "reference_key": reference_key,
+        "lane": lane,
+    }
+
+
+def _queue_notification_emails(emails: list[dict], setting_field: str) -> int:
+    """Queue ``emails`` in one bulk insert and commit; return how many were newly queued."""
+    if not emails:
+        return 0
 
     try:
-        if reference_key is None:
-            queue_email(user.email, subject, body)
-        else:
-            queue_email(user.email, subject, body, reference_key=reference_key)
-        return "queued"
+        return queue_emails_bulk(emails)
     except Exception:
         logger.exception(
-            "Failed to queue user notification",
-            extra={"user_id": user.id, "setting_field": setting_field},
+            "Failed to queue user notifications",
+            extra={"setting_field": setting_field, "count": len(emails)},
         )
-        return "error"
+        return 0
 
 
-def _student_and_admin_recipients(student: User) -> list[User]:
-    recipients_by_id: dict[int, User] = {student.id: student}
-    for admin in User.query.filter(User.role == "admin").all():
-        recipients_by_id[admin.id] = admin
+def _student_and_admin_recipients(student: User) -> list[Recipient]:
+    recipients_by_id: dict[int, Recipient] = {student.id: student}
+    for admin in get_admin_roster():
+        recipients_by_id.setdefault(admin.id, admin)
     return list(recipients_by_id.values())
 
 
@@ -73,7 +104,7 @@ def _meeting_reminder_bounds() -> tuple[int, int, int]:
     return default_lead, min_lead, max_lead
 
 
-def _meeting_reminder_lead_minutes(user: User) -> int:
+def _meeting_reminder_lead_minutes(user: Recipient) -> int:
     default_lead, min_lead, max_lead = _meeting_reminder_bounds()
     settings = user.notification_settings
     if settings is None:
@@ -104,32 +135,19 @@ def notify_payment_confirmed(
     stripe_session_id: str | None = None,
 ) -> int:
     recipients = _student_and_admin_recipients(student)
-    queued_count = 0
-    outcome_counts = {"queued": 0, "skipped": 0, "error": 0}
     normalized_session_id = (stripe_session_id or "").strip()
+    emails = []
 
     for recipient in recipients:
         recipient_role = "student" if recipient.id == student.id else "admin"
         if recipient.id == student.id:
             subject = "Payment confirmed"
-            onboarding_call_to_action = (
-                f"<p><a href=\"{onboarding_booking_url}\">Book your onboarding meeting now</a></p>"
-                if onboarding_booking_url
-                else ""
-            )
-            body = (
-                f"<p>Hi {recipient.first_name},</p>"
-                f"<p>Your payment for <strong>{course_title}</strong> was confirmed successfully.</p>"
-                "<p>You can now continue with onboarding and schedule your first session.</p>"
-                f"{onboarding_call_to_action}"
-            )
+            template_key = "payment_confirmed.student"
+            context = {"course_title": course_title, "onboarding_booking_url": onboarding_booking_url}
         else:
             subject = "Student payment confirmed"
-            body = (
-                f"<p>Hi {recipient.first_name},</p>"
-                f"<p>A payment for <strong>{course_title}</strong> was confirmed.</p>"
-                f"<p><strong>Student:</strong> {student.first_name} {student.last_name}</p>"
-            )
+            template_key = "payment_confirmed.admin"
+            context = {"course_title": course_title, "student_name": f"{student.first_name} {student.last_name}"}
 
         reference_key = None
         if normalized_session_id:
@@ -139,28 +157,19 @@ def notify_payment_confirmed(
                 recipient_role,
             )
 
-        outcome = _queue_user_notification_outcome(
+        email = _notification_email(
             recipient,
             "notify_on_new_payment",
             subject,
-            body,
+            template_key,
+            context,
+            lane="payment",
             reference_key=reference_key,
         )
-        if outcome == "queued":
-            queued_count += 1
+        if email is not None:
+            emails.append(email)
 
-        outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
-        logger.info(
-            "Payment notification outcome",
-            extra={
-                "student_id": student.id,
-                "course_title": course_title,
-                "recipient_id": recipient.id,
-                "recipient_email": recipient.email,
-                "recipient_role": recipient_role,
-                "outcome": outcome,
-            },
-        )
+    queued_count = _queue_notification_emails(emails, "notify_on_new_payment")
 
     logger.info(
         "Payment notification dispatch summary",
@@ -169,8 +178,8 @@ def notify_payment_confirmed(
             "course_title": course_title,
             "recipient_count": len(recipients),
             "queued_count": queued_count,
-            "skipped_count": outcome_counts.get("skipped", 0),
-            "error_count": outcome_counts.get("error", 0),
+            "skipped_count": len(recipients) - len(emails),
+            "duplicate_count": len(emails) - queued_count,
         },
     )
 
@@ -184,36 +193,43 @@ def notify_schedule_created(
     first_date: date | None,
     include_admins: bool = False,
 ) -> int:
-    plural = "s" if schedule_count != 1 else ""
-    date_hint = f" starting on <strong>{first_date.isoformat()}</strong>" if first_date else ""
     recipients = _student_and_admin_recipients(student) if include_admins else [student]
-    queued_count = 0
+    emails = []
 
     for recipient in recipients:
         if recipient.id == student.id:
             subject = "Schedule confirmed"
-            body = (
-                f"<p>Hi {recipient.first_name},</p>"
-                f"<p>Your schedule for <strong>{course_title}</strong> has been updated.</p>"
-                f"<p>{schedule_count} session{plural} were created{date_hint}.</p>"
-            )
+            template_key = "schedule_created.student"
+            context = {
+                "course_title": course_title,
+                "schedule_count": schedule_count,
+                "first_date": first_date.isoformat() if first_date else None,
+            }
         else:
             subject = "Student schedule created"
-            body = (
-                f"<p>Hi {recipient.first_name},</p>"
-                f"<p>A schedule for <strong>{course_title}</strong> has been created.</p>"
-                f"<p><strong>Student:</strong> {student.first_name} {student.last_name}<br/>"
-                f"<strong>Sessions:</strong> {schedule_count}</p>"
-            )
+            template_key = "schedule_created.admin"
+            context = {
+                "course_title": course_title,
+                "schedule_count": schedule_count,
+                "student_name": f"{student.first_name} {student.last_name}",
+            }
 
-        if _queue_user_notification(recipient, "notify_on_schedule_change", subject, body):
-            queued_count += 1
+        email = _notification_email(
+            recipient,
+            "notify_on_schedule_change",
+            subject,
+            template_key,
+            context,
+            lane="schedule",
+        )
+        if email is not None:
+            emails.append(email)
 
-    return queued_count
+    return _queue_notification_emails(emails, "notify_on_schedule_change")
 
 
 def notify_schedule_change_requested(student: User, schedule: Schedule, subject: str, comments: str) -> int:
-    recipients = User.query.filter(User.role == "admin").all()
+    recipients = get_admin_roster()
     if not recipients:
         return 0
 
@@ -221,127 +237,394 @@ def notify_schedule_change_requested(student: User, schedule: Schedule, subject:
     course_title = enrollment.course.title if enrollment and enrollment.course else f"Enrollment #{schedule.enrollment_id}"
     schedule_date = schedule.date.isoformat()
     schedule_time = f"{schedule.start_time.strftime('%H:%M')} - {schedule.end_time.strftime('%H:%M')}"
-    comments_html = comments.strip() if comments else "No additional comments provided."
-
-    queued_count = 0
+    context = {
+        "student_name": f"{student.first_name} {student.last_name}",
+        "student_email": student.email,
+        "course_title": course_title,
+        "schedule_id": schedule.id,
+        "date": schedule_date,
+        "time": schedule_time,
+        "subject": subject,
+        "comments": comments.strip() if comments else None,
+    }
+
+    emails = []
     for admin in recipients:
         email_subject = f"Schedule change request: {subject}"
-        body = (
-            f"<p>Hi {admin.first_name},</p>"
-            "<p>A student requested a schedule change.</p>"
-            f"<p><strong>Student:</strong> {student.first_name} {student.last_name}<br/>"
-            f"<strong>Email:</strong> {student.email}<br/>"
-            f"<strong>Course:</strong> {course_title}<br/>"
-            f"<strong>Schedule ID:</strong> {schedule.id}<br/>"
-            f"<strong>Date:</strong> {schedule_date}<br/>"
-            f"<strong>Time:</strong> {schedule_time}</p>"
-            f"<p><strong>Request Subject:</strong> {subject}</p>"
-            f"<p><strong>Comments:</strong><br/>{comments_html}</p>"
+        email = _notification_email(
+            admin,
+            "notify_on_schedule_change",
+            email_subject,
+            "schedule_change_requested.admin",
+            context,
+            lane="schedule",
         )
+        if email is not None:
+            emails.append(email)
+
+    return _queue_notification_emails(emails, "notify_on_schedule_change")
+
+
+def _new_course_recipients(chunk_size: int):
+    """Stream ``(email, substitutions)`` for opted-in students without loading ORM objects."""
+    rows = db.session.execute(
+        select(User.email, User.first_name)
+        .outerjoin(EmailNotificationSettings, EmailNotificationSettings.user_id == User.id)
+        .where(
+            User.role == "student",
+            or_(
+                EmailNotificationSettings.notify_on_new_course.is_(None),
+                EmailNotificationSettings.notify_on_new_course.is_(True),
+            ),
+        )
+        .order_by(User.id.asc())
+        .execution_options(yield_per=chunk_size)
+    )
+    for email, first_name in rows:
+        yield email, {"-first_name-": first_name or ""}
+
+
+def notify_new_course_published(course_title: str, *, course_id: int | None = None) -> int:
+    """Queue one broadcast announcing ``course_title`` to every opted-in student.
+
+    Students are streamed ``EMAIL_BROADCAST_FANOUT_CHUNK_SIZE`` rows at a time
+    and inserted chunk by chunk, so memory stays flat however many there are.
+    With ``course_id`` the broadcast is keyed to the course, and a repeated
+    call returns the already queued broadcast's count without queuing again.
+    """
+    chunk_size = max(1, int(current_app.config.get("EMAIL_BROADCAST_FANOUT_CHUNK_SIZE", 1000)))
+    subject = "New course available"
+    body = render_email_body("new_course.broadcast", {"course_title": course_title})
+    broadcast = queue_broadcast(
+        subject,
+        body,
+        _new_course_recipients(chunk_size),
+        chunk_size=chunk_size,
+        reference_key=f"course-published:{course_id}" if course_id is not None else None,
+    )
 
-        if _queue_user_notification(admin, "notify_on_schedule_change", email_subject, body):
-            queued_count += 1
-
+    queued_count = broadcast.recipient_count if broadcast else 0
+    logger.info("Queued new-course notifications", extra={"course_title": course_title, "queued_count": queued_count})
     return queued_count
 
 
-def notify_new_course_published(course_title: str) -> int:
-    recipients = User.query.filter(User.role == "student").all()
-    if not recipients:
-        return 0
+def enqueue_new_course_announcement(course: Course):
+    """Schedule the new-course fan-out; the caller commits it with the course."""
+    return enqueue_job(COURSE_PUBLISHED_JOB, {"course_id": course.id})
 
-    queued_count = 0
-    for user in recipients:
-        subject = "New course available"
-        body = (
-            f"<p>Hi {user.first_name},</p>"
-            f"<p>A new course <strong>{course_title}</strong> is now available on InsideOut.</p>"
-            "<p>Log in to explore the new content.</p>"
-        )
-        if _queue_user_notification(user, "notify_on_new_course", subject, body):
-            queued_count += 1
 
-    logger.info("Queued new-course notifications", extra={"course_title": course_title, "queued_count": queued_count})
-    return queued_count
+@job_handler(COURSE_PUBLISHED_JOB)
+def _announce_new_course(payload: dict) -> None:
+    course = db.session.get(Course, payload.get("course_id"))
+    if course is None:
+        logger.info("Skipping announcement for deleted course", extra={"course_id": payload.get("course_id")})
+        return
+    notify_new_course_published(course.title, course_id=course.id)
 
 
-def _queue_meeting_reminder_for_schedule(schedule: Schedule, now: datetime, window_seconds: int) -> int:
-    enrollment = schedule.enrollment
-    if not enrollment or not enrollment.student:
-        return 0
-    if enrollment.status == "completed":
-        return 0
+def _reminder_due_entry(recipient: Recipient, start_at: datetime, now: datetime) -> tuple[int, datetime] | None:
+    """Return ``(lead_minutes, due_at)`` for ``recipient``, or ``None`` when no reminder should be sent."""
+    if not _is_notification_enabled(recipient, "notify_on_meeting_reminder"):
+        return None
+    lead_minutes = _meeting_reminder_lead_minutes(recipient)
+    due_at = start_at - timedelta(minutes=lead_minutes)
+    window_seconds = max(15, int(current_app.config.get("MEETING_REMINDER_WINDOW_SECONDS", 90)))
+    if now > due_at + timedelta(seconds=window_seconds):
+        return None
+    return lead_minutes, due_at
+
+
+def _upcoming_schedule_rows(now: datetime):
+    """Select ``(schedule_id, date, start_time, student_id)`` for sessions that should get reminders."""
+    return select(Schedule.id, Schedule.date, Schedule.start_time, Enrollment.student_id).join(
+        Enrollment, Schedule.enrollment_id == Enrollment.id
+    ).where(
+        Schedule.status == "scheduled",
+        Enrollment.status != "completed",
+        Schedule.date >= now.date(),
+    )
 
-    student = enrollment.student
-    recipients = _student_and_admin_recipients(student)
 
-    start_at = datetime.combine(schedule.date, schedule.start_time)
-    if start_at <= now:
+def _users_with_settings(user_ids) -> dict[int, User]:
+    if not user_ids:
+        return {}
+    users = User.query.options(joinedload(User.notification_settings)).filter(User.id.in_(user_ids)).all()
+    return {user.id: user for user in users}
+
+
+def _apply_reminder_plan(existing_filter, desired: dict[tuple[int, int], tuple[int, datetime]]) -> int:
+    """Make the index rows matching ``existing_filter`` equal ``desired``; return rows written or removed.
+
+    ``desired`` maps ``(schedule_id, recipient_id)`` to ``(lead_minutes, due_at)``.
+    Rows whose due time moved are re-armed; rows no longer wanted are deleted.
+    """
+    table = MeetingReminderDue.__table__
+    existing = db.session.execute(
+        select(
+            MeetingReminderDue.id,
+            MeetingReminderDue.schedule_id,
+            MeetingReminderDue.recipient_id,
+            MeetingReminderDue.lead_minutes,
+            MeetingReminderDue.due_at,
+        ).where(existing_filter)
+    ).all()
+
+    desired = dict(desired)
+    stale_ids = []
+    changed = []
+    for row in existing:
+        entry = desired.pop((row.schedule_id, row.recipient_id), None)
+        if entry is None:
+            stale_ids.append(row.id)
+        elif entry != (row.lead_minutes, row.due_at):
+            changed.append({"row_id": row.id, "new_lead_minutes": entry[0], "new_due_at": entry[1]})
+
+    for start in range(0, len(stale_ids), MEETING_REMINDER_SYNC_CHUNK_SIZE):
+        db.session.execute(
+            delete(table).where(table.c.id.in_(stale_ids[start:start + MEETING_REMINDER_SYNC_CHUNK_SIZE]))
+        )
+    if changed:
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(lead_minutes=bindparam("new_lead_minutes"), due_at=bindparam("new_due_at"), processed_at=None),
+            changed,
+        )
+    if desired:
+        created_at = _utcnow_naive()
+        db.session.execute(
+            table.insert(),
+            [
+                {
+                    "schedule_id": schedule_id,
+                    "recipient_id": recipient_id,
+                    "lead_minutes": lead_minutes,
+                    "due_at": due_at,
+                    "created_at": created_at,
+                }
+                for (schedule_id, recipient_id), (lead_minutes, due_at) in desired.items()
+            ],
+        )
+    return len(stale_ids) + len(changed) + len(desired)
+
+
+def _sync_schedule_rows(
+    schedule_ids: list[int],
+    upcoming_rows,
+    admins: list[User],
+    now: datetime,
+) -> int:
+    """Rebuild index rows for ``schedule_ids``; ``upcoming_rows`` are those still due a reminder."""
+    admin_ids = {admin.id for admin in admins}
+    recipients = _users_with_settings({row.student_id for row in upcoming_rows} - admin_ids)
+    recipients.update({admin.id: admin for admin in admins})
+
+    desired = {}
+    for row in upcoming_rows:
+        start_at = datetime.combine(row.date, row.start_time)
+        if start_at <= now:
+            continue
+        for recipient_id in admin_ids | {row.student_id}:
+            recipient = recipients.get(recipient_id)
+            if recipient is None:
+                continue
+            entry = _reminder_due_entry(recipient, start_at, now)
+            if entry:
+                desired[(row.id, recipient_id)] = entry
+    return _apply_reminder_plan(MeetingReminderDue.schedule_id.in_(schedule_ids), desired)
+
+
+def _admins_with_settings() -> list[User]:
+    # The index stores each admin's lead time and opt-out, so it reads admins inside the
+    # transaction rather than from the per-process roster, which may be stale here.
+    return User.query.options(joinedload(User.notification_settings)).filter(User.role == "admin").all()
+
+
+def sync_meeting_reminders(schedules) -> int:
+    """Refresh the ``meeting_reminder_due`` rows of ``schedules`` inside the caller's transaction.
+
+    Call after creating schedules or changing their time, status or
+    enrollment status; the caller commits. Returns rows written or removed.
+    """
+    schedules = list(schedules)
+    if not schedules:
         return 0
+    db.session.flush()
+
+    now = _utcnow_naive()
+    schedule_ids = [schedule.id for schedule in schedules]
+    upcoming_rows = db.session.execute(
+        _upcoming_schedule_rows(now).where(Schedule.id.in_(schedule_ids))
+    ).all()
+    return _sync_schedule_rows(schedule_ids, upcoming_rows, _admins_with_settings(), now)
+
+
+def sync_meeting_reminders_for_user(user: User) -> int:
+    """Refresh ``user``'s reminder rows after their settings or role changed; the caller commits.
+
+    Admins are reminded of every session, so for them this touches all upcoming schedules.
+    """
+    db.session.flush()
+    now = _utcnow_naive()
+    query = _upcoming_schedule_rows(now)
+    if user.role != "admin":
+        query = query.where(Enrollment.student_id == user.id)
+
+    desired = {}
+    for row in db.session.execute(query):
+        start_at = datetime.combine(row.date, row.start_time)
+        entry = _reminder_due_entry(user, start_at, now) if start_at > now else None
+        if entry:
+            desired[(row.id, user.id)] = entry
+    return _apply_reminder_plan(MeetingReminderDue.recipient_id == user.id, desired)
+
+
+def rebuild_meeting_reminder_index() -> int:
+    """Recompute every pending reminder row, e.g. after deploying or changing reminder config.
+
+    Already processed rows are kept unless their due time changed. The caller commits.
+    """
+    now = _utcnow_naive()
+    upcoming_rows = db.session.execute(_upcoming_schedule_rows(now).order_by(Schedule.id.asc())).all()
+    upcoming_ids = {row.id for row in upcoming_rows}
+
+    # Unsent rows of sessions that no longer get reminders.
+    orphaned_ids = [
+        schedule_id
+        for schedule_id in db.session.scalars(
+            select(MeetingReminderDue.schedule_id).where(MeetingReminderDue.processed_at.is_(None)).distinct()
+        )
+        if schedule_id not in upcoming_ids
+    ]
+    changed_count = 0
+    for start in range(0, len(orphaned_ids), MEETING_REMINDER_SYNC_CHUNK_SIZE):
+        changed_count += _apply_reminder_plan(
+            MeetingReminderDue.schedule_id.in_(orphaned_ids[start:start + MEETING_REMINDER_SYNC_CHUNK_SIZE]),
+            {},
+        )
 
-    date_label = schedule.date.isoformat()
-    time_label = schedule.start_time.strftime("%H:%M")
-    course_title = enrollment.course.title if enrollment.course else "your course"
+    admins = _admins_with_settings()
+    for start in range(0, len(upcoming_rows), MEETING_REMINDER_SYNC_CHUNK_SIZE):
+        chunk = upcoming_rows[start:start + MEETING_REMINDER_SYNC_CHUNK_SIZE]
+        changed_count += _sync_schedule_rows([row.id for row in chunk], chunk, admins, now)
+    return changed_count
 
-    queued_count = 0
-    for recipient in recipients:
-        lead_minutes = _meeting_reminder_lead_minutes(recipient)
-        target = start_at - timedelta(minutes=lead_minutes)
-        window_start = target - timedelta(seconds=window_seconds)
-        window_end = target + timedelta(seconds=window_seconds)
 
-        if now < window_start or now > window_end:
-            continue
+def ensure_meeting_reminder_index() -> int:
+    """Build the reminder index once when it is empty but sessions are upcoming; return rows written.
 
-        subject = f"Meeting reminder: starts in {lead_minutes} minute(s)"
-        if recipient.id == student.id:
-            body = (
-                f"<p>Hi {recipient.first_name},</p>"
-                f"<p>This is a reminder that your session for <strong>{course_title}</strong> starts in {lead_minutes} minute(s).</p>"
-                f"<p><strong>Date:</strong> {date_label}<br/><strong>Time:</strong> {time_label}</p>"
-            )
-        else:
-            body = (
-                f"<p>Hi {recipient.first_name},</p>"
-                f"<p>Reminder: a session for <strong>{course_title}</strong> starts in {lead_minutes} minute(s).</p>"
-                f"<p><strong>Student:</strong> {student.first_name} {student.last_name}<br/>"
-                f"<strong>Date:</strong> {date_label}<br/><strong>Time:</strong> {time_label}</p>"
-            )
+    Backfills the table after the migration that adds it, so reminders keep
+    going out without a manual ``flask rebuild-meeting-reminders``. Commits.
+    """
+    if db.session.execute(select(MeetingReminderDue.id).limit(1)).first() is not None:
+        return 0
+    if db.session.execute(_upcoming_schedule_rows(_utcnow_naive()).limit(1)).first() is None:
+        return 0
+    logger.warning("Meeting reminder index is empty; rebuilding it")
+    changed_count = rebuild_meeting_reminder_index()
+    db.session.commit()
+    logger.info("Meeting reminder index rebuilt", extra={"changed_count": changed_count})
+    return changed_count
 
-        reference_key = f"meeting-reminder:{schedule.id}:{recipient.id}:{lead_minutes}"
-        outcome = _queue_user_notification_outcome(
-            recipient,
-            "notify_on_meeting_reminder",
-            subject,
-            body,
-            reference_key=reference_key,
-        )
 
-        if outcome == "queued":
-            queued_count += 1
+def _meeting_reminder_email(reminder: MeetingReminderDue, now: datetime, window_seconds: int) -> dict | None:
+    schedule = reminder.schedule
+    enrollment = schedule.enrollment
+    if schedule.status != "scheduled" or not enrollment or not enrollment.student:
+        return None
+    if enrollment.status == "completed":
+        return None
+
+    start_at = datetime.combine(schedule.date, schedule.start_time)
+    if start_at <= now or now > reminder.due_at + timedelta(seconds=window_seconds):
+        return None
 
-    return queued_count
+    student = enrollment.student
+    recipient = reminder.recipient
+    lead_minutes = reminder.lead_minutes
+    context = {
+        "course_title": enrollment.course.title if enrollment.course else "your course",
+        "lead_minutes": lead_minutes,
+        "date": schedule.date.isoformat(),
+        "time": schedule.start_time.strftime("%H:%M"),
+    }
+    if recipient.id == student.id:
+        template_key = "meeting_reminder.student"
+    else:
+        template_key = "meeting_reminder.admin"
+        context["student_name"] = f"{student.first_name} {student.last_name}"
+
+    return _notification_email(
+        recipient,
+        "notify_on_meeting_reminder",
+        f"Meeting reminder: starts in {lead_minutes} minute(s)",
+        template_key,
+        context,
+        lane="reminder",
+        reference_key=f"meeting-reminder:{schedule.id}:{recipient.id}:{lead_minutes}",
+    )
 
 
 def process_meeting_reminders() -> int:
+    """Queue reminders whose ``due_at`` has passed and mark their index rows processed.
+
+    Reads only due rows of ``meeting_reminder_due`` (an index range scan),
+    ``MEETING_REMINDER_BATCH_SIZE`` at a time with their schedule, enrollment
+    and recipient joined in. Reminders found more than
+    ``MEETING_REMINDER_WINDOW_SECONDS`` late are dropped rather than sent
+    after the fact. Each batch is queued and marked in one transaction, and
+    ``reference_key`` keeps overlapping runs from queuing a reminder twice.
+    """
     window_seconds = max(15, int(current_app.config.get("MEETING_REMINDER_WINDOW_SECONDS", 90)))
-    _, _, max_lead_minutes = _meeting_reminder_bounds()
-
-    now = datetime.now(UTC).replace(tzinfo=None)
-    latest_start = now + timedelta(minutes=max_lead_minutes, seconds=window_seconds)
-    candidate_dates = {now.date(), latest_start.date()}
-    candidates = (
-        Schedule.query
-        .filter(
-            Schedule.status == "scheduled",
-            Schedule.date.in_(candidate_dates),
-        )
-        .all()
-    )
+    batch_size = max(1, int(current_app.config.get("MEETING_REMINDER_BATCH_SIZE", 500)))
+    now = _utcnow_naive()
 
     reminder_count = 0
-    for schedule in candidates:
-        reminder_count += _queue_meeting_reminder_for_schedule(schedule, now, window_seconds)
+    while True:
+        due = (
+            MeetingReminderDue.query
+            .options(
+                joinedload(MeetingReminderDue.recipient).joinedload(User.notification_settings),
+                joinedload(MeetingReminderDue.schedule)
+                .joinedload(Schedule.enrollment)
+                .options(joinedload(Enrollment.student), joinedload(Enrollment.course)),
+            )
+            .filter(MeetingReminderDue.processed_at.is_(None), MeetingReminderDue.due_at <= now)
+            .order_by(MeetingReminderDue.due_at.asc(), MeetingReminderDue.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not due:
+            break
+
+        emails = []
+        reminded_schedule_ids = set()
+        for reminder in due:
+            email = _meeting_reminder_email(reminder, now, window_seconds)
+            if email is not None:
+                emails.append(email)
+                reminded_schedule_ids.add(reminder.schedule_id)
+
+        try:
+            queued_count = queue_emails_bulk(emails, commit=False) if emails else 0
+            db.session.execute(
+                update(MeetingReminderDue)
+                .where(MeetingReminderDue.id.in_([reminder.id for reminder in due]))
+                .values(processed_at=now)
+            )
+            if reminded_schedule_ids:
+                db.session.execute(
+                    update(Schedule).where(Schedule.id.in_(reminded_schedule_ids)).values(reminder_sent_at=now)
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logger.exception("Failed to queue meeting reminders", extra={"count": len(emails)})
+            break
+
+        reminder_count += queued_count
+        if len(due) < batch_size:
+            break
 
     if reminder_count:
         logger.info("Meeting reminders queued", extra={"count": reminder_count})
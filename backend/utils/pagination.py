@@ -0,0 +1,159 @@
+"""Pagination helpers shared by list endpoints.
+
+Offset pagination (``?page=``) keeps the historical response shape. Keyset
+pagination is opt-in with ``?cursor=`` (an empty value starts at the first
+page) and walks the endpoint's sort keys instead of counting past ``OFFSET``
+rows, so deep pages cost the same as the first one. Cursors are opaque,
+signed, and bound to the endpoint that issued them.
+
+``?with_total=false`` skips the ``COUNT(*)`` in either mode.
+"""
+
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from flask import current_app, request
+from flask_smorest import abort
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import and_, or_
+
+logger = logging.getLogger(__name__)
+
+CURSOR_SALT = "list-pagination-cursor"
+
+
+def _cursor_serializer() -> URLSafeSerializer:
+    secret_key = current_app.config.get("SECRET_KEY") or current_app.config.get("JWT_SECRET_KEY")
+    return URLSafeSerializer(secret_key, salt=CURSOR_SALT)
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_value(column, raw_value):
+    if raw_value is None:
+        return None
+
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw_value)
+    if python_type is date:
+        return date.fromisoformat(raw_value)
+    if python_type is time:
+        return time.fromisoformat(raw_value)
+    return python_type(raw_value)
+
+
+def _keyset_predicate(sort_keys, values, forward: bool):
+    """Build ``(k1, k2, ...) > (v1, v2, ...)`` honouring each key's direction."""
+    clauses = []
+    for index, (column, descending) in enumerate(sort_keys):
+        moves_down = descending if forward else not descending
+        comparison = column < values[index] if moves_down else column > values[index]
+        equalities = [sort_keys[prior][0] == values[prior] for prior in range(index)]
+        clauses.append(and_(*equalities, comparison))
+    return or_(*clauses)
+
+
+def _order_clauses(sort_keys, forward: bool):
+    clauses = []
+    for column, descending in sort_keys:
+        use_descending = descending if forward else not descending
+        clauses.append(column.desc() if use_descending else column.asc())
+    return clauses
+
+
+def _wants_total() -> bool:
+    raw = request.args.get("with_total")
+    if raw is None:
+        return True
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _page_size(default_page_size: int, max_page_size: int | None) -> int:
+    page_size = request.args.get("page_size", default_page_size, type=int)
+    if max_page_size is not None:
+        page_size = max(1, min(page_size, max_page_size))
+    return page_size
+
+
+def is_cursor_request() -> bool:
+    """Return True when the caller opted into keyset pagination."""
+    return "cursor" in request.args
+
+
+def paginate_request(query, *, sort_keys, default_page_size: int = 10, max_page_size: int | None = None):
+    """Paginate ``query`` from request args and return ``(items, pagination)``.
+
+    ``sort_keys`` is an ordered list of ``(column, descending)`` pairs whose
+    last entry must be unique (normally the primary key). Offset mode applies
+    them after any ordering already on the query; cursor mode replaces the
+    query's ordering with them.
+    """
+    page_size = _page_size(default_page_size, max_page_size)
+    with_total = _wants_total()
+
+    if not is_cursor_request():
+        page = request.args.get("page", 1, type=int)
+        pagination = query.order_by(*_order_clauses(sort_keys, forward=True)).paginate(
+            page=page,
+            per_page=page_size,
+            error_out=False,
+            count=with_total,
+        )
+        return pagination.items, {
+            "page": pagination.page,
+            "page_size": pagination.per_page,
+            "total": pagination.total,
+            "total_pages": pagination.pages if with_total else None,
+        }
+
+    raw_cursor = (request.args.get("cursor") or "").strip()
+    position = None
+    forward = True
+    if raw_cursor:
+        try:
+            payload = _cursor_serializer().loads(raw_cursor)
+            if payload.get("e") != request.endpoint or len(payload.get("v", [])) != len(sort_keys):
+                raise BadSignature("Cursor does not belong to this endpoint.")
+            position = [
+                _decode_value(column, raw_value)
+                for (column, _), raw_value in zip(sort_keys, payload["v"])
+            ]
+            forward = payload.get("d", "next") != "prev"
+        except (BadSignature, TypeError, ValueError, AttributeError):
+            logger.warning("Rejected invalid pagination cursor", extra={"endpoint": request.endpoint})
+            abort(400, message="Invalid pagination cursor.")
+
+    total = query.order_by(None).count() if with_total else None
+
+    page_query = query.order_by(None)
+    if position is not None:
+        page_query = page_query.filter(_keyset_predicate(sort_keys, position, forward))
+    rows = page_query.order_by(*_order_clauses(sort_keys, forward)).limit(page_size + 1).all()
+
+    has_more = len(rows) > page_size
+    items = rows[:page_size]
+    if not forward:
+        items.reverse()
+
+    def _cursor_for(item, direction):
+        values = [_encode_value(getattr(item, column.key)) for column, _ in sort_keys]
+        return _cursor_serializer().dumps({"e": request.endpoint, "v": values, "d": direction})
+
+    has_next = has_more if forward else position is not None
+    has_prev = position is not None if forward else has_more
+
+    return items, {
+        "page_size": page_size,
+        "total": total,
+        "total_pages": (-(-total // page_size) if page_size else 0) if total is not None else None,
+        "next_cursor": _cursor_for(items[-1], "next") if items and has_next else None,
+        "prev_cursor": _cursor_for(items[0], "prev") if items and has_prev else None,
+    }
@@ -0,0 +1,72 @@
+"""Course rating aggregate helpers.
+
+Keeps the denormalized ``rating_sum``/``rating_count`` columns on courses in
+step with review writes, and rebuilds them from the reviews table on demand.
+"""
+
+import logging
+
+from sqlalchemy import func, select, update
+
+from db import db
+from models import Course, Review
+
+logger = logging.getLogger(__name__)
+
+
+def apply_review_rating(course_id: int, rating: int) -> None:
+    """Add one review rating to a course aggregate inside the caller's transaction.
+
+    The increment is expressed in SQL so concurrent review writes cannot lose
+    updates by racing on a read-modify-write in Python.
+    """
+    db.session.execute(
+        update(Course)
+        .where(Course.id == course_id)
+        .values(
+            rating_sum=Course.rating_sum + int(rating),
+            rating_count=Course.rating_count + 1,
+        )
+    )
+
+
+def recompute_course_ratings(course_ids=None) -> int:
+    """Rebuild rating aggregates from reviews and return how many courses changed.
+
+    When ``course_ids`` is omitted every course is repaired. The caller owns the
+    transaction and is responsible for committing.
+    """
+    totals_query = select(
+        Review.course_id,
+        func.coalesce(func.sum(Review.rating), 0),
+        func.count(Review.id),
+    ).group_by(Review.course_id)
+    courses_query = select(Course.id, Course.rating_sum, Course.rating_count)
+
+    if course_ids is not None:
+        normalized_ids = {int(course_id) for course_id in course_ids if course_id is not None}
+        if not normalized_ids:
+            return 0
+        totals_query = totals_query.where(Review.course_id.in_(normalized_ids))
+        courses_query = courses_query.where(Course.id.in_(normalized_ids))
+
+    totals = {
+        course_id: (int(rating_sum), int(rating_count))
+        for course_id, rating_sum, rating_count in db.session.execute(totals_query)
+    }
+
+    changed_count = 0
+    for course_id, current_sum, current_count in db.session.execute(courses_query).all():
+        expected_sum, expected_count = totals.get(course_id, (0, 0))
+        if (current_sum, current_count) == (expected_sum, expected_count):
+            continue
+
+        db.session.execute(
+            update(Course)
+            .where(Course.id == course_id)
+            .values(rating_sum=expected_sum, rating_count=expected_count)
+        )
+        changed_count += 1
+
+    logger.info("Course rating aggregates recomputed", extra={"changed_count": changed_count})
+    return changed_count
@@ -0,0 +1,272 @@
+"""Response caching for public, read-heavy endpoints.
+
+Cached views are keyed on the request path plus the normalized query string
+and grouped into namespaces. Writes invalidate a whole namespace by bumping
+its generation counter, so stale entries are never served and simply age out
+of the backend.
+
+Two backends are available:
+- ``MemoryCacheBackend``: in-process LRU with per-entry TTL (default).
+- ``RedisCacheBackend``: any client speaking the Redis ``GET``/``SET``/``INCR``
+  commands, shared across processes and replicas.
+
+Concurrent misses for the same key are collapsed into a single computation
+per process (single-flight), and hit/miss counters are kept for monitoring.
+"""
+
+import importlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, current_app, request
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_EXTENSION_KEY = "response_cache"
+
+
+class MemoryCacheBackend:
+    """Bounded in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, tuple[float | None, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl_seconds: int | None = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            _, current = self._entries.get(key, (None, 0))
+            value = int(current or 0) + 1
+            self._entries[key] = (None, value)
+            self._entries.move_to_end(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Cache backend for a Redis-protocol client (redis-py or a compatible fake)."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            redis = importlib.import_module("redis")
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("redis is required for the redis response cache backend.") from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str):
+        return self.client.get(key)
+
+    def set(self, key: str, value, ttl_seconds: int | None = None) -> None:
+        self.client.set(key, value, ex=ttl_seconds or None)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(key))
+
+
+class ResponseCache:
+    """Namespace-aware response cache with single-flight misses and counters."""
+
+    def __init__(self, backend, *, ttl_seconds: int = 60, key_prefix: str = "insideout:response") -> None:
+        self.backend = backend
+        self.ttl_seconds = int(ttl_seconds)
+        self.key_prefix = key_prefix
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "errors": 0}
+        self._inflight_lock = threading.Lock()
+        self._inflight: dict[str, threading.Lock] = {}
+
+    def _record(self, stat: str) -> None:
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["backend"] = type(self.backend).__name__
+        return stats
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.key_prefix}:generation:{namespace}"
+
+    def generation(self, namespace: str) -> int:
+        """Return how many times ``namespace`` has been invalidated."""
+        raw_generation = self.backend.get(self._generation_key(namespace))
+        return int(raw_generation) if raw_generation is not None else 0
+
+    def _entry_key(self, namespace: str, request_key: str) -> str:
+        return f"{self.key_prefix}:{namespace}:{self.generation(namespace)}:{request_key}"
+
+    def invalidate(self, namespace: str) -> None:
+        try:
+            self.backend.incr(self._generation_key(namespace))
+        except Exception:
+            self._record("errors")
+            logger.exception("Response cache invalidation failed", extra={"namespace": namespace})
+            return
+        self._record("invalidations")
+        logger.debug("Response cache namespace invalidated", extra={"namespace": namespace})
+
+    def _key_lock(self, entry_key: str) -> threading.Lock:
+        with self._inflight_lock:
+            lock = self._inflight.get(entry_key)
+            if lock is None:
+                lock = threading.Lock()
+                self._inflight[entry_key] = lock
+            return lock
+
+    def _release_key_lock(self, entry_key: str) -> None:
+        with self._inflight_lock:
+            self._inflight.pop(entry_key, None)
+
+    def get_or_compute(self, namespace: str, request_key: str, compute):
+        """Return ``(payload, hit)``; ``compute`` returns a payload dict or None to skip caching."""
+        try:
+            entry_key = self._entry_key(namespace, request_key)
+            cached = self.backend.get(entry_key)
+        except Exception:
+            self._record("errors")
+            logger.exception("Response cache lookup failed", extra={"namespace": namespace})
+            return compute(), False
+
+        if cached is not None:
+            self._record("hits")
+            return json.loads(cached), True
+
+        key_lock = self._key_lock(entry_key)
+        with key_lock:
+            # Another request may have filled the entry while this one waited.
+            cached = self.backend.get(entry_key)
+            if cached is not None:
+                self._record("hits")
+                return json.loads(cached), True
+
+            self._record("misses")
+            try:
+                payload = compute()
+                if payload is not None:
+                    self.backend.set(entry_key, json.dumps(payload), self.ttl_seconds)
+            finally:
+                self._release_key_lock(entry_key)
+
+        return payload, False
+
+
+def init_response_cache(app) -> ResponseCache | None:
+    """Build the configured response cache and register it on the app."""
+    backend_name = str(app.config.get("RESPONSE_CACHE_BACKEND", "memory") or "none").strip().lower()
+
+    if backend_name in {"none", "off", "disabled"}:
+        app.extensions[RESPONSE_CACHE_EXTENSION_KEY] = None
+        app.logger.info("Response cache disabled by configuration")
+        return None
+
+    if backend_name == "redis":
+        redis_url = app.config.get("RESPONSE_CACHE_REDIS_URL")
+        if not redis_url:
+            raise RuntimeError("RESPONSE_CACHE_REDIS_URL is required for the redis response cache backend.")
+        backend = RedisCacheBackend.from_url(redis_url)
+    elif backend_name == "memory":
+        backend = MemoryCacheBackend(max_entries=int(app.config.get("RESPONSE_CACHE_MAX_ENTRIES", 512)))
+    else:
+        raise RuntimeError("Unsupported RESPONSE_CACHE_BACKEND configuration.")
+
+    cache = ResponseCache(backend, ttl_seconds=int(app.config.get("RESPONSE_CACHE_TTL_SECONDS", 60)))
+    app.extensions[RESPONSE_CACHE_EXTENSION_KEY] = cache
+    app.logger.info("Response cache initialized", extra={"backend": backend_name})
+    return cache
+
+
+def get_response_cache() -> ResponseCache | None:
+    return current_app.extensions.get(RESPONSE_CACHE_EXTENSION_KEY)
+
+
+def invalidate_response_cache(*namespaces: str) -> None:
+    """Drop every cached response in the given namespaces."""
+    cache = get_response_cache()
+    if cache is None:
+        return
+    for namespace in namespaces:
+        cache.invalidate(namespace)
+
+
+def _request_cache_key() -> str:
+    normalized_args = sorted(
+        (key, value.strip()) for key, value in request.args.items(multi=True) if value.strip()
+    )
+    query_string = "&".join(f"{key}={value}" for key, value in normalized_args)
+    return f"{request.path}?{query_string}"
+
+
+def cached_response(namespace: str):
+    """Cache successful anonymous responses of a view under ``namespace``.
+
+    Requests carrying an ``Authorization`` header bypass the cache because
+    their payload may depend on the caller.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = get_response_cache()
+            if cache is None or request.headers.get("Authorization"):
+                return fn(*args, **kwargs)
+
+            response_holder = {}
+
+            def _compute():
+                response = current_app.make_response(fn(*args, **kwargs))
+                response_holder["response"] = response
+                if response.status_code != 200 or response.direct_passthrough:
+                    return None
+                return {
+                    "status": response.status_code,
+                    "mimetype": response.mimetype,
+                    "body": response.get_data(as_text=True),
+                }
+
+            payload, hit = cache.get_or_compute(namespace, _request_cache_key(), _compute)
+            if not hit and "response" in response_holder:
+                response = response_holder["response"]
+            else:
+                response = Response(payload["body"], status=payload["status"], mimetype=payload["mimetype"])
+            response.headers["X-Cache"] = "HIT" if hit else "MISS"
+            return response
+
+        return wrapper
+
+    return decorator
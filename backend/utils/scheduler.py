@@ -1,64 +1,157 @@
 """Scheduler utility helpers.
 
-This module wires background recurring jobs for:
-- processing queued emails through SendGrid
+This module wires background work for:
+- processing queued emails through SendGrid, in a dispatcher thread woken as
+  soon as emails are queued (``utils.email_wakeup``) rather than on a timer
 - enqueuing meeting reminders based on user preferences
+- running queued background jobs (e.g. media derivatives)
 
 Jobs execute inside Flask app context so they can use config, DB session, and
 application logging safely.
+
+The jobs run either in a background thread of each app process
+(``init_scheduler``) or in a dedicated ``flask worker`` process
+(``run_worker``). Either way, every scheduler competes for the database-backed
+``scheduler_lease`` and only the current lease holder runs the meeting
+reminder tick, so adding web instances or workers never runs it twice.
+
+Emails and background jobs are drained by every process: their claims use
+``FOR UPDATE SKIP LOCKED``, so concurrent processes take disjoint batches and
+adding workers adds throughput.
 """
 
 import atexit
+import logging
 import os
+import signal
+import threading
+from datetime import UTC, datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
 
-from utils.email import process_pending_emails
-from utils.notifications import process_meeting_reminders
+from db import db
+from utils.email import process_pending_emails, seconds_until_next_email
+from utils.email_wakeup import PostgresWakeupListener, email_wakeup
+from utils.jobs import process_pending_jobs
+from utils.leader_lease import scheduler_lease
+from utils.notifications import ensure_meeting_reminder_index, process_meeting_reminders
+
+logger = logging.getLogger(__name__)
 
 scheduler = BackgroundScheduler()
+# Shortest sleep between dispatcher runs, so a row that stays due cannot cause a busy loop.
+_MIN_DISPATCH_WAIT_SECONDS = 0.1
 
 
-def init_scheduler(app):
-    """Initialize APScheduler jobs once per app process.
+class EmailDispatcher(threading.Thread):
+    """Send queued emails as soon as they are committed.
 
-    Guard rails are included for:
-    - pytest runs
-    - explicit config disable
-    - Flask debug reloader parent process
+    Each wakeup drains the queue with ``process_pending_emails()`` until a run
+    claims nothing, then sleeps
+    until the next retry is due, the circuit breaker closes, or
+    ``EMAIL_IDLE_POLL_SECONDS`` pass, whichever is first. A wakeup during a
+    run is kept, so the next wait returns at once.
     """
-    if "PYTEST_CURRENT_TEST" in os.environ:
-        app.logger.info("Background scheduler jobs disabled under pytest")
-        return
 
-    if not app.config.get("EMAIL_SCHEDULER_ENABLED", True):
-        app.logger.info("Background scheduler jobs disabled by configuration")
+    def __init__(self, app) -> None:
+        super().__init__(name="email-dispatcher", daemon=True)
+        self._app = app
+        self._stopped = threading.Event()
+        self._listener = None
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._listener is not None:
+            self._listener.stop()
+        email_wakeup.set()
+
+    def run(self) -> None:
+        idle_seconds = self._app.config["EMAIL_IDLE_POLL_SECONDS"]
+        # Failed runs retry on the lease renewal cadence.
+        recheck_seconds = min(idle_seconds, max(1, self._app.config["SCHEDULER_LEADER_LEASE_SECONDS"] // 3))
+        with self._app.app_context():
+            if db.engine.dialect.name == "postgresql":
+                self._listener = PostgresWakeupListener(db.engine)
+                self._listener.start()
+
+        while not self._stopped.is_set():
+            try:
+                with self._app.app_context():
+                    while process_pending_emails() and not self._stopped.is_set():
+                        pass
+                    wait_seconds = seconds_until_next_email(idle_seconds)
+            except Exception:
+                logger.exception("Email dispatcher run failed")
+                wait_seconds = recheck_seconds
+            email_wakeup.wait(max(_MIN_DISPATCH_WAIT_SECONDS, wait_seconds))
+
+
+_email_dispatcher: EmailDispatcher | None = None
+
+
+def _start_email_dispatcher(app) -> None:
+    global _email_dispatcher
+    if _email_dispatcher is not None and _email_dispatcher.is_alive():
         return
+    _email_dispatcher = EmailDispatcher(app)
+    _email_dispatcher.start()
 
-    if app.debug and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
-        app.logger.info("Skipping scheduler in Werkzeug reloader parent process")
-        return
 
-    def _email_retry_job():
-        with app.app_context():
-            process_pending_emails()
+def _stop_email_dispatcher() -> None:
+    global _email_dispatcher
+    if _email_dispatcher is not None:
+        _email_dispatcher.stop()
+        _email_dispatcher = None
 
-    def _meeting_reminder_job():
-        with app.app_context():
-            process_meeting_reminders()
 
-    scheduler.add_job(
-        func=_email_retry_job,
+def _register_jobs(target, app):
+    """Add the lease renewal job, the leader-only reminder tick and the job processor to ``target``.
+
+    Emails are not a periodic job; ``EmailDispatcher`` sends them.
+    """
+    lease_seconds = app.config["SCHEDULER_LEADER_LEASE_SECONDS"]
+
+    def _leader_lease_job():
+        was_leader = scheduler_lease.is_leader()
+        with app.app_context():
+            if scheduler_lease.acquire(lease_seconds) and not was_leader:
+                try:
+                    ensure_meeting_reminder_index()
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Meeting reminder index backfill failed")
+
+    def _with_app_context(func):
+        def _job():
+            with app.app_context():
+                func()
+
+        return _job
+
+    def _leader_only(func):
+        def _job():
+            if not scheduler_lease.is_leader():
+                return
+            with app.app_context():
+                func()
+
+        return _job
+
+    target.add_job(
+        func=_leader_lease_job,
         trigger="interval",
-        seconds=app.config["EMAIL_RETRY_INTERVAL_SECONDS"],
-        id="email_retry_job",
+        # Renew three times per lease so one slow or failed renewal does not drop leadership.
+        seconds=max(1, lease_seconds // 3),
+        id="scheduler_leader_lease",
+        next_run_time=datetime.now(UTC),
         replace_existing=True,
         max_instances=1,
         coalesce=True,
     )
 
-    scheduler.add_job(
-        func=_meeting_reminder_job,
+    target.add_job(
+        func=_leader_only(process_meeting_reminders),
         trigger="interval",
         seconds=app.config["MEETING_REMINDER_CHECK_INTERVAL_SECONDS"],
         id="meeting_reminder_job",
@@ -67,13 +160,86 @@ def init_scheduler(app):
         coalesce=True,
     )
 
+    # Job claims skip rows locked by other processes, so every process can drain the queue.
+    target.add_job(
+        func=_with_app_context(process_pending_jobs),
+        trigger="interval",
+        seconds=app.config["BACKGROUND_JOB_INTERVAL_SECONDS"],
+        id="background_job_processor",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+
+def init_scheduler(app):
+    """Initialize APScheduler jobs once per app process.
+
+    Guard rails are included for:
+    - pytest runs
+    - explicit config disable
+    - web processes when jobs run in a dedicated ``flask worker``
+    - Flask debug reloader parent process
+    """
+    if "PYTEST_CURRENT_TEST" in os.environ:
+        app.logger.info("Background scheduler jobs disabled under pytest")
+        return
+
+    if not app.config.get("EMAIL_SCHEDULER_ENABLED", True):
+        app.logger.info("Background scheduler jobs disabled by configuration")
+        return
+
+    if not app.config.get("SCHEDULER_IN_WEB_PROCESS", True):
+        app.logger.info("Background scheduler jobs left to `flask worker`")
+        return
+
+    if app.debug and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        app.logger.info("Skipping scheduler in Werkzeug reloader parent process")
+        return
+
+    _register_jobs(scheduler, app)
+
     if not scheduler.running:
         scheduler.start()
+    _start_email_dispatcher(app)
 
     # Shut down scheduler when app exits
-    atexit.register(_shutdown_scheduler)
+    atexit.register(_shutdown_scheduler, app)
+
 
+def run_worker(app):
+    """Run the periodic jobs in the foreground until SIGINT/SIGTERM.
 
-def _shutdown_scheduler():
+    Used by ``flask worker``. A scheduler that ``create_app`` already started
+    in this process is stopped first, so the worker is the only one here.
+    """
+    _shutdown_scheduler(app)
+
+    worker_scheduler = BlockingScheduler()
+    _register_jobs(worker_scheduler, app)
+
+    def _stop(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _stop)
+    app.logger.info("Scheduler worker started", extra={"holder": scheduler_lease.holder})
+    try:
+        _start_email_dispatcher(app)
+        worker_scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        _stop_email_dispatcher()
+        if worker_scheduler.running:
+            worker_scheduler.shutdown(wait=False)
+        with app.app_context():
+            scheduler_lease.release()
+        app.logger.info("Scheduler worker stopped", extra={"holder": scheduler_lease.holder})
+
+
+def _shutdown_scheduler(app):
+    _stop_email_dispatcher()
     if scheduler.running:
         scheduler.shutdown(wait=False)
+        with app.app_context():
+            scheduler_lease.release()
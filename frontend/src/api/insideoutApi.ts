@@ -20,6 +20,8 @@ import type {
   EnrollmentListResponse,
   GroupedSchedulesItem,
   LoginPayload,
+  MediaUploadTicket,
+  MyReviewResponse,
   NotificationSettings,
   NotificationSettingsPayload,
   PaymentNotificationOutcomeListParams,
@@ -28,6 +30,8 @@ import type {
   RefreshTokensResponse,
   RefreshEnrollmentZoomLinkResponse,
   Review,
+  ReviewListParams,
+  ReviewListResponse,
   SavedCoursesParams,
   Schedule,
   ScheduleChangeRequestPayload,
@@ -49,6 +53,8 @@ import type {
 
 /**
  * Builds multipart form data for course create/update APIs.
+ *
+ * Videos are left out: they are sent straight to storage by uploadCourseMedia.
  */
 function buildCourseFormData(payload: CourseFormPayload | CourseUpdatePayload): FormData {
   const formData = new FormData();
@@ -56,11 +62,46 @@ function buildCourseFormData(payload: CourseFormPayload | CourseUpdatePayload):
   if (payload.title !== undefined) formData.append("title", payload.title);
   if (payload.description !== undefined) formData.append("description", payload.description);
   if (payload.price !== undefined) formData.append("price", payload.price);
-  if (payload.media) formData.append("media", payload.media);
+  if (payload.media && !isDirectUploadMedia(payload.media)) formData.append("media", payload.media);
 
   return formData;
 }
 
+function isDirectUploadMedia(file: File): boolean {
+  return file.type.startsWith("video/");
+}
+
+/**
+ * Uploads a file directly to media storage and attaches it to a course.
+ *
+ * The backend issues a signed ticket, the bytes go to the bucket (or the local
+ * signed endpoint), and the confirm call verifies the object before attaching it.
+ */
+async function uploadCourseMedia(courseId: number, file: File): Promise<CourseSummary> {
+  const { data: ticket } = await apiClient.post<MediaUploadTicket>("/media-uploads/", {
+    file_name: file.name,
+    content_type: file.type,
+    size_bytes: file.size,
+  });
+
+  if (ticket.method === "POST") {
+    const form = new FormData();
+    Object.entries(ticket.fields ?? {}).forEach(([key, value]) => form.append(key, value));
+    form.append("file", file);
+    const response = await fetch(ticket.url, { method: "POST", body: form });
+    if (!response.ok) {
+      throw new Error(`Media upload failed with status ${response.status}.`);
+    }
+  } else {
+    await apiClient.put(ticket.url, file, { headers: ticket.headers });
+  }
+
+  const { data } = await apiClient.post<CourseSummary>(`/courses/${courseId}/media`, {
+    upload_token: ticket.upload_token,
+  });
+  return data;
+}
+
 /**
  * Course API functions.
  *
@@ -93,6 +134,9 @@ export const coursesApi = {
     const { data } = await apiClient.post<CourseSummary>("/courses/", formData, {
       headers: { "Content-Type": "multipart/form-data" },
     });
+    if (payload.media && isDirectUploadMedia(payload.media)) {
+      return uploadCourseMedia(data.id, payload.media);
+    }
     return data;
   },
 
@@ -104,6 +148,9 @@ export const coursesApi = {
     const { data } = await apiClient.put<CourseSummary>(`/courses/${courseId}`, formData, {
       headers: { "Content-Type": "multipart/form-data" },
     });
+    if (payload.media && isDirectUploadMedia(payload.media)) {
+      return uploadCourseMedia(courseId, payload.media);
+    }
     return data;
   },
 
@@ -253,13 +300,23 @@ export const schedulesApi = {
  */
 export const reviewsApi = {
   /**
-   * List reviews for a course.
+   * List a page of reviews for a course, newest first, with the rating histogram.
    */
-  async listByCourse(courseId: number): Promise<Review[]> {
-    const { data } = await apiClient.get<Review[]>(`/courses/${courseId}/reviews/`);
+  async listByCourse(courseId: number, params?: ReviewListParams): Promise<ReviewListResponse> {
+    const { data } = await apiClient.get<ReviewListResponse>(`/courses/${courseId}/reviews/`, {
+      params: { cursor: "", ...params },
+    });
     return data;
   },
 
+  /**
+   * Fetch the current user's review of a course, or null when they have not reviewed it.
+   */
+  async mine(courseId: number): Promise<Review | null> {
+    const { data } = await apiClient.get<MyReviewResponse>(`/courses/${courseId}/reviews/mine`);
+    return data.review;
+  },
+
   /**
    * Create a review for a course.
    */
@@ -8,6 +8,9 @@ export interface PaginationMeta {
   page_size: number;
   total: number;
   total_pages: number;
+  /** Present only when the request opted into keyset pagination with `cursor`. */
+  next_cursor?: string | null;
+  prev_cursor?: string | null;
 }
 
 export interface PaginatedResponse<T> {
@@ -127,15 +130,28 @@ export interface CourseReviewSummary {
   };
 }
 
+export interface CourseImageVariant {
+  width: number;
+  height: number;
+  url: string;
+}
+
 export interface CourseSummary {
   id: number;
   title: string;
   description: string;
   image_url: string | null;
+  /** Resized WebP copies of image_url; null until the background job has built them. */
+  image_variants?: CourseImageVariant[] | null;
   preview_video_url: string | null;
+  preview_poster_url?: string | null;
   price: string;
   created_at: string;
   average_rating: number;
+  /** Caller-specific annotations, present only when the catalog request is authenticated. */
+  is_saved?: boolean;
+  is_enrolled?: boolean;
+  enrollment_status?: Enrollment["status"] | null;
 }
 
 export interface CourseDetail extends CourseSummary {
@@ -170,6 +186,18 @@ export interface CourseUpdatePayload {
   media?: File | null;
 }
 
+export interface MediaUploadTicket {
+  upload_token: string;
+  storage_key: string;
+  media_type: "images" | "videos";
+  /** "POST" for a presigned bucket form upload, "PUT" for the local signed endpoint. */
+  method: "POST" | "PUT";
+  url: string;
+  fields?: Record<string, string>;
+  headers?: Record<string, string>;
+  expires_in: number;
+}
+
 export interface CreateEnrollmentPayload {
   student_id: number;
   course_id: number;
@@ -263,6 +291,24 @@ export interface Review {
   };
 }
 
+/** Review counts keyed by star value ("1"-"5") across the whole course. */
+export type RatingHistogram = Record<"1" | "2" | "3" | "4" | "5", number>;
+
+export interface ReviewListParams {
+  /** Keyset cursor from a previous page; an empty string starts at the newest review. */
+  cursor?: string;
+  page_size?: number;
+}
+
+export interface ReviewListResponse extends PaginatedResponse<Review> {
+  rating_histogram: RatingHistogram;
+}
+
+export interface MyReviewResponse {
+  /** The current user's review of the course, or null when they have not reviewed it. */
+  review: Review | null;
+}
+
 export interface CreateReviewPayload {
   rating: number;
   comment?: string;
@@ -6,14 +6,21 @@ import { Dialog, DialogContent, DialogFooter, DialogHeader, DialogTitle } from "
 import { AuthModal } from "@/components/AuthModal";
 import defaultCourseImage from "@/assets/course-default-img.jpg";
 import { useAppSelector } from "@/store/hooks";
+import type { CourseImageVariant } from "@/api/types";
 
 const DEFAULT_COURSE_IMAGE = defaultCourseImage;
 const DESCRIPTION_PREVIEW_CHAR_LIMIT = 120;
+const WIDE_IMAGE_SIZES = "(min-width: 640px) 256px, 100vw";
+const COMPACT_IMAGE_SIZES = "320px";
+
+const buildSrcSet = (variants?: CourseImageVariant[] | null) =>
+  variants?.length ? variants.map((variant) => `${variant.url} ${variant.width}w`).join(", ") : undefined;
 
 export interface CourseCardData {
   id: number | string;
   title: string;
   image: string | null;
+  imageVariants?: CourseImageVariant[] | null;
   rating: number;
   reviewCount: number;
   price: number | string;
@@ -41,6 +48,7 @@ export function CourseCard({
   const isAuthenticated = useAppSelector((state) => Boolean(state.users.auth.accessToken));
   const canEnroll = currentUser?.role !== "admin";
   const imageSrc = course.image?.trim() ? course.image : DEFAULT_COURSE_IMAGE;
+  const imageSrcSet = course.image?.trim() ? buildSrcSet(course.imageVariants) : undefined;
   const numericRating = Number(course.rating);
   const hasRating = Number.isFinite(numericRating) && numericRating > 0;
   const isNewCourse = !hasRating;
@@ -52,6 +60,8 @@ export function CourseCard({
 
   const handleImageError = (event: React.SyntheticEvent<HTMLImageElement>) => {
     const target = event.currentTarget;
+    // Drop the variants too, otherwise the browser keeps picking a srcset candidate.
+    target.removeAttribute("srcset");
     if (target.src !== DEFAULT_COURSE_IMAGE) {
       target.src = DEFAULT_COURSE_IMAGE;
     }
@@ -76,6 +86,8 @@ export function CourseCard({
           <div className="sm:w-64 h-48 sm:h-auto overflow-hidden shrink-0">
             <img
               src={imageSrc}
+              srcSet={imageSrcSet}
+              sizes={imageSrcSet ? WIDE_IMAGE_SIZES : undefined}
               alt={course.title}
               onError={handleImageError}
               className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500"
@@ -163,6 +175,8 @@ export function CourseCard({
       <div className="h-44 overflow-hidden">
         <img
           src={imageSrc}
+          srcSet={imageSrcSet}
+          sizes={imageSrcSet ? COMPACT_IMAGE_SIZES : undefined}
           alt={course.title}
           onError={handleImageError}
           className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500"
@@ -20,6 +20,8 @@ import {
   fetchCurrentUser,
   fetchCourseReviews,
   fetchCourseSchedules,
+  fetchMoreCourseReviews,
+  fetchMyCourseReview,
   fetchEnrollments,
   fetchSavedCourses,
   replyToReview,
@@ -65,6 +67,13 @@ const CourseDetailPage = () => {
   const fullReviews = useAppSelector((state) =>
     isCourseIdValid ? state.reviews.byCourseId[courseId] ?? [] : [],
   );
+  const reviewsPage = useAppSelector((state) =>
+    isCourseIdValid ? state.reviews.pageByCourseId[courseId] ?? null : null,
+  );
+  const myReview = useAppSelector((state) =>
+    isCourseIdValid ? state.reviews.mineByCourseId[courseId] ?? null : null,
+  );
+  const loadMoreReviewsStatus = useAppSelector((state) => state.reviews.requests.loadMore.status);
 
   const schedules = useAppSelector((state) =>
     isCourseIdValid ? state.courses.schedulesByCourseId[courseId] ?? [] : [],
@@ -101,6 +110,12 @@ const CourseDetailPage = () => {
     }
   }, [dispatch, isAuthenticated, isAdmin]);
 
+  useEffect(() => {
+    if (isCourseIdValid && isAuthenticated && !isAdmin) {
+      dispatch(fetchMyCourseReview(courseId));
+    }
+  }, [courseId, dispatch, isAuthenticated, isAdmin, isCourseIdValid]);
+
   useEffect(() => {
     if (accessToken && !currentUser) {
       dispatch(fetchCurrentUser());
@@ -146,19 +161,24 @@ const CourseDetailPage = () => {
   );
   const hasEligibleEnrollment = Boolean(enrolledEnrollment);
   const isAlreadyEnrolled = hasEligibleEnrollment;
-  const totalReviewCount = fullReviews.length || previewReviews.length;
+  const histogramEntries = useMemo(
+    () => Object.entries(reviewsPage?.histogram ?? {}).map(([star, count]) => [Number(star), Number(count)] as const),
+    [reviewsPage?.histogram],
+  );
+  const histogramReviewCount = histogramEntries.reduce((sum, [, count]) => sum + count, 0);
+  const totalReviewCount = histogramReviewCount || fullReviews.length || previewReviews.length;
   const displayedAverageRating = useMemo(() => {
     const fallbackAverage = Number(course?.average_rating ?? 0);
-    if (fullReviews.length === 0) {
+    if (histogramReviewCount === 0) {
       return Number.isFinite(fallbackAverage) ? fallbackAverage : 0;
     }
 
-    const totalRating = fullReviews.reduce((sum, review) => sum + Number(review.rating ?? 0), 0);
-    const average = totalRating / fullReviews.length;
+    const totalRating = histogramEntries.reduce((sum, [star, count]) => sum + star * count, 0);
+    const average = totalRating / histogramReviewCount;
     return Number.isFinite(average) ? average : (Number.isFinite(fallbackAverage) ? fallbackAverage : 0);
-  }, [course?.average_rating, fullReviews]);
+  }, [course?.average_rating, histogramEntries, histogramReviewCount]);
   const displayedAverageRatingLabel = displayedAverageRating.toFixed(1);
-  const hasAuthoredReview = Boolean(currentUser && fullReviews.some((review) => review.user_id === currentUser.id));
+  const hasAuthoredReview = Boolean(currentUser && myReview);
   const isCourseSaved = useMemo(
     () => savedCourses.some((savedCourse) => savedCourse.id === courseId),
     [courseId, savedCourses],
@@ -167,7 +187,15 @@ const CourseDetailPage = () => {
     () => fullReviews.slice(0, visibleReviewsCount),
     [fullReviews, visibleReviewsCount],
   );
-  const hasMoreReviews = fullReviews.length > visibleReviewsCount;
+  const hasMoreReviews = fullReviews.length > visibleReviewsCount || Boolean(reviewsPage?.nextCursor);
+
+  const handleLoadMoreReviews = () => {
+    const nextVisibleCount = visibleReviewsCount + REVIEWS_PAGE_STEP;
+    setVisibleReviewsCount(nextVisibleCount);
+    if (nextVisibleCount > fullReviews.length && reviewsPage?.nextCursor && loadMoreReviewsStatus !== "loading") {
+      dispatch(fetchMoreCourseReviews({ courseId, cursor: reviewsPage.nextCursor }));
+    }
+  };
 
   const getReviewAuthorLabel = (review: { id: number; author?: { initials?: string; first_name?: string; last_name?: string } }) => {
     const initials = review.author?.initials || `U${String(review.id).slice(-2)}`;
@@ -672,7 +700,8 @@ const CourseDetailPage = () => {
                       <div className="pt-2">
                         <Button
                           variant="outline"
-                          onClick={() => setVisibleReviewsCount((current) => current + REVIEWS_PAGE_STEP)}
+                          onClick={handleLoadMoreReviews}
+                          disabled={loadMoreReviewsStatus === "loading"}
                         >
                           Load More Reviews
                         </Button>
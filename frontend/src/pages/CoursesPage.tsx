@@ -36,6 +36,7 @@ const CoursesPage = () => {
         title: course.title,
         description: course.description,
         image: course.image_url,
+        imageVariants: course.image_variants,
         category: "Course",
         rating: course.average_rating,
         reviewCount: 0,
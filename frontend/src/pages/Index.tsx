@@ -26,6 +26,7 @@ const Index = () => {
     title: course.title,
     description: course.description,
     image: course.image_url,
+    imageVariants: course.image_variants,
     category: "Course",
     rating: course.average_rating,
     reviewCount: 0,
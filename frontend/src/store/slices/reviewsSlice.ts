@@ -1,12 +1,21 @@
 import { createAsyncThunk, createSlice } from "@reduxjs/toolkit";
 import { reviewsApi } from "@/api/insideoutApi";
-import type { CreateReviewPayload, Review, TutorReplyPayload } from "@/api/types";
+import type { CreateReviewPayload, RatingHistogram, Review, TutorReplyPayload } from "@/api/types";
 import { createRequestState, setFailed, setPending, setSucceeded, type RequestState } from "@/store/slices/requestState";
 
 export const fetchCourseReviews = createAsyncThunk("reviews/fetchByCourse", async (courseId: number) =>
   reviewsApi.listByCourse(courseId),
 );
 
+export const fetchMoreCourseReviews = createAsyncThunk(
+  "reviews/fetchMoreByCourse",
+  async ({ courseId, cursor }: { courseId: number; cursor: string }) => reviewsApi.listByCourse(courseId, { cursor }),
+);
+
+export const fetchMyCourseReview = createAsyncThunk("reviews/fetchMine", async (courseId: number) =>
+  reviewsApi.mine(courseId),
+);
+
 export const createCourseReview = createAsyncThunk(
   "reviews/create",
   async ({ courseId, payload }: { courseId: number; payload: CreateReviewPayload }) =>
@@ -19,10 +28,20 @@ export const replyToReview = createAsyncThunk(
     reviewsApi.reply(courseId, reviewId, payload),
 );
 
+interface CourseReviewsPage {
+  nextCursor: string | null;
+  total: number | null;
+  histogram: RatingHistogram;
+}
+
 interface ReviewsState {
   byCourseId: Record<number, Review[]>;
+  pageByCourseId: Record<number, CourseReviewsPage>;
+  /** The current user's own review per course; null once looked up and not found. */
+  mineByCourseId: Record<number, Review | null>;
   requests: {
     listByCourseId: Record<number, RequestState>;
+    loadMore: ReturnType<typeof createRequestState>;
     create: ReturnType<typeof createRequestState>;
     reply: ReturnType<typeof createRequestState>;
   };
@@ -30,8 +49,11 @@ interface ReviewsState {
 
 const initialState: ReviewsState = {
   byCourseId: {},
+  pageByCourseId: {},
+  mineByCourseId: {},
   requests: {
     listByCourseId: {},
+    loadMore: createRequestState(),
     create: createRequestState(),
     reply: createRequestState(),
   },
@@ -54,17 +76,50 @@ const reviewsSlice = createSlice({
         setPending(ensureRequest(state.requests.listByCourseId, action.meta.arg));
       })
       .addCase(fetchCourseReviews.fulfilled, (state, action) => {
-        state.byCourseId[action.meta.arg] = action.payload;
+        state.byCourseId[action.meta.arg] = action.payload.data;
+        state.pageByCourseId[action.meta.arg] = {
+          nextCursor: action.payload.pagination.next_cursor ?? null,
+          total: action.payload.pagination.total ?? null,
+          histogram: action.payload.rating_histogram,
+        };
         setSucceeded(ensureRequest(state.requests.listByCourseId, action.meta.arg));
       })
       .addCase(fetchCourseReviews.rejected, (state, action) => {
         setFailed(ensureRequest(state.requests.listByCourseId, action.meta.arg), action.error.message);
       })
+      .addCase(fetchMoreCourseReviews.pending, (state) => setPending(state.requests.loadMore))
+      .addCase(fetchMoreCourseReviews.fulfilled, (state, action) => {
+        const { courseId } = action.meta.arg;
+        const existing = state.byCourseId[courseId] ?? [];
+        const seenIds = new Set(existing.map((review) => review.id));
+        state.byCourseId[courseId] = [
+          ...existing,
+          ...action.payload.data.filter((review) => !seenIds.has(review.id)),
+        ];
+        state.pageByCourseId[courseId] = {
+          nextCursor: action.payload.pagination.next_cursor ?? null,
+          total: action.payload.pagination.total ?? null,
+          histogram: action.payload.rating_histogram,
+        };
+        setSucceeded(state.requests.loadMore);
+      })
+      .addCase(fetchMoreCourseReviews.rejected, (state, action) => setFailed(state.requests.loadMore, action.error.message))
+      .addCase(fetchMyCourseReview.fulfilled, (state, action) => {
+        state.mineByCourseId[action.meta.arg] = action.payload;
+      })
       .addCase(createCourseReview.pending, (state) => setPending(state.requests.create))
       .addCase(createCourseReview.fulfilled, (state, action) => {
+        const { courseId } = action.meta.arg;
         const review = action.payload;
-        const existing = state.byCourseId[review.course_id] ?? [];
-        state.byCourseId[review.course_id] = [review, ...existing];
+        const existing = state.byCourseId[courseId] ?? [];
+        state.byCourseId[courseId] = [review, ...existing];
+        state.mineByCourseId[courseId] = review;
+        const page = state.pageByCourseId[courseId];
+        const star = String(review.rating) as keyof RatingHistogram;
+        if (page && star in page.histogram) {
+          page.histogram[star] += 1;
+          page.total = page.total === null ? null : page.total + 1;
+        }
         setSucceeded(state.requests.create);
       })
       .addCase(createCourseReview.rejected, (state, action) => setFailed(state.requests.create, action.error.message))
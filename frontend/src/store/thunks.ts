@@ -33,7 +33,13 @@ export {
   requestScheduleChange,
 } from "@/store/slices/schedulesSlice";
 
-export { fetchCourseReviews, createCourseReview, replyToReview } from "@/store/slices/reviewsSlice";
+export {
+  fetchCourseReviews,
+  fetchMoreCourseReviews,
+  fetchMyCourseReview,
+  createCourseReview,
+  replyToReview,
+} from "@/store/slices/reviewsSlice";
 
 export {
   fetchNotificationSettings,